@@ -9,11 +9,14 @@ and state evolution logging for debugging and analysis.
 
 from .core import MonitoringContext
 from .decorators import monitor_node, monitor_subgraph_node
+from .metrics import timed, timing_stats
 
 __all__ = [
     "MonitoringContext",
     "monitor_node",
-    "monitor_subgraph_node"
+    "monitor_subgraph_node",
+    "timed",
+    "timing_stats"
 ]
 
 __version__ = "1.0.0"
@@ -16,6 +16,8 @@ from .writer import MonitoringWriter
 from .serializers import serialize_messages, serialize_state
 from .token_counter import extract_token_usage
 from .cost_calculator import calculate_cost, get_model_name_from_response
+from .metrics import timing_stats
+from utils.cache import cache_stats
 
 
 class MonitoringContext:
@@ -371,7 +373,11 @@ class MonitoringContext:
                 "dispatch_timestamp": self.start_time.isoformat() + "Z" if self.start_time else None,
                 "groups": self._parallel_groups
             },
-            "state_evolution": self._state_snapshots
+            "state_evolution": self._state_snapshots,
+            "data_fetch_metrics": {
+                "timings": timing_stats(),
+                "cache": cache_stats()
+            }
         }
 
         # Write to file
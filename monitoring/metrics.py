@@ -0,0 +1,92 @@
+# monitoring/metrics.py
+
+"""
+Lightweight latency histograms for external data fetches.
+
+Records per-endpoint timings (Prometheus-style cumulative buckets) so slow
+data sources can be identified. Timings are process-wide and included in
+the monitoring log by MonitoringContext.finalize().
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any
+
+# Upper bounds in seconds; +Inf is implicit
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class _Histogram:
+    """Cumulative-bucket latency histogram (not thread-safe; guarded by _lock)."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+
+    def observe(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        for i, upper in enumerate(LATENCY_BUCKETS):
+            if seconds <= upper:
+                self.buckets[i] += 1
+
+
+_histograms: Dict[str, _Histogram] = {}
+_lock = threading.Lock()
+
+
+def observe(label: str, seconds: float):
+    """
+    Records one timing observation.
+
+    Args:
+        label: Endpoint/source name (e.g. "fmp_analyst_estimates")
+        seconds: Elapsed wall time in seconds
+    """
+    with _lock:
+        histogram = _histograms.get(label)
+        if histogram is None:
+            histogram = _histograms[label] = _Histogram()
+        histogram.observe(seconds)
+
+
+@contextmanager
+def timed(label: str):
+    """
+    Times the enclosed block (or decorated function) under `label`.
+
+    Example:
+        >>> with timed("fmp_earnings_calendar"):
+        ...     data = fetch()
+        >>> @timed("fred")
+        ... def fetch_fred(): ...
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(label, time.perf_counter() - start)
+
+
+def timing_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Returns a JSON-serializable snapshot of all histograms.
+
+    Returns:
+        dict: {label: {"count", "total_seconds", "avg_seconds", "max_seconds"}}
+    """
+    with _lock:
+        return {
+            label: {
+                "count": h.count,
+                "total_seconds": round(h.total, 4),
+                "avg_seconds": round(h.total / h.count, 4) if h.count else 0.0,
+                "max_seconds": round(h.max, 4),
+            }
+            for label, h in _histograms.items()
+        }
+
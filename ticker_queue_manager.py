@@ -18,7 +18,7 @@ import json
 import os
 import fcntl
 from datetime import datetime
-from typing import Optional, Dict, List, Set
+from typing import Optional, Dict, List, FrozenSet, Tuple
 from pathlib import Path
 
 
@@ -30,6 +30,11 @@ class TickerQueueManager:
     All operations are atomic to prevent data corruption on failures.
     """
 
+    # Process-wide cache of parsed tracking files, shared by all instances:
+    # tracking_file -> ((st_mtime_ns, st_size), analyzed ticker set).
+    # Entries are validated against the file's stat and dropped on writes.
+    _analyzed_cache: Dict[Path, Tuple[Tuple[int, int], FrozenSet[str]]] = {}
+
     def __init__(self, base_dir: str):
         """
         Initialize queue manager with base directory.
@@ -130,11 +135,14 @@ class TickerQueueManager:
             # Step 4: Get set of already-analyzed tickers
             analyzed_tickers = self.get_analyzed_tickers()
 
-            # Step 5: Find first unanalyzed ticker
-            for ticker in all_tickers:
-                if ticker not in analyzed_tickers:
-                    print(f"[INFO] Next ticker from queue: {ticker}")
-                    return ticker
+            # Step 5: Find first unanalyzed ticker (stops at the first match; O(1) set check per ticker)
+            next_ticker = next(
+                (ticker for ticker in all_tickers if ticker not in analyzed_tickers),
+                None
+            )
+            if next_ticker is not None:
+                print(f"[INFO] Next ticker from queue: {next_ticker}")
+                return next_ticker
 
             # All tickers have been analyzed
             print("[INFO] All tickers in queue have been analyzed")
@@ -219,6 +227,7 @@ class TickerQueueManager:
 
             # Atomic rename (replaces old file safely)
             temp_file.replace(self.tracking_file)
+            self._invalidate_analyzed_cache()
 
             print(f"[INFO] Marked ticker as analyzed: {ticker}")
             return True
@@ -231,14 +240,16 @@ class TickerQueueManager:
             # Always release lock
             self._release_lock(lock_fd)
 
-    def get_analyzed_tickers(self) -> Set[str]:
+    def get_analyzed_tickers(self) -> FrozenSet[str]:
         """
         Returns set of all analyzed ticker symbols.
 
-        Reads analyzed_tickers.json and extracts all ticker symbols.
+        Reads analyzed_tickers.json and extracts all ticker symbols. The parsed
+        result is cached per tracking file for the whole process and reused
+        until the file's mtime/size changes or this class writes to it.
 
         Returns:
-            set[str]: Set of ticker symbols (empty set if tracking file doesn't exist)
+            frozenset[str]: Set of ticker symbols (empty set if tracking file doesn't exist)
 
         Example:
             >>> manager = TickerQueueManager("/path/to/JooKkoomi")
@@ -247,21 +258,37 @@ class TickerQueueManager:
             ...     print("AAPL already analyzed")
         """
         # If tracking file doesn't exist, no tickers analyzed yet
-        if not self.tracking_file.exists():
-            return set()
+        try:
+            stat = self.tracking_file.stat()
+        except FileNotFoundError:
+            self._invalidate_analyzed_cache()
+            return frozenset()
+        except OSError as e:
+            print(f"[ERROR] Failed to read tracking file: {e}")
+            return frozenset()
+
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._analyzed_cache.get(self.tracking_file)
+        if cached is not None and cached[0] == stat_key:
+            return cached[1]
 
         try:
             with open(self.tracking_file, 'r', encoding='utf-8') as f:
                 tracking_data = json.load(f)
 
             # Extract ticker symbols from all entries
-            tickers = {entry["ticker"] for entry in tracking_data.get("tickers", [])}
+            tickers = frozenset(entry["ticker"] for entry in tracking_data.get("tickers", []))
+            self._analyzed_cache[self.tracking_file] = (stat_key, tickers)
             return tickers
 
         except Exception as e:
             print(f"[ERROR] Failed to read tracking file: {e}")
             # Return empty set on error (safer to reanalyze than skip)
-            return set()
+            return frozenset()
+
+    def _invalidate_analyzed_cache(self):
+        """Drops the cached analyzed-ticker set for this tracking file."""
+        self._analyzed_cache.pop(self.tracking_file, None)
 
     def get_queue_status(self) -> Dict[str, any]:
         """
@@ -283,8 +310,9 @@ class TickerQueueManager:
             >>> status = manager.get_queue_status()
             >>> print(f"Remaining: {status['remaining']}")
         """
+        queue_file_exists = self.queue_file.exists()
         status = {
-            "queue_file_exists": self.queue_file.exists(),
+            "queue_file_exists": queue_file_exists,
             "tracking_file_exists": self.tracking_file.exists(),
             "total_in_queue": 0,
             "already_analyzed": 0,
@@ -292,35 +320,31 @@ class TickerQueueManager:
             "next_ticker": None
         }
 
-        # Read queue file
-        if self.queue_file.exists():
+        # Get analyzed tickers first so the queue can be scanned in one pass
+        analyzed_tickers = self.get_analyzed_tickers()
+        status["already_analyzed"] = len(analyzed_tickers)
+
+        # Read queue file once: count tickers and find the next one together
+        if queue_file_exists:
             try:
+                total = 0
+                next_ticker = None
                 with open(self.queue_file, 'r', encoding='utf-8') as f:
-                    all_tickers = [line.strip() for line in f if line.strip()]
-                status["total_in_queue"] = len(all_tickers)
+                    for line in f:
+                        ticker = line.strip()
+                        if not ticker:
+                            continue
+                        total += 1
+                        if next_ticker is None and ticker not in analyzed_tickers:
+                            next_ticker = ticker
+                status["total_in_queue"] = total
+                status["next_ticker"] = next_ticker
             except Exception as e:
                 print(f"[ERROR] Failed to read queue file: {e}")
 
-        # Get analyzed count
-        analyzed_tickers = self.get_analyzed_tickers()
-        status["already_analyzed"] = len(analyzed_tickers)
-
         # Calculate remaining
         status["remaining"] = max(0, status["total_in_queue"] - status["already_analyzed"])
 
-        # Get next ticker (without modifying anything)
-        if self.queue_file.exists():
-            try:
-                with open(self.queue_file, 'r', encoding='utf-8') as f:
-                    all_tickers = [line.strip() for line in f if line.strip()]
-
-                for ticker in all_tickers:
-                    if ticker not in analyzed_tickers:
-                        status["next_ticker"] = ticker
-                        break
-            except Exception as e:
-                print(f"[ERROR] Failed to determine next ticker: {e}")
-
         return status
 
     def reset_ticker(self, ticker: str) -> bool:
@@ -379,6 +403,7 @@ class TickerQueueManager:
                 json.dump(tracking_data, f, indent=2, ensure_ascii=False)
 
             temp_file.replace(self.tracking_file)
+            self._invalidate_analyzed_cache()
 
             removed_count = original_count - new_count
             print(f"[INFO] Reset ticker '{ticker}' ({removed_count} entries removed)")
@@ -21,36 +21,69 @@ load_dotenv()
 if "USER_AGENT" not in os.environ:
     os.environ["USER_AGENT"] = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
-# Import all tools from category modules
-from .financial import get_financial_data, get_historical_data
-from .search import tavily_search, google_news_search
-from .sentiment import get_market_sentiment, scrap_reddit
-from .technical import get_ta_data
-from .guidance import get_guidance
-from .macro import get_economic_indicator, get_global_environment, get_policy_environment, get_economic_cycle, get_fomc
-from .trends import get_consumer_trends
+import importlib
+
+# Tool name -> category module. Modules are imported lazily (PEP 562) on first
+# attribute access, so callers that only need one tool don't pay for yfinance,
+# pykrx, pandas_datareader, etc.
+_TOOL_MODULES = {
+    'get_financial_data': 'financial',
+    'get_historical_data': 'financial',
+    'tavily_search': 'search',
+    'google_news_search': 'search',
+    'get_market_sentiment': 'sentiment',
+    'scrap_reddit': 'sentiment',
+    'get_ta_data': 'technical',
+    'get_guidance': 'guidance',
+    'get_economic_indicator': 'macro',
+    'get_global_environment': 'macro',
+    'get_policy_environment': 'macro',
+    'get_economic_cycle': 'macro',
+    'get_fomc': 'macro',
+    'get_consumer_trends': 'trends',
+}
 
 # Tool registry (used by subgraph.py for dynamic dispatch)
 # IMPORTANT: Maintain original order from tools.py line 1231
 # Note: get_guidance added after get_market_sentiment for Part 9 usage
 # Note: get_fomc added after get_economic_cycle for Part 13 usage
 # Note: get_consumer_trends added after get_fomc for Part 13 usage
-tools = [
-    tavily_search,
-    get_financial_data,
-    get_historical_data,
-    get_ta_data,
-    google_news_search,
-    get_market_sentiment,
-    get_guidance,
-    scrap_reddit,
-    get_economic_indicator,
-    get_global_environment,
-    get_policy_environment,
-    get_economic_cycle,
-    get_fomc,
-    get_consumer_trends
-]
+_TOOL_ORDER = (
+    'tavily_search',
+    'get_financial_data',
+    'get_historical_data',
+    'get_ta_data',
+    'google_news_search',
+    'get_market_sentiment',
+    'get_guidance',
+    'scrap_reddit',
+    'get_economic_indicator',
+    'get_global_environment',
+    'get_policy_environment',
+    'get_economic_cycle',
+    'get_fomc',
+    'get_consumer_trends',
+)
+
+
+def __getattr__(name):
+    """Lazily import tools (and the `tools` registry list) on first access."""
+    if name == 'tools':
+        value = [__getattr__(tool_name) for tool_name in _TOOL_ORDER]
+    elif name in _TOOL_MODULES:
+        module = importlib.import_module(f".{_TOOL_MODULES[name]}", __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | {'tools'} | set(_TOOL_MODULES))
+
 
 # Re-export individual tools for backward compatibility
 __all__ = [
@@ -4,10 +4,80 @@
 import os
 from datetime import datetime, timedelta
 from langchain.tools import tool
+import numpy as np
+import pandas as pd
 import yfinance as yf
 from pykrx.stock import get_market_fundamental
 from pykrx import stock as pykrx_stock
 
+# Shared HTTP session for yfinance so get_financial_data / get_historical_data
+# calls within one run reuse the same keep-alive connection to Yahoo.
+_yf_session = None
+
+
+def _get_yf_session():
+    """
+    Returns a process-wide session for yf.Ticker, created on first use.
+
+    Recent yfinance versions only accept curl_cffi sessions; if curl_cffi is
+    not available, returns None so yfinance falls back to its own session.
+    """
+    global _yf_session
+    if _yf_session is None:
+        try:
+            from curl_cffi import requests as curl_requests
+            _yf_session = curl_requests.Session(impersonate="chrome")
+        except ImportError:
+            return None
+    return _yf_session
+
+
+def _round_statement(df, decimals: int):
+    """
+    Rounds a financial statement DataFrame before rendering with to_string().
+
+    Rounding (and casting to nullable integers when decimals == 0) is done
+    vectorized, so to_string() formats short values instead of full floats.
+    Falls back to the float result if the frame can't be cast to Int64.
+    """
+    rounded = df.round(decimals)
+    if decimals == 0:
+        try:
+            return rounded.astype("Int64")
+        except (TypeError, ValueError):
+            return rounded
+    return rounded
+
+
+def _latest_statements(stock, years: int = 3):
+    """
+    Returns (income statement, balance sheet, cash flow) limited to the latest
+    `years` non-empty columns of each.
+
+    The three statements are stacked into one MultiIndex frame so the NaN
+    sweep runs once; the per-statement column mask keeps the previous
+    behaviour of dropping columns that are entirely NaN within that statement.
+    """
+    sheets = {'IS': stock.financials, 'BS': stock.balance_sheet, 'CF': stock.cashflow}
+    # Empty statements would turn the shared date columns into a plain object index
+    available = {key: df for key, df in sheets.items() if not df.empty}
+    if not available:
+        return tuple(pd.DataFrame() for _ in sheets)
+    combined = pd.concat(available)
+
+    # Columns are report dates; keep newest first as yfinance returns them
+    combined = combined.sort_index(axis=1, ascending=False)
+    has_data = combined.notna().groupby(level=0).any()
+
+    statements = []
+    for key in sheets:
+        if key not in has_data.index:
+            statements.append(pd.DataFrame())
+            continue
+        columns = has_data.columns[has_data.loc[key].to_numpy()][:years]
+        statements.append(combined.loc[key, columns])
+    return tuple(statements)
+
 
 @tool
 def get_financial_data(ticker: str) -> str:
@@ -43,36 +113,53 @@ def get_financial_data(ticker: str) -> str:
 
         # 2. Fetch financial statements using yfinance
         yf_ticker = f"{ticker}.KS" if is_korean_stock else ticker
-        stock = yf.Ticker(yf_ticker)
-        
-        info = stock.info
+        stock = yf.Ticker(yf_ticker, session=_get_yf_session())
         
+        # stock.info is a separate (slow) HTTP round-trip; skip it for Korean
+        # stocks when pykrx already supplied the valuation ratios.
+        needs_valuation = 'PER' not in summary_data or 'PBR' not in summary_data
+        info = stock.info if (not is_korean_stock or needs_valuation) else None
+
         # Use yfinance information if it's not a Korean stock or if pykrx failed
-        if 'PER' not in summary_data:
-            summary_data['PER'] = info.get('trailingPE', 'N/A')
-        if 'PBR' not in summary_data:
-            summary_data['PBR'] = info.get('priceToBook', 'N/A')
-            
+        if info is not None:
+            if 'PER' not in summary_data:
+                summary_data['PER'] = info.get('trailingPE', 'N/A')
+            if 'PBR' not in summary_data:
+                summary_data['PBR'] = info.get('priceToBook', 'N/A')
+
         # Fetch financial statements (clean NaN values and slice to the latest 3 years)
-        # axis=1 means columns (year), how='all' deletes only if all values are NaN
-        financials = stock.financials.dropna(axis=1, how='all').iloc[:, :3]
-        balance_sheet = stock.balance_sheet.dropna(axis=1, how='all').iloc[:, :3]
-        cashflow = stock.cashflow.dropna(axis=1, how='all').iloc[:, :3]
+        # Columns that are entirely NaN within a statement are dropped (see _latest_statements)
+        financials, balance_sheet, cashflow = _latest_statements(stock, years=3)
+
+        # Pre-round before to_string(): income statement keeps 2 decimals for
+        # per-share/ratio rows, balance sheet and cash flow are whole amounts.
+        financials = _round_statement(financials, 2)
+        balance_sheet = _round_statement(balance_sheet, 0)
+        cashflow = _round_statement(cashflow, 0)
 
         # 3. Generate Report (Summary)
-        summary = f"--- Financial Data Report ({ticker}) ---\n"
-        summary += f"Company Name: {info.get('shortName', ticker)}\n"
-        summary += f"Sector/Industry: {info.get('sector', 'N/A')} / {info.get('industry', 'N/A')}\n"
-        summary += f"Market Cap: {info.get('marketCap', 'N/A'):,}\n"
-        summary += f"PER: {summary_data.get('PER')}\n"
-        summary += f"PBR: {summary_data.get('PBR')}\n"
+        # Collect parts and join once; the statement tables can be tens of KB each.
+        summary_parts = [f"--- Financial Data Report ({ticker}) ---\n"]
+        if info is not None:
+            summary_parts.extend([
+                f"Company Name: {info.get('shortName', ticker)}\n",
+                f"Sector/Industry: {info.get('sector', 'N/A')} / {info.get('industry', 'N/A')}\n",
+                f"Market Cap: {info.get('marketCap', 'N/A'):,}\n",
+            ])
+        summary_parts.append(f"PER: {summary_data.get('PER')}\n")
+        summary_parts.append(f"PBR: {summary_data.get('PBR')}\n")
         if 'DIV' in summary_data:
-             summary += f"Dividend Yield (KRX): {summary_data['DIV']}\n"
+            summary_parts.append(f"Dividend Yield (KRX): {summary_data['DIV']}\n")
 
-        summary += f"\n[1] Income Statement (Latest 3 Years)\n{financials.to_string()}\n"
-        summary += f"\n[2] Balance Sheet (Latest 3 Years)\n{balance_sheet.to_string()}\n"
-        summary += f"\n[3] Cash Flow Statement (Latest 3 Years)\n{cashflow.to_string()}\n"
+        summary_parts.append("\n[1] Income Statement (Latest 3 Years)\n")
+        summary_parts.append(financials.to_string())
+        summary_parts.append("\n\n[2] Balance Sheet (Latest 3 Years)\n")
+        summary_parts.append(balance_sheet.to_string())
+        summary_parts.append("\n\n[3] Cash Flow Statement (Latest 3 Years)\n")
+        summary_parts.append(cashflow.to_string())
+        summary_parts.append("\n")
 
+        summary = "".join(summary_parts)
         return summary
 
     except Exception as e:
@@ -98,7 +185,7 @@ def get_historical_data(ticker: str) -> str:
             yf_ticker = f"{ticker}.KS"
 
         # 3. Create a stock object using yfinance.
-        stock = yf.Ticker(yf_ticker)
+        stock = yf.Ticker(yf_ticker, session=_get_yf_session())
 
         # 4. Get 1 year (1y) historical data.
         hist = stock.history(period="1y")
@@ -107,21 +194,31 @@ def get_historical_data(ticker: str) -> str:
         if hist.empty:
             return f"Historical data not found ({ticker})"
 
-        # 6. Assemble the summary information to report to the AI.
-        summary = f"--- 1-Year Historical Price Data ({ticker}) ---\n"
-        summary += f"Data Period: {hist.index[0].strftime('%Y-%m-%d')} ~ {hist.index[-1].strftime('%Y-%m-%d')}\n"
-        summary += f"Current Price: {hist['Close'].iloc[-1]:.2f}\n"
-        summary += f"52-Week High: {hist['High'].max():.2f}\n"
-        summary += f"52-Week Low: {hist['Low'].min():.2f}\n"
-        summary += f"Average Volume: {hist['Volume'].mean():.0f}\n"
-        summary += f"Total Trading Days: {len(hist)}\n"
-
-        # 7. Add detailed price data table.
-        summary += f"\n--- Daily Price Data (Full Year) ---\n"
+        # 6. Extract the raw arrays once and reduce on them directly
+        # (avoids per-call pandas Series overhead for the 52-week stats).
+        closes = hist['Close'].to_numpy()
+        highs = hist['High'].to_numpy()
+        lows = hist['Low'].to_numpy()
+        vols = hist['Volume'].to_numpy()
+
+        # 7. Assemble the summary information to report to the AI.
+        summary_parts = [
+            f"--- 1-Year Historical Price Data ({ticker}) ---\n",
+            f"Data Period: {hist.index[0].strftime('%Y-%m-%d')} ~ {hist.index[-1].strftime('%Y-%m-%d')}\n",
+            f"Current Price: {closes[-1]:.2f}\n",
+            f"52-Week High: {np.nanmax(highs):.2f}\n",
+            f"52-Week Low: {np.nanmin(lows):.2f}\n",
+            f"Average Volume: {np.nanmean(vols):.0f}\n",
+            f"Total Trading Days: {closes.shape[0]}\n",
+        ]
+
+        # 8. Add detailed price data table.
+        summary_parts.append("\n--- Daily Price Data (Full Year) ---\n")
         # Display all 1-year data.
-        summary += hist.to_string()
+        summary_parts.append(hist.to_string())
+        summary = "".join(summary_parts)
 
-        # 8. Return the assembled string.
+        # 9. Return the assembled string.
         return summary
 
     except Exception as e:
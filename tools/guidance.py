@@ -5,20 +5,220 @@ Provides tools for fetching earnings reports, analyst estimates, and calendar ev
 from Financial Modeling Prep (FMP) API.
 """
 
+import functools
 import os
 import time
 import requests
+import yfinance as yf
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from langchain.tools import tool
 from dotenv import load_dotenv
+from utils.cache import single_flight, ttl_cache
+from utils.json_utils import loads as json_loads
+from utils.rate_limit import TokenBucket
+from monitoring.metrics import timed
+
+# Optional: httpx with the h2 package lets concurrent FMP requests share one
+# HTTP/2 connection. Falls back to the pooled requests session without it.
+try:
+    import httpx
+    import h2  # noqa: F401 - required by httpx for http2=True
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
 
 load_dotenv()
 # ========== FMP API CONFIGURATION ==========
 FMP_BASE_URL = "https://financialmodelingprep.com/stable"
 FMP_TIMEOUT = 10  # seconds
+FMP_RATE_LIMIT_PER_MINUTE = 300  # FMP per-minute request quota
+FMP_HEALTH_CHECK_CACHE_TTL = 60  # seconds
+FMP_MAX_RETRIES = 3
+FMP_RETRY_BACKOFF = 0.3  # seconds, doubled per retry
+FMP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Read once at import (after load_dotenv) instead of on every fetch
+_FMP_API_KEY = os.getenv('FMP_API_KEY')
+_FMP_API_KEY_VALID = bool(_FMP_API_KEY and _FMP_API_KEY != "your-fmp-api-key-here")
+
+# Response cache TTLs (seconds): reported quarters rarely change, consensus
+# estimates update daily, upcoming dates should correct within the hour
+EARNINGS_REPORT_CACHE_TTL = 6 * 3600
+ANALYST_ESTIMATES_CACHE_TTL = 24 * 3600
+EARNINGS_CALENDAR_CACHE_TTL = 3600
+
+
+def _create_fmp_session() -> requests.Session:
+    """
+    Creates a pooled session for FMP requests.
+
+    All FMP calls hit the same host, so keep-alive connections are reused
+    across calls (and across get_guidance's worker threads). Transient
+    429/5xx responses are retried with backoff by the adapter.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=FMP_MAX_RETRIES,
+        backoff_factor=FMP_RETRY_BACKOFF,
+        status_forcelist=list(FMP_RETRY_STATUSES),
+        raise_on_status=False  # Return the last response so callers can report its status
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
+def _create_fmp_http2_client():
+    """
+    Creates an HTTP/2 httpx client for FMP, or None if httpx/h2 are missing.
+
+    With HTTP/2 the concurrent get_guidance requests are multiplexed over a
+    single TCP+TLS connection instead of opening one connection each.
+    """
+    if not _HTTP2_AVAILABLE:
+        return None
+    transport = httpx.HTTPTransport(http2=True, retries=FMP_MAX_RETRIES)
+    return httpx.Client(transport=transport, timeout=FMP_TIMEOUT)
+
+
+_FMP_SESSION = _create_fmp_session()
+_FMP_HTTP2_CLIENT = _create_fmp_http2_client()
+_FMP_RATE_LIMITER = TokenBucket(rate=FMP_RATE_LIMIT_PER_MINUTE, per=60.0)
+
+
+def _fmp_http2_get(url: str, **kwargs):
+    """
+    GET via the HTTP/2 client with the same status retries as the requests
+    session. httpx errors are re-raised as the matching requests exceptions
+    so callers handle both transports the same way.
+    """
+    for attempt in range(FMP_MAX_RETRIES + 1):
+        try:
+            response = _FMP_HTTP2_CLIENT.get(url, **kwargs)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+
+        if response.status_code not in FMP_RETRY_STATUSES or attempt == FMP_MAX_RETRIES:
+            return response
+        time.sleep(FMP_RETRY_BACKOFF * (2 ** attempt))
+
+
+def _fmp_session_get(url: str, **kwargs):
+    """GET through the shared FMP client, throttled by the FMP token bucket."""
+    _FMP_RATE_LIMITER.acquire()
+    if _FMP_HTTP2_CLIENT is not None:
+        return _fmp_http2_get(url, **kwargs)
+    return _FMP_SESSION.get(url, **kwargs)
+
+
+# ========== OUTPUT TEMPLATES ==========
+# One template per repeated row, rendered with a single .format() call
+_QUARTER_TMPL = (
+    "[{fiscal_period} - {date}]\n"
+    "  EPS: Actual ${actual_eps:.2f} vs Est ${estimated_eps:.2f} (Surprise: {surprise_pct:+.2f}%)\n"
+)
+_QUARTER_REVENUE_TMPL = (
+    "  Revenue: ${revenue_b:.2f}B vs Est ${estimated_revenue_b:.2f}B (Surprise: {revenue_surprise_pct:+.2f}%)\n"
+)
+_ESTIMATE_TMPL = (
+    "[{date}]\n"
+    "  Revenue Est: ${revenue_avg_b:.2f}B (Range: ${revenue_low_b:.2f}B - ${revenue_high_b:.2f}B)\n"
+    "  EPS Est: ${estimated_eps_avg:.2f} (Range: ${estimated_eps_low:.2f} - ${estimated_eps_high:.2f})\n"
+    "  Analysts: {number_of_analysts}\n\n"
+)
+_UPCOMING_TMPL = (
+    "- {date} ({fiscal_period})\n"
+    "  EPS Est: ${eps_estimate:.2f} | Revenue Est: ${revenue_estimate_b:.2f}B\n"
+)
+
 
 # ==================== HELPER FUNCTIONS ====================
 
+def _fmp_get(endpoint: str, params: dict, label: str, ticker: str) -> list | None:
+    """
+    GET an FMP /stable endpoint and return its JSON list payload.
+
+    Handles the status/format checks shared by all FMP fetchers and prints
+    a diagnostic prefixed with `label` on failure.
+
+    Args:
+        endpoint: Endpoint path under FMP_BASE_URL (e.g. 'analyst-estimates')
+        params: Query parameters (including 'apikey')
+        label: Log prefix, e.g. 'FMP Analyst Estimates'
+        ticker: Ticker used in log messages
+
+    Returns:
+        list: Non-empty JSON list from the API, or None on any failure
+    """
+    try:
+        response = _fmp_session_get(f"{FMP_BASE_URL}/{endpoint}", params=params, timeout=FMP_TIMEOUT)
+
+        # Check HTTP status before parsing
+        if response.status_code == 402:
+            print(f"[{label}] Premium subscription required for {ticker}")
+            return None
+        elif response.status_code != 200:
+            print(f"[{label}] HTTP {response.status_code}: {response.text[:200]}")
+            return None
+
+        data = json_loads(response.content)
+    except requests.exceptions.Timeout:
+        print(f"[{label}] Request timeout after {FMP_TIMEOUT}s")
+        return None
+    except requests.exceptions.RequestException as e:
+        print(f"[{label}] Request failed: {type(e).__name__}: {str(e)[:200]}")
+        return None
+    except ValueError:
+        print(f"[{label}] Invalid JSON response for {ticker}")
+        return None
+
+    if not data or not isinstance(data, list):
+        print(f"[{label}] Empty or invalid response for {ticker}")
+        return None
+
+    return data
+
+
+def _normalize_ticker(ticker: str) -> tuple[str, bool]:
+    """
+    Maps a user ticker to the Yahoo/FMP symbol.
+
+    Korean stock codes (all digits) get the '.KS' suffix; other tickers are
+    returned unchanged. Called once per get_guidance so all fetchers (and
+    their cache keys) see the same symbol.
+
+    Returns:
+        tuple: (normalized_ticker: str, is_korean_stock: bool)
+    """
+    if ticker.isdigit():
+        return f"{ticker}.KS", True
+    return ticker, False
+
+
+@functools.lru_cache(maxsize=1)
+def _calendar_window_for_hour(hour_bucket: int) -> tuple[str, str]:
+    """Returns (today, today + 90 days) as 'YYYY-MM-DD' strings; cached per hour bucket."""
+    now = datetime.now()
+    return now.strftime('%Y-%m-%d'), (now + timedelta(days=90)).strftime('%Y-%m-%d')
+
+
+def _calendar_window() -> tuple[str, str]:
+    """
+    Date range for the earnings calendar query.
+
+    The strings are only recomputed when the hour changes, so repeated calls
+    reuse them (and the request parameters stay stable within the hour).
+    """
+    return _calendar_window_for_hour(int(time.time() // 3600))
+
+
+@ttl_cache("fmp_api_health", ttl=FMP_HEALTH_CHECK_CACHE_TTL, persist=False)
+@timed("fmp_api_health")
 def check_fmp_api_health() -> tuple[bool, str]:
     """
     Quick health check for FMP API accessibility.
@@ -26,14 +226,13 @@ def check_fmp_api_health() -> tuple[bool, str]:
     Returns:
         tuple: (is_healthy: bool, message: str)
     """
-    api_key = os.getenv('FMP_API_KEY')
-    if not api_key or api_key == "your-fmp-api-key-here":
+    if not _FMP_API_KEY_VALID:
         return False, "FMP_API_KEY not configured in .env"
 
     # Test with earnings endpoint (known to work in /stable API)
     url = f"{FMP_BASE_URL}/earnings"
     try:
-        response = requests.get(url, params={'symbol': 'AAPL', 'apikey': api_key, 'limit': 1}, timeout=5)
+        response = _fmp_session_get(url, params={'symbol': 'AAPL', 'apikey': _FMP_API_KEY, 'limit': 1}, timeout=5)
         if response.status_code == 403:
             return False, "API key invalid (403 Forbidden)"
         if response.status_code == 402:
@@ -43,7 +242,7 @@ def check_fmp_api_health() -> tuple[bool, str]:
         if response.status_code != 200:
             return False, f"API returned {response.status_code}"
 
-        data = response.json()
+        data = json_loads(response.content)
         if not isinstance(data, list):
             return False, "API returned unexpected format"
 
@@ -56,10 +255,15 @@ def check_fmp_api_health() -> tuple[bool, str]:
         return False, f"Error: {type(e).__name__}"
 
 
+@ttl_cache("yf_earnings_report", ttl=EARNINGS_REPORT_CACHE_TTL)
+@timed("yf_earnings_report")
 def fetch_fmp_earnings_report(ticker: str) -> dict | None:
     """
     Fetch earnings report data using Yahoo Finance (up to 4 most recent quarters with actual data).
 
+    Args:
+        ticker: Normalized symbol from _normalize_ticker (e.g. 'AAPL', '005930.KS')
+
     Returns:
         dict: {
             'quarters': [{'date', 'fiscal_period', 'actual_eps', 'estimated_eps',
@@ -69,13 +273,6 @@ def fetch_fmp_earnings_report(ticker: str) -> dict | None:
         } or None if failed
     """
     try:
-        import yfinance as yf
-        from datetime import datetime
-
-        # Handle Korean stocks
-        if ticker.isdigit():
-            ticker = f"{ticker}.KS"
-
         stock = yf.Ticker(ticker)
         earnings = stock.earnings_dates  # Pandas DataFrame with historical earnings
 
@@ -83,31 +280,32 @@ def fetch_fmp_earnings_report(ticker: str) -> dict | None:
             print(f"[Yahoo Finance] No earnings data for {ticker}")
             return None
 
-        # Get last 4 quarters with actual data
-        quarters = []
-        for index, row in earnings.iterrows():
-            if len(quarters) >= 4:
-                break
-
-            eps_est = row.get('EPS Estimate')
-            reported_eps = row.get('Reported EPS')
-
-            # Skip if either value is None or NaN
-            import math
-            if eps_est is None or reported_eps is None or math.isnan(eps_est) or math.isnan(reported_eps):
-                continue
-
-            surprise_pct = ((reported_eps - eps_est) / eps_est * 100) if eps_est != 0 else 0.0
+        # Get last 4 quarters with actual data (rows where both EPS values are present)
+        eps_columns = ['EPS Estimate', 'Reported EPS']
+        if not set(eps_columns).issubset(earnings.columns):
+            print(f"[Yahoo Finance] No historical earnings data found for {ticker}")
+            return None
 
-            quarters.append({
-                'date': index.strftime('%Y-%m-%d'),
-                'fiscal_period': index.strftime('%Y-%m-%d'),
-                'actual_eps': float(reported_eps),
-                'estimated_eps': float(eps_est),
-                'surprise_pct': surprise_pct,
+        reported = earnings.dropna(subset=eps_columns).head(4)
+        eps_est = reported['EPS Estimate'].astype(float)
+        reported_eps = reported['Reported EPS'].astype(float)
+        surprise_pct = ((reported_eps - eps_est) / eps_est * 100).where(eps_est != 0, 0.0)
+        dates = reported.index.strftime('%Y-%m-%d')
+
+        quarters = [
+            {
+                'date': date,
+                'fiscal_period': date,
+                'actual_eps': actual,
+                'estimated_eps': estimate,
+                'surprise_pct': surprise,
                 'revenue': 0,  # Yahoo Finance doesn't provide revenue in earnings_dates
                 'estimated_revenue': 0
-            })
+            }
+            for date, actual, estimate, surprise in zip(
+                dates, reported_eps.tolist(), eps_est.tolist(), surprise_pct.tolist()
+            )
+        ]
 
         if not quarters:
             print(f"[Yahoo Finance] No historical earnings data found for {ticker}")
@@ -123,10 +321,15 @@ def fetch_fmp_earnings_report(ticker: str) -> dict | None:
         return None
 
 
+@ttl_cache("fmp_analyst_estimates", ttl=ANALYST_ESTIMATES_CACHE_TTL)
+@timed("fmp_analyst_estimates")
 def fetch_fmp_analyst_estimates(ticker: str) -> dict | None:
     """
     Fetch analyst consensus estimates from FMP API (next 4 quarters).
 
+    Args:
+        ticker: Normalized symbol from _normalize_ticker (e.g. 'AAPL', '005930.KS')
+
     Returns:
         dict: {
             'estimates': [{'date', 'estimated_revenue_avg/high/low',
@@ -135,35 +338,13 @@ def fetch_fmp_analyst_estimates(ticker: str) -> dict | None:
         } or None if failed
     """
     try:
-        import os
-        import requests
-
-        api_key = os.getenv('FMP_API_KEY')
-        if not api_key or api_key == "your-fmp-api-key-here":
+        if not _FMP_API_KEY_VALID:
             return None
 
-        if ticker.isdigit():
-            ticker = f"{ticker}.KS"
-
-        url = f"{FMP_BASE_URL}/analyst-estimates"
         # /stable API requires 'period' parameter
-        params = {'symbol': ticker, 'apikey': api_key, 'period': 'annual', 'limit': 4}
-
-        response = requests.get(url, params=params, timeout=FMP_TIMEOUT)
-
-        # Check HTTP status before parsing
-        if response.status_code == 402:
-            print(f"[FMP Analyst Estimates] Premium subscription required for {ticker}")
-            return None
-        elif response.status_code != 200:
-            print(f"[FMP Analyst Estimates] HTTP {response.status_code}: {response.text[:200]}")
-            return None
-
-        response.raise_for_status()
-        data = response.json()
-
-        if not data or not isinstance(data, list):
-            print(f"[FMP Analyst Estimates] Empty or invalid response for {ticker}")
+        params = {'symbol': ticker, 'apikey': _FMP_API_KEY, 'period': 'annual', 'limit': 4}
+        data = _fmp_get('analyst-estimates', params, 'FMP Analyst Estimates', ticker)
+        if data is None:
             return None
 
         estimates = []
@@ -181,21 +362,20 @@ def fetch_fmp_analyst_estimates(ticker: str) -> dict | None:
             })
 
         return {'estimates': estimates, 'ticker': ticker}
-    except requests.exceptions.HTTPError as e:
-        print(f"[FMP Analyst Estimates] HTTP Error: {e.response.status_code}")
-        return None
-    except requests.exceptions.Timeout:
-        print(f"[FMP Analyst Estimates] Request timeout after {FMP_TIMEOUT}s")
-        return None
     except Exception as e:
         print(f"[FMP Analyst Estimates] Error: {type(e).__name__}: {str(e)[:200]}")
         return None
 
 
+@ttl_cache("fmp_earnings_calendar", ttl=EARNINGS_CALENDAR_CACHE_TTL)
+@timed("fmp_earnings_calendar")
 def fetch_fmp_earnings_calendar(ticker: str) -> dict | None:
     """
     Fetch upcoming earnings calendar for specific ticker from FMP API.
 
+    Args:
+        ticker: Normalized symbol from _normalize_ticker (e.g. 'AAPL', '005930.KS')
+
     Returns:
         dict: {
             'upcoming': [{'date', 'eps_estimate', 'revenue_estimate', 'fiscal_period'}],
@@ -203,38 +383,14 @@ def fetch_fmp_earnings_calendar(ticker: str) -> dict | None:
         } or None if failed
     """
     try:
-        import os
-        import requests
-        from datetime import datetime, timedelta
-
-        api_key = os.getenv('FMP_API_KEY')
-        if not api_key or api_key == "your-fmp-api-key-here":
+        if not _FMP_API_KEY_VALID:
             return None
 
-        if ticker.isdigit():
-            ticker = f"{ticker}.KS"
-
-        today = datetime.now().strftime('%Y-%m-%d')
-        future = (datetime.now() + timedelta(days=90)).strftime('%Y-%m-%d')
-
-        url = f"{FMP_BASE_URL}/earnings-calendar"
-        params = {'symbol': ticker, 'apikey': api_key, 'from': today, 'to': future}
-
-        response = requests.get(url, params=params, timeout=FMP_TIMEOUT)
+        today, future = _calendar_window()
 
-        # Check HTTP status before parsing
-        if response.status_code == 402:
-            print(f"[FMP Earnings Calendar] Premium subscription required for {ticker}")
-            return None
-        elif response.status_code != 200:
-            print(f"[FMP Earnings Calendar] HTTP {response.status_code}: {response.text[:200]}")
-            return None
-
-        response.raise_for_status()
-        data = response.json()
-
-        if not data or not isinstance(data, list):
-            print(f"[FMP Earnings Calendar] Empty or invalid response for {ticker}")
+        params = {'symbol': ticker, 'apikey': _FMP_API_KEY, 'from': today, 'to': future}
+        data = _fmp_get('earnings-calendar', params, 'FMP Earnings Calendar', ticker)
+        if data is None:
             return None
 
         upcoming = []
@@ -261,12 +417,6 @@ def fetch_fmp_earnings_calendar(ticker: str) -> dict | None:
             return None
 
         return {'upcoming': upcoming[:3], 'ticker': ticker}  # Max 3 dates
-    except requests.exceptions.HTTPError as e:
-        print(f"[FMP Earnings Calendar] HTTP Error: {e.response.status_code}")
-        return None
-    except requests.exceptions.Timeout:
-        print(f"[FMP Earnings Calendar] Request timeout after {FMP_TIMEOUT}s")
-        return None
     except Exception as e:
         print(f"[FMP Earnings Calendar] Error: {type(e).__name__}: {str(e)[:200]}")
         return None
@@ -274,138 +424,153 @@ def fetch_fmp_earnings_calendar(ticker: str) -> dict | None:
 
 # ==================== MAIN TOOL ====================
 
-@tool
-def get_guidance(ticker: str) -> str:
+@single_flight()
+def _build_guidance_report(ticker: str) -> str:
     """
-    Company Guidance and Earnings Analysis: Collect data from 3 sources via Yahoo Finance and FMP API.
-    1) Earnings Reports & Surprises (Yahoo Finance - recent 4 quarters)
-    2) Analyst Estimates (FMP - analyst consensus, next 4 quarters)
-    3) Earnings Calendar (FMP - earnings announcement schedule, next 90 days)
-
-    Args:
-        ticker (str): Stock ticker (e.g., 'AAPL', '005930')
-                     Yahoo Finance supports global stocks
-                     FMP API is optimized for US stocks
+    Builds the get_guidance report for a ticker already cleaned by get_guidance.
 
-    Returns:
-        str: Summary of earnings and guidance analysis from 3 sources (formatted by section)
+    Concurrent calls for the same ticker (e.g. repeated agent steps) share
+    one in-flight build instead of each hitting the three sources. The
+    dedup key is the ticker exactly as the build uses it.
     """
     # === 1. Initialize ===
-    is_korean_stock = ticker.isdigit()
+    symbol, is_korean_stock = _normalize_ticker(ticker)
 
-    summary = f"--- COMPANY GUIDANCE & EARNINGS ANALYSIS ({ticker}) ---\n"
-    summary += f"Stock Type: {'Korean (KS)' if is_korean_stock else 'US'}\n"
-    summary += f"Data Collection Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    # Collect output pieces and join once at return
+    summary_parts = [f"--- COMPANY GUIDANCE & EARNINGS ANALYSIS ({ticker}) ---\n"]
+    summary_parts.append(f"Stock Type: {'Korean (KS)' if is_korean_stock else 'US'}\n")
+    summary_parts.append(f"Data Collection Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
 
     failed_sources = []
 
     # API Key validation (common for all 4 sources)
-    fmp_api_key = os.getenv('FMP_API_KEY')
-
-    if not fmp_api_key or fmp_api_key == "your-fmp-api-key-here":
-        summary += "=== FMP API KEY MISSING ===\n"
-        summary += "[!] FMP API key not configured.\n"
-        summary += "    Please add FMP_API_KEY to .env file.\n"
-        summary += "    Register at https://financialmodelingprep.com/developer/docs\n\n"
-        summary += "Note: This tool is optimized for US stocks; "
-        summary += "Korean stocks may not be supported.\n"
-        return summary
+    if not _FMP_API_KEY_VALID:
+        summary_parts.append("=== FMP API KEY MISSING ===\n")
+        summary_parts.append("[!] FMP API key not configured.\n")
+        summary_parts.append("    Please add FMP_API_KEY to .env file.\n")
+        summary_parts.append("    Register at https://financialmodelingprep.com/developer/docs\n\n")
+        summary_parts.append("Note: This tool is optimized for US stocks; ")
+        summary_parts.append("Korean stocks may not be supported.\n")
+        return "".join(summary_parts)
+
+    # The three sources are independent I/O-bound calls: fetch them concurrently
+    # and consume the results in section order below.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        earnings_future = executor.submit(fetch_fmp_earnings_report, symbol)
+        analyst_future = executor.submit(fetch_fmp_analyst_estimates, symbol)
+        calendar_future = executor.submit(fetch_fmp_earnings_calendar, symbol)
 
     # === 2. SOURCE 1: Earnings Reports & Surprises ===
-    summary += "=== 1. EARNINGS REPORTS & SURPRISES (Yahoo Finance) ===\n"
+    summary_parts.append("=== 1. EARNINGS REPORTS & SURPRISES (Yahoo Finance) ===\n")
 
     try:
-        earnings_data = fetch_fmp_earnings_report(ticker)
+        earnings_data = earnings_future.result()
 
         if earnings_data and earnings_data.get('quarters'):
-            summary += f"Stock: {earnings_data['ticker']}\n"
-            summary += f"Last Updated: {earnings_data.get('last_update', 'N/A')}\n\n"
+            summary_parts.append(f"Stock: {earnings_data['ticker']}\n")
+            summary_parts.append(f"Last Updated: {earnings_data.get('last_update', 'N/A')}\n\n")
 
             for quarter in earnings_data['quarters'][:4]:
-                summary += f"[{quarter['fiscal_period']} - {quarter['date']}]\n"
-                summary += f"  EPS: Actual ${quarter['actual_eps']:.2f} vs Est ${quarter['estimated_eps']:.2f} "
-                summary += f"(Surprise: {quarter['surprise_pct']:+.2f}%)\n"
+                summary_parts.append(_QUARTER_TMPL.format(**quarter))
 
                 if quarter['revenue'] > 0 and quarter['estimated_revenue'] > 0:
                     rev_surprise = ((quarter['revenue'] - quarter['estimated_revenue']) / quarter['estimated_revenue']) * 100
-                    summary += f"  Revenue: ${quarter['revenue']/1e9:.2f}B vs Est ${quarter['estimated_revenue']/1e9:.2f}B "
-                    summary += f"(Surprise: {rev_surprise:+.2f}%)\n"
-                summary += "\n"
+                    summary_parts.append(_QUARTER_REVENUE_TMPL.format(
+                        revenue_b=quarter['revenue'] / 1e9,
+                        estimated_revenue_b=quarter['estimated_revenue'] / 1e9,
+                        revenue_surprise_pct=rev_surprise
+                    ))
+                summary_parts.append("\n")
         else:
-            summary += f"[!] {ticker} No earnings data (May not be supported by Yahoo Finance)\n\n"
+            summary_parts.append(f"[!] {ticker} No earnings data (May not be supported by Yahoo Finance)\n\n")
             failed_sources.append("Yahoo Finance Earnings")
 
     except Exception as e:
-        summary += f"[!] Yahoo Finance Earnings collection failed: {str(e)[:100]}\n\n"
+        summary_parts.append(f"[!] Yahoo Finance Earnings collection failed: {str(e)[:100]}\n\n")
         failed_sources.append("Yahoo Finance Earnings")
 
-    time.sleep(0.5)  # Rate limiting
-
     # === 3. SOURCE 2: Analyst Estimates ===
-    summary += "=== 2. ANALYST ESTIMATES (FMP) ===\n"
+    summary_parts.append("=== 2. ANALYST ESTIMATES (FMP) ===\n")
 
     try:
-        analyst_data = fetch_fmp_analyst_estimates(ticker)
+        analyst_data = analyst_future.result()
 
         if analyst_data and analyst_data.get('estimates'):
-            summary += f"Stock: {analyst_data['ticker']}\n"
-            summary += "Consensus Forward Estimates:\n\n"
+            summary_parts.append(f"Stock: {analyst_data['ticker']}\n")
+            summary_parts.append("Consensus Forward Estimates:\n\n")
 
             for estimate in analyst_data['estimates'][:4]:
-                summary += f"[{estimate['date']}]\n"
-                summary += f"  Revenue Est: ${estimate['estimated_revenue_avg']/1e9:.2f}B "
-                summary += f"(Range: ${estimate['estimated_revenue_low']/1e9:.2f}B - ${estimate['estimated_revenue_high']/1e9:.2f}B)\n"
-                summary += f"  EPS Est: ${estimate['estimated_eps_avg']:.2f} "
-                summary += f"(Range: ${estimate['estimated_eps_low']:.2f} - ${estimate['estimated_eps_high']:.2f})\n"
-                summary += f"  Analysts: {estimate['number_of_analysts']}\n\n"
+                summary_parts.append(_ESTIMATE_TMPL.format(
+                    revenue_avg_b=estimate['estimated_revenue_avg'] / 1e9,
+                    revenue_low_b=estimate['estimated_revenue_low'] / 1e9,
+                    revenue_high_b=estimate['estimated_revenue_high'] / 1e9,
+                    **estimate
+                ))
         else:
-            summary += f"[!] {ticker} No analyst forecasts\n\n"
+            summary_parts.append(f"[!] {ticker} No analyst forecasts\n\n")
             failed_sources.append("FMP Analyst Estimates")
 
     except Exception as e:
-        summary += f"[!] FMP Analyst Estimates collection failed: {str(e)[:100]}\n\n"
+        summary_parts.append(f"[!] FMP Analyst Estimates collection failed: {str(e)[:100]}\n\n")
         failed_sources.append("FMP Analyst Estimates")
 
-    time.sleep(0.5)
-
     # === 4. SOURCE 3: Earnings Calendar ===
-    summary += "=== 3. EARNINGS CALENDAR - UPCOMING (FMP) ===\n"
+    summary_parts.append("=== 3. EARNINGS CALENDAR - UPCOMING (FMP) ===\n")
 
     try:
-        earnings_cal = fetch_fmp_earnings_calendar(ticker)
+        earnings_cal = calendar_future.result()
 
         if earnings_cal and earnings_cal.get('upcoming'):
-            summary += f"Stock: {earnings_cal['ticker']}\n"
-            summary += f"Upcoming Earnings ({len(earnings_cal['upcoming'])} dates):\n\n"
+            summary_parts.append(f"Stock: {earnings_cal['ticker']}\n")
+            summary_parts.append(f"Upcoming Earnings ({len(earnings_cal['upcoming'])} dates):\n\n")
 
             for upcoming in earnings_cal['upcoming'][:3]:
-                summary += f"- {upcoming['date']} ({upcoming['fiscal_period']})\n"
-                summary += f"  EPS Est: ${upcoming['eps_estimate']:.2f} | "
-                summary += f"Revenue Est: ${upcoming['revenue_estimate']/1e9:.2f}B\n"
-            summary += "\n"
+                summary_parts.append(_UPCOMING_TMPL.format(
+                    revenue_estimate_b=upcoming['revenue_estimate'] / 1e9,
+                    **upcoming
+                ))
+            summary_parts.append("\n")
         else:
-            summary += f"[!] {ticker} No scheduled earnings announcements\n\n"
+            summary_parts.append(f"[!] {ticker} No scheduled earnings announcements\n\n")
             failed_sources.append("FMP Earnings Calendar")
 
     except Exception as e:
-        summary += f"[!] FMP Earnings Calendar collection failed: {str(e)[:100]}\n\n"
+        summary_parts.append(f"[!] FMP Earnings Calendar collection failed: {str(e)[:100]}\n\n")
         failed_sources.append("FMP Earnings Calendar")
 
-    time.sleep(0.5)
-
     # === 6. Summary ===
-    summary += "=== SUMMARY ===\n"
+    summary_parts.append("=== SUMMARY ===\n")
 
     sources_collected = 3 - len(set(failed_sources))
-    summary += f"Data Sources Collected: {sources_collected}/3"
+    summary_parts.append(f"Data Sources Collected: {sources_collected}/3")
     if sources_collected == 3:
-        summary += " ✓"
-    summary += "\n"
+        summary_parts.append(" ✓")
+    summary_parts.append("\n")
 
     if failed_sources:
-        summary += f"Failed Sources: {', '.join(set(failed_sources))}\n"
+        summary_parts.append(f"Failed Sources: {', '.join(set(failed_sources))}\n")
+
+    summary_parts.append("\nNote: Yahoo Finance provides earnings data; FMP provides analyst estimates and earnings calendar.\n")
+    summary_parts.append("Note: Based on the latest publicly available values at the time of data collection.\n")
+
+    return "".join(summary_parts)
 
-    summary += "\nNote: Yahoo Finance provides earnings data; FMP provides analyst estimates and earnings calendar.\n"
-    summary += "Note: Based on the latest publicly available values at the time of data collection.\n"
 
-    return summary
+@tool
+def get_guidance(ticker: str) -> str:
+    """
+    Company Guidance and Earnings Analysis: Collect data from 3 sources via Yahoo Finance and FMP API.
+    1) Earnings Reports & Surprises (Yahoo Finance - recent 4 quarters)
+    2) Analyst Estimates (FMP - analyst consensus, next 4 quarters)
+    3) Earnings Calendar (FMP - earnings announcement schedule, next 90 days)
+
+    Args:
+        ticker (str): Stock ticker (e.g., 'AAPL', '005930')
+                     Yahoo Finance supports global stocks
+                     FMP API is optimized for US stocks
+
+    Returns:
+        str: Summary of earnings and guidance analysis from 3 sources (formatted by section)
+    """
+    # Clean the input once so the dedup key, symbol and report header agree
+    return _build_guidance_report(ticker.strip().upper())
@@ -1,18 +1,62 @@
 # tools/macro.py
 # Macroeconomic data collection tools for Part 12 analysis
 
-import time
 import asyncio
+import atexit
+import functools
 import os
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from itertools import groupby
 from langchain.tools import tool
 from bs4 import BeautifulSoup
+from lxml import etree as lxml_etree
+from lxml import html as lxml_html
+import numpy as np
 import re
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 from playwright.async_api import async_playwright
 import warnings
 from dotenv import load_dotenv
+from utils.cache import ttl_cache
+from utils.json_utils import loads as json_loads
+from utils.rate_limit import HostRateLimiter, TokenBucket
+from .macro_config import (
+    ECONOMIC_CYCLE_PLAN,
+    FRED_SERIES_CYCLES,
+    GLOBAL_FRED_INDICATORS,
+    GLOBAL_FRED_INDICATORS_BY_CATEGORY,
+    KOREA_COUNTRY_PAIRS,
+    KOREA_PRIORITY_COUNTRIES,
+    MARKET_INDICES,
+    POLICY_ENVIRONMENT_CONFIG,
+    SECTOR_ETF_BY_SYMBOL,
+    US_COUNTRY_PAIRS,
+    US_PRIORITY_COUNTRIES,
+    WORLD_BANK_INDICATORS,
+    EcosIndicator,
+    get_ordered,
+)
+
+# Optional: selectolax (C HTML parser) for fast parsing in scrape_ism_pmi and
+# the multpl.com scrapers. Falls back to BeautifulSoup without it.
+try:
+    from selectolax.lexbor import LexborHTMLParser as _FastHTMLParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as _FastHTMLParser  # selectolax < 1.0
+    except ImportError:
+        _FastHTMLParser = None
+
+# Optional: CNN Fear & Greed Index client (fetch_fear_greed_index returns None without it)
+try:
+    import fear_and_greed
+except ImportError:
+    fear_and_greed = None
 
 load_dotenv()
 
@@ -23,12 +67,285 @@ if "USER_AGENT" not in os.environ:
 
 warnings.simplefilter(action='ignore', category=FutureWarning)
 
+# ==================== FETCH CONFIGURATION ====================
+
+# Response cache TTLs (seconds), scaled to how often each source updates
+MARKET_DATA_CACHE_TTL = 15 * 60          # yfinance indices/ETFs (intraday)
+FRED_CACHE_TTL = 6 * 3600                # FRED daily (and unlisted) series
+FRED_CACHE_TTLS = {                      # FRED by release frequency (FRED_SERIES_CYCLES)
+    'D': FRED_CACHE_TTL,
+    'W': 24 * 3600,
+    'M': 24 * 3600,
+    'Q': 7 * 24 * 3600,
+}
+WORLD_BANK_CACHE_TTL = 7 * 24 * 3600     # World Bank (annual data)
+ISM_PMI_CACHE_TTL = 6 * 3600             # ISM PMI (monthly release)
+FEAR_GREED_CACHE_TTL = 15 * 60           # CNN Fear & Greed (intraday)
+MULTPL_CACHE_TTL = 6 * 3600              # multpl.com valuations (daily at most)
+FOMC_CACHE_TTL = 6 * 3600                # FOMC statement/minutes (per meeting)
+ECOS_CACHE_TTLS = {                      # ECOS by data cycle
+    'D': 6 * 3600,
+    'M': 24 * 3600,
+    'Q': 7 * 24 * 3600,
+    'A': 7 * 24 * 3600,
+    'Y': 7 * 24 * 3600,
+}
+
+
+# Concurrency limits for fan-out fetches
+ECOS_MAX_CONCURRENT_REQUESTS = 4         # ECOS item codes per statistic
+
+
+def _ecos_cache_ttl(cycle):
+    return ECOS_CACHE_TTLS.get(cycle, 24 * 3600)
+
+
+def _fred_cache_ttl(series_id):
+    return FRED_CACHE_TTLS.get(FRED_SERIES_CYCLES.get(series_id), FRED_CACHE_TTL)
+
+
 # ==================== HELPER FUNCTIONS ====================
 
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+HTTP_TIMEOUT = 10
+
+HTTP_MAX_RETRIES = 3
+HTTP_RETRY_BACKOFF = 0.3  # seconds, doubled per retry
+HTTP_RETRY_STATUSES = (502, 503, 504)
+
+WORLD_BANK_API_URL = "https://api.worldbank.org/v2"
+
+# Requests per second allowed to any one host through the shared session,
+# with per-provider overrides; connections per host are capped by the pool
+HTTP_HOST_RATE_LIMIT_PER_SECOND = 5
+HTTP_HOST_RATE_LIMITS = {
+    'fred.stlouisfed.org': 10,           # FRED graph CSV (pandas_datareader)
+    'api.worldbank.org': 5,
+    'www.federalreserve.gov': 5,
+    'www.investing.com': 2,              # ISM PMI page (bot-sensitive)
+}
+HTTP_MAX_CONNECTIONS_PER_HOST = 8
+_HOST_RATE_LIMITER = HostRateLimiter(
+    rate=HTTP_HOST_RATE_LIMIT_PER_SECOND,
+    per=1.0,
+    host_rates=HTTP_HOST_RATE_LIMITS
+)
+
+
+class _HostRateLimitedSession(requests.Session):
+    """Session that waits on the per-host token bucket before each request."""
+
+    def request(self, method, url, *args, **kwargs):
+        _HOST_RATE_LIMITER.acquire(urlparse(url).netloc)
+        return super().request(method, url, *args, **kwargs)
+
+
+def _create_http_session():
+    """
+    Creates the pooled session used for plain (non-browser) page fetches.
+
+    Keep-alive connections are reused across calls (e.g. the FOMC calendar,
+    statement and minutes pages all hit federalreserve.gov), and transient
+    gateway errors are retried with backoff by the adapter. Requests are
+    rate limited per host, so different sources never wait on each other.
+    """
+    session = _HostRateLimitedSession()
+    retry = Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=HTTP_RETRY_BACKOFF,
+        status_forcelist=list(HTTP_RETRY_STATUSES),
+        raise_on_status=False  # Return the last response; callers raise_for_status()
+    )
+    # pool_block: threads beyond the per-host cap wait for a free connection
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=HTTP_MAX_CONNECTIONS_PER_HOST,
+        pool_block=True,
+        max_retries=retry
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_HTTP_SESSION = _create_http_session()
+
+
+def _fetch_html(url):
+    """
+    Fetches a page with a plain HTTP GET (no browser).
+
+    Args:
+        url (str): URL to fetch
+
+    Returns:
+        str: Response body, or None on HTTP/network errors
+    """
+    headers = {"User-Agent": os.getenv("USER_AGENT", DEFAULT_USER_AGENT)}
+    try:
+        response = _HTTP_SESSION.get(url, headers=headers, timeout=HTTP_TIMEOUT)
+        response.raise_for_status()
+        return response.text
+    except requests.exceptions.RequestException as e:
+        print(f"[HTTP] {url} fetch failed: {e}")
+        return None
+
+
+# Shared headless browser (launched once, reused by every scrape).
+# Each page load gets its own BrowserContext, which is cheap to create and
+# isolates cookies/storage; the Chromium process itself is only closed at exit.
+_playwright = None
+_browser = None
+_browser_lock = None
+
+# Playwright objects are bound to the event loop they were created on, so all
+# scrapes run on one long-lived loop owned by a daemon thread. Callers from
+# any thread submit coroutines to it via _run_async().
+_scrape_loop = None
+_scrape_loop_lock = threading.Lock()
+
+# Seconds to wait for the browser to close at interpreter exit
+BROWSER_SHUTDOWN_TIMEOUT = 10
+
+# Scrapers only parse page text, so skip everything that doesn't affect it
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+BLOCKED_DOMAINS = (
+    "doubleclick.net",
+    "googletagmanager.com",
+    "google-analytics.com",
+    "googlesyndication.com",
+    "adservice.google.com",
+)
+
+
+async def _get_browser():
+    """
+    Returns the shared Chromium browser, launching it on first use.
+
+    Returns:
+        Browser: Connected Playwright browser instance
+    """
+    global _playwright, _browser, _browser_lock
+
+    if _browser_lock is None:
+        _browser_lock = asyncio.Lock()
+
+    async with _browser_lock:
+        if _browser is None or not _browser.is_connected():
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(headless=True)
+        return _browser
+
+
+async def _close_browser():
+    """Closes the shared browser and stops the Playwright driver."""
+    global _playwright, _browser
+
+    if _browser is not None:
+        try:
+            await _browser.close()
+        except Exception:
+            pass
+        _browser = None
+    if _playwright is not None:
+        try:
+            await _playwright.stop()
+        except Exception:
+            pass
+        _playwright = None
+
+
+def _get_scrape_loop():
+    """
+    Returns the shared scrape event loop, starting its thread on first use.
+
+    Returns:
+        asyncio.AbstractEventLoop: Running loop owned by a daemon thread
+    """
+    global _scrape_loop
+
+    with _scrape_loop_lock:
+        if _scrape_loop is None or _scrape_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="macro-scrape-loop",
+                daemon=True
+            ).start()
+            _scrape_loop = loop
+        return _scrape_loop
+
+
+def _run_async(coro):
+    """
+    Runs a coroutine on the shared scrape loop and waits for its result.
+
+    Safe to call from any thread, including ones already running their own
+    event loop (e.g. the agent framework's), so no per-call loop is created
+    and nest_asyncio is not needed; concurrent callers' coroutines interleave
+    on the same loop. Coroutines already on the scrape loop must await
+    directly instead, since blocking here would deadlock the loop.
+
+    Args:
+        coro: Coroutine to run (e.g. async_load_with_retry(url))
+
+    Returns:
+        The coroutine's result
+
+    Raises:
+        RuntimeError: If called from the scrape loop's own thread
+    """
+    loop = _get_scrape_loop()
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if running_loop is loop:
+        coro.close()
+        raise RuntimeError("_run_async called from the scrape loop; await the coroutine instead")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+@atexit.register
+def _shutdown_browser():
+    """Closes the shared browser and stops the scrape loop at interpreter exit."""
+    global _scrape_loop
+
+    with _scrape_loop_lock:
+        loop = _scrape_loop
+        _scrape_loop = None
+    if loop is None or loop.is_closed():
+        return
+
+    try:
+        asyncio.run_coroutine_threadsafe(_close_browser(), loop).result(
+            timeout=BROWSER_SHUTDOWN_TIMEOUT
+        )
+    except Exception:
+        pass
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+
+
+async def _block_unneeded_requests(route):
+    """Playwright route handler: aborts assets and ad/analytics requests."""
+    request = route.request
+    if (request.resource_type in BLOCKED_RESOURCE_TYPES
+            or any(domain in request.url for domain in BLOCKED_DOMAINS)):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
 async def async_load_with_retry(url, selectors_to_remove=None):
     """
     Async helper function to load web pages using Playwright with custom User-Agent.
 
+    Uses the shared browser from _get_browser(); only a new context is
+    created (and closed) per call. Images, fonts, media, stylesheets and
+    ad/analytics hosts are blocked since only the page text is parsed.
+
     Args:
         url (str): URL to fetch
         selectors_to_remove (list, optional): CSS selectors to remove from page (unused)
@@ -36,108 +353,162 @@ async def async_load_with_retry(url, selectors_to_remove=None):
     Returns:
         str: HTML content of the page, or None if loading failed
     """
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        
-        # [Load USER_AGENT from .env, use default if not found]
-        user_agent = os.getenv(
-            "USER_AGENT", 
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        )
-        context = await browser.new_context(
-            user_agent=user_agent
-        )
-        
-        page = await context.new_page()
-        try:
-            await page.goto(url, timeout=30000, wait_until="domcontentloaded")
-            content = await page.content()
-            return content
-        except Exception as e:
-            print(f"Error loading {url}: {e}")
-            return None
-        finally:
-            await browser.close()
+    browser = await _get_browser()
 
+    # [Load USER_AGENT from .env, use default if not found]
+    user_agent = os.getenv("USER_AGENT", DEFAULT_USER_AGENT)
+    context = await browser.new_context(
+        user_agent=user_agent
+    )
 
-def scrape_ism_pmi(retry_count=0, max_retries=2):
-    """
-    Scrape ISM Manufacturing PMI from investing.com using Regex on text content.
-    """
     try:
-        url = "https://www.investing.com/economic-calendar/ism-manufacturing-pmi-173"
-        selectors_to_remove = ['header', 'footer', 'nav', '.advertisement', '.banner']
+        await context.route("**/*", _block_unneeded_requests)
+        page = await context.new_page()
+        await page.goto(url, timeout=30000, wait_until="domcontentloaded")
+        content = await page.content()
+        return content
+    except Exception as e:
+        print(f"Error loading {url}: {e}")
+        return None
+    finally:
+        await context.close()
 
-        print(f"Attempting to fetch URL (Try {retry_count+1})...")
 
-        # Async load
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        html_content = loop.run_until_complete(
-            async_load_with_retry(url, selectors_to_remove)
-        )
-        loop.close()
+# ISM release text patterns (compiled once at import)
+# Date example: "Nov 03, 2025"; value example: "Actual 46.5" or "Actual: 46.5"
+_ISM_DATE_RE = re.compile(r'([A-Z][a-z]{2}\s\d{1,2},\s\d{4})')
+_ISM_FIELDS_RE = re.compile(r'(Actual|Forecast|Previous)[:\s]+(\d+\.?\d*)', re.IGNORECASE)
 
-        if not html_content:
-            print("Failed to retrieve HTML content.")
-            return None
 
-        soup = BeautifulSoup(html_content, 'html.parser')
+def _extract_release_text(html_content):
+    """
+    Returns the visible text of the '#releaseInfo' block (or the whole page
+    if it is missing), whitespace-normalized.
 
-        # Find releaseInfo
+    Uses selectolax when installed, BeautifulSoup otherwise.
+    """
+    if _FastHTMLParser is not None:
+        tree = _FastHTMLParser(html_content)
+        release_info = tree.css_first('#releaseInfo')
+        if release_info is None:
+            print("Warning: 'releaseInfo' div not found. Using full body text.")
+            release_info = tree.body or tree.root
+        text = release_info.text(separator=' ', strip=True) if release_info else ''
+    else:
+        soup = BeautifulSoup(html_content, 'lxml')
         release_info = soup.find('div', id='releaseInfo')
         if not release_info:
             print("Warning: 'releaseInfo' div not found. Using full body text.")
             release_info = soup
+        text = release_info.get_text(separator=' ', strip=True)
 
-        # --- [Core fix] Get full text and parse with Regex ---
-        # Don't rely on HTML tag structure, get all visible text on screen
-        # Example: "Latest Release Nov 03, 2025 Actual 46.5 Forecast 47.6 Previous 47.2"
-        full_text = release_info.get_text(separator=' ', strip=True)
-        
-        # For debugging: print parsing target text (for failure analysis)
-        # print(f"[Debug] Raw Text: {full_text[:100]}...") 
+    # Collapse runs of whitespace so both parsers yield identical text
+    return ' '.join(text.split())
 
-        result = {}
 
-        # 1. Extract date (pattern: "MMM DD, YYYY")
-        # Example: Nov 03, 2025 or Oct 01, 2025
-        date_match = re.search(r'([A-Z][a-z]{2}\s\d{1,2},\s\d{4})', full_text)
-        if date_match:
-            result['date'] = date_match.group(1)
-
-        # 2. Value extraction function (flexible pattern matching)
-        def extract_value(label, text):
-            # Find number (including decimal) after Label
-            # Example: "Actual 46.5" or "Actual: 46.5"
-            pattern = rf"{label}[:\s]+(\d+\.?\d*)"
-            match = re.search(pattern, text, re.IGNORECASE)
-            return match.group(1) if match else None
-
-        result['actual'] = extract_value('Actual', full_text)
-        result['forecast'] = extract_value('Forecast', full_text)
-        result['previous'] = extract_value('Previous', full_text)
-
-        # Validate results
-        required_keys = ['actual', 'forecast', 'previous']
-        if all(result.get(k) for k in required_keys):
-            return result
-        else:
-            print(f"Incomplete data parsing. Found: {result}")
-            # Print source text being parsed for debugging
-            print(f"-> Source Text looked like: '{full_text}'")
-            return None
+async def _scrape_ism_pmi_once(attempt):
+    """
+    Single ISM PMI scrape attempt (see async_scrape_ism_pmi).
 
-    except Exception as e:
-        print(f"General error: {e}")
-        if retry_count < max_retries:
-            delay = 2.0 * (2 ** retry_count)
+    Returns:
+        dict: {date, actual, forecast, previous} or None if parsing failed
+
+    Raises:
+        Exception: Propagated so the caller can retry
+    """
+    url = "https://www.investing.com/economic-calendar/ism-manufacturing-pmi-173"
+    selectors_to_remove = ['header', 'footer', 'nav', '.advertisement', '.banner']
+
+    print(f"Attempting to fetch URL (Try {attempt+1})...")
+
+    # The release block is server-rendered, so try a plain GET first and
+    # only fall back to the browser if we got a bot-challenge page instead
+    html_content = await asyncio.to_thread(_fetch_html, url)
+    if not html_content or 'releaseInfo' not in html_content:
+        html_content = await async_load_with_retry(url, selectors_to_remove)
+
+    if not html_content:
+        print("Failed to retrieve HTML content.")
+        return None
+
+    # --- [Core fix] Get full text and parse with Regex ---
+    # Don't rely on HTML tag structure, get all visible text on screen
+    # Example: "Latest Release Nov 03, 2025 Actual 46.5 Forecast 47.6 Previous 47.2"
+    # (parsed on a worker thread so other coroutines on the loop keep running)
+    full_text = await asyncio.to_thread(_extract_release_text, html_content)
+
+    # For debugging: print parsing target text (for failure analysis)
+    # print(f"[Debug] Raw Text: {full_text[:100]}...")
+
+    result = {}
+
+    # 1. Extract date (pattern: "MMM DD, YYYY")
+    # Example: Nov 03, 2025 or Oct 01, 2025
+    date_match = _ISM_DATE_RE.search(full_text)
+    if date_match:
+        result['date'] = date_match.group(1)
+
+    # 2. Extract Actual/Forecast/Previous in a single pass
+    # (first occurrence of each label wins, in any order)
+    for match in _ISM_FIELDS_RE.finditer(full_text):
+        result.setdefault(match.group(1).lower(), match.group(2))
+
+    # Validate results
+    required_keys = ['actual', 'forecast', 'previous']
+    if all(result.get(k) for k in required_keys):
+        return result
+    else:
+        print(f"Incomplete data parsing. Found: {result}")
+        # Print source text being parsed for debugging
+        print(f"-> Source Text looked like: '{full_text}'")
+        return None
+
+
+async def async_scrape_ism_pmi(max_retries=2):
+    """
+    Scrape ISM Manufacturing PMI from investing.com using Regex on text content.
+
+    Uses a plain HTTP GET when possible; Playwright is only the fallback.
+    Errors are retried with exponential backoff (2s, 4s, ...) using
+    asyncio.sleep, so other scrapes on the shared loop keep running.
+
+    Args:
+        max_retries (int): Retries after the first failed attempt
+
+    Returns:
+        dict: {date, actual, forecast, previous} or None if failed
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return await _scrape_ism_pmi_once(attempt)
+        except Exception as e:
+            print(f"General error: {e}")
+            if attempt >= max_retries:
+                return None
+            delay = 2.0 * (2 ** attempt)
             print(f"Retrying in {delay}s...")
-            time.sleep(delay)
-            return scrape_ism_pmi(retry_count + 1, max_retries)
-        else:
-            return None
+            await asyncio.sleep(delay)
+
+
+@ttl_cache("ism_pmi", ttl=ISM_PMI_CACHE_TTL, key_func=lambda max_retries=2: "latest")
+def scrape_ism_pmi(max_retries=2):
+    """
+    Scrape ISM Manufacturing PMI (synchronous wrapper around async_scrape_ism_pmi).
 
+    Cached on disk, so the global, indicator and cycle tools (and later runs)
+    share one scrape; pass force_refresh=True to bypass the cache.
+
+    Returns:
+        dict: {date, actual, forecast, previous} or None if failed
+    """
+    return _run_async(async_scrape_ism_pmi(max_retries))
+
+
+@ttl_cache(
+    "fred",
+    ttl=lambda series_id, series_name: _fred_cache_ttl(series_id),
+    key_func=lambda series_id, series_name: series_id
+)
 def fetch_fred_data(series_id, series_name):
     """
     Fetch a single FRED economic indicator and return latest 2 data points.
@@ -157,15 +528,17 @@ def fetch_fred_data(series_id, series_name):
         start_date = end_date - timedelta(days=730)  # ~2 years
 
         # Fetch data from FRED
-        data = web.DataReader(series_id, 'fred', start_date, end_date)
+        # (pooled session: concurrent series reuse keep-alive TLS connections)
+        data = web.DataReader(series_id, 'fred', start_date, end_date, session=_HTTP_SESSION)
 
         # Check if we have sufficient data
         if data.empty or len(data) < 2:
             return None
 
-        # Get latest 2 values
-        latest = float(data.iloc[-1].iloc[0])
-        previous = float(data.iloc[-2].iloc[0])
+        # Get latest 2 values (index the underlying array directly)
+        values = data.to_numpy()
+        latest = float(values[-1, 0])
+        previous = float(values[-2, 0])
 
         # Calculate percentage change
         change_pct = ((latest - previous) / previous) * 100 if previous != 0 else 0.0
@@ -185,46 +558,59 @@ def fetch_fred_data(series_id, series_name):
         return None
 
 
-def format_fred_value(value, indicator_name):
-    """
-    Format FRED value based on indicator type.
-
-    Args:
-        value (float): Numeric value to format
-        indicator_name (str): Indicator name to determine formatting
-
-    Returns:
-        str: Formatted value string
-    """
+@functools.lru_cache(maxsize=None)
+def _fred_formatter(indicator_name):
+    """Resolves (once per indicator name) the formatter used by format_fred_value."""
     # GDP and monetary aggregates in billions
     if any(keyword in indicator_name for keyword in ['GDP', 'M2', 'Profit', 'Corporate']):
-        return f"{value:,.1f}B"
+        return "{:,.1f}B".format
 
     # Rates, percentages, spreads
     elif any(keyword in indicator_name for keyword in ['Interest Rate', 'Rate', 'Unemployment Rate', 'Unemployment', 'Expectation', 'Capacity Utilization', 'Spread']):
-        return f"{value:.2f}%"
+        return "{:.2f}%".format
 
     # Price indexes
     elif any(keyword in indicator_name for keyword in ['CPI', 'PPI', 'PCE', 'HICP', 'Index']):
-        return f"{value:.2f}"
+        return "{:.2f}".format
 
     # Employment counts (in thousands)
     elif any(keyword in indicator_name for keyword in ['Payrolls', 'Employment', 'Non-farm']):
-        return f"{value:,.0f}K"
+        return "{:,.0f}K".format
 
     # Sales, orders (in millions/billions)
     elif any(keyword in indicator_name for keyword in ['Sales', 'Orders', 'Housing Starts']):
-        return f"{value:,.0f}M"
+        return "{:,.0f}M".format
 
     # VIX volatility
     elif 'VIX' in indicator_name or 'Volatility' in indicator_name:
-        return f"{value:.2f}"
+        return "{:.2f}".format
 
     # Default: 2 decimal places with commas
     else:
-        return f"{value:,.2f}"
+        return "{:,.2f}".format
+
+
+def format_fred_value(value, indicator_name):
+    """
+    Format FRED value based on indicator type.
+
+    The keyword lookup is cached per indicator name (_fred_formatter).
+
+    Args:
+        value (float): Numeric value to format
+        indicator_name (str): Indicator name to determine formatting
+
+    Returns:
+        str: Formatted value string
+    """
+    return _fred_formatter(indicator_name)(value)
 
 
+@ttl_cache(
+    "world_bank",
+    ttl=WORLD_BANK_CACHE_TTL,
+    key_func=lambda indicator_symbol, indicator_name, countries: f"{indicator_symbol}:{','.join(countries)}"
+)
 def fetch_world_bank_data(indicator_symbol, indicator_name, countries):
     """
     Fetch World Bank indicator for multiple countries.
@@ -238,35 +624,41 @@ def fetch_world_bank_data(indicator_symbol, indicator_name, countries):
         dict: {country_code: {value, year}, ...} or None if all failed
     """
     try:
-        from pandas_datareader import wb
-
         end_date = datetime.now()
         start_date = end_date - timedelta(days=1095)  # ~3 years
 
-        result = {}
-
-        for country in countries:
-            try:
-                # Fetch data for this country
-                data = wb.download(
-                    indicator=indicator_symbol,
-                    country=country,
-                    start=start_date,
-                    end=end_date
-                )
+        # One World Bank API call covers every country; decoded with orjson
+        # (if installed) instead of going through pandas_datareader
+        url = f"{WORLD_BANK_API_URL}/countries/{';'.join(countries)}/indicators/{indicator_symbol}"
+        params = {
+            'date': f"{start_date.year}:{end_date.year}",
+            'per_page': 25000,
+            'format': 'json'
+        }
+        response = _HTTP_SESSION.get(url, params=params, timeout=HTTP_TIMEOUT)
+        response.raise_for_status()
+        payload = json_loads(response.content)
 
-                if not data.empty:
-                    # Get most recent value
-                    latest = data.iloc[-1].iloc[0]
-                    year = data.index[-1][1]  # MultiIndex: (country, year)
+        # payload = [metadata, rows]; an error response has no rows
+        if len(payload) < 2 or not payload[1]:
+            return None
 
-                    result[country] = {
-                        'value': float(latest),
-                        'year': year
-                    }
+        # Rows are grouped by country, newest year first; keep each country's
+        # first non-null row, i.e. its most recent reported year (years not
+        # yet reported come back with a null value)
+        latest_rows = {}
+        for row in payload[1]:
+            if row['value'] is not None:
+                latest_rows.setdefault(row['country']['id'], row)
 
-            except Exception:
-                continue  # Skip this country if it fails
+        result = {}
+        for country in countries:
+            row = latest_rows.get(country)
+            if row:
+                result[country] = {
+                    'value': float(row['value']),
+                    'year': row['date']
+                }
 
         return result if result else None
 
@@ -274,6 +666,7 @@ def fetch_world_bank_data(indicator_symbol, indicator_name, countries):
         return None
 
 
+@ttl_cache("yf_market_index", ttl=MARKET_DATA_CACHE_TTL, key_func=lambda symbol, name: symbol)
 def fetch_market_index(symbol, name):
     """
     Fetch latest market index data from yfinance.
@@ -296,8 +689,9 @@ def fetch_market_index(symbol, name):
         if hist.empty or len(hist) < 2:
             return None
 
-        latest = float(hist['Close'].iloc[-1])
-        previous = float(hist['Close'].iloc[-2])
+        closes = hist['Close'].to_numpy()
+        latest = float(closes[-1])
+        previous = float(closes[-2])
         change_pct = ((latest - previous) / previous) * 100
         date = hist.index[-1].strftime('%Y-%m-%d')
 
@@ -311,6 +705,19 @@ def fetch_market_index(symbol, name):
         return None
 
 
+@functools.lru_cache(maxsize=None)
+def _wb_formatter(indicator_name):
+    """Resolves (once per indicator name) the formatter used by format_wb_value."""
+    # Population in billions
+    if any(keyword in indicator_name for keyword in ['Population']):
+        return lambda value: f"{value/1e9:.2f}B"
+    # Rates and percentages
+    elif any(keyword in indicator_name for keyword in ['Growth Rate', 'Inflation', 'Unemployment Rate', 'Interest Rate', 'Balance']):
+        return "{:.2f}%".format
+    else:
+        return "{:,.2f}".format
+
+
 def format_wb_value(value, indicator_name):
     """
     Format World Bank value based on indicator type.
@@ -322,63 +729,91 @@ def format_wb_value(value, indicator_name):
     Returns:
         str: Formatted value string
     """
-    # Population in billions
-    if any(keyword in indicator_name for keyword in ['Population']):
-        return f"{value/1e9:.2f}B"
-    # Rates and percentages
-    elif any(keyword in indicator_name for keyword in ['Growth Rate', 'Inflation', 'Unemployment Rate', 'Interest Rate', 'Balance']):
-        return f"{value:.2f}%"
-    else:
-        return f"{value:,.2f}"
+    return _wb_formatter(indicator_name)(value)
+
+
+# Offsets from the end of a daily close series for 1D/5D/1M changes
+SECTOR_CHANGE_OFFSETS = (2, 6, 21)
 
 
-def fetch_sector_etf_data(symbol, name):
+def _sector_etf_performance(close):
     """
-    Fetch sector ETF performance data from yfinance.
+    Computes latest close and 1D/5D/1M changes from a daily Close series.
 
     Args:
-        symbol (str): ETF symbol (e.g., 'XLK')
-        name (str): Display name (e.g., 'Technology')
+        close (pd.Series): Daily closes, oldest first, NaNs removed
 
     Returns:
-        dict: {close, change_1d_pct, change_5d_pct, change_1m_pct, date} or None if failed
+        dict: {close, change_1d_pct, change_5d_pct, change_1m_pct, date} or None if <2 points
     """
-    try:
-        import yfinance as yf
+    if len(close) < 2:
+        return None
 
-        ticker = yf.Ticker(symbol)
-        hist = ticker.history(period='1mo')
+    closes = close.to_numpy()
+    latest_close = float(closes[-1])
+    latest_date = close.index[-1].strftime('%Y-%m-%d')
+
+    # 1D/5D/1M changes vs. the close 1, 5 and 20 trading days back
+    # (0.0 when the series is too short)
+    change_1d_pct, change_5d_pct, change_1m_pct = (
+        ((latest_close - closes[-offset]) / closes[-offset]) * 100 if len(closes) >= offset else 0.0
+        for offset in SECTOR_CHANGE_OFFSETS
+    )
+
+    return {
+        'close': latest_close,
+        'change_1d_pct': float(change_1d_pct),
+        'change_5d_pct': float(change_5d_pct),
+        'change_1m_pct': float(change_1m_pct),
+        'date': latest_date
+    }
 
-        if hist.empty or len(hist) < 2:
-            return None
 
-        latest_close = float(hist['Close'].iloc[-1])
-        latest_date = hist.index[-1].strftime('%Y-%m-%d')
+@ttl_cache("yf_sector_etf", ttl=MARKET_DATA_CACHE_TTL, key_func=lambda symbols: ",".join(symbols))
+def fetch_sector_etfs_batch(symbols):
+    """
+    Fetch performance data for several sector ETFs with one yfinance download.
 
-        # Calculate multi-period changes
-        change_1d_pct = 0.0
-        change_5d_pct = 0.0
-        change_1m_pct = 0.0
+    Args:
+        symbols (tuple): ETF symbols (e.g., ('XLK', 'XLE'))
 
-        if len(hist) >= 2:
-            prev_1d = float(hist['Close'].iloc[-2])
-            change_1d_pct = ((latest_close - prev_1d) / prev_1d) * 100
+    Returns:
+        dict: {symbol: {close, change_1d_pct, change_5d_pct, change_1m_pct, date} or None}
+              or None if every symbol failed
+    """
+    try:
+        import yfinance as yf
 
-        if len(hist) >= 6:
-            prev_5d = float(hist['Close'].iloc[-6])
-            change_5d_pct = ((latest_close - prev_5d) / prev_5d) * 100
+        data = yf.download(
+            tickers=list(symbols),
+            period='1mo',
+            group_by='ticker',
+            auto_adjust=True,  # Same prices as Ticker.history()
+            threads=True,
+            progress=False
+        )
 
-        if len(hist) >= 21:
-            prev_1m = float(hist['Close'].iloc[-21])
-            change_1m_pct = ((latest_close - prev_1m) / prev_1m) * 100
+        if data is None or data.empty:
+            return None
 
-        return {
-            'close': latest_close,
-            'change_1d_pct': change_1d_pct,
-            'change_5d_pct': change_5d_pct,
-            'change_1m_pct': change_1m_pct,
-            'date': latest_date
-        }
+        results = {}
+        for symbol in symbols:
+            try:
+                # Columns are (ticker, field) when grouped by ticker
+                if data.columns.nlevels > 1:
+                    if symbol not in data.columns.get_level_values(0):
+                        results[symbol] = None
+                        continue
+                    close = data[symbol]['Close']
+                else:
+                    close = data['Close']
+
+                # Rows are the union of all tickers' dates; drop this one's gaps
+                results[symbol] = _sector_etf_performance(close.dropna())
+            except Exception:
+                results[symbol] = None
+
+        return results if any(results.values()) else None
 
     except Exception:
         return None
@@ -389,7 +824,7 @@ def format_sector_etf_output(etf_data, name, symbol):
     Format sector ETF data into compact single-line output.
 
     Args:
-        etf_data (dict): Data from fetch_sector_etf_data()
+        etf_data (dict): One symbol's entry from fetch_sector_etfs_batch()
         name (str): Display name
         symbol (str): ETF symbol
 
@@ -409,6 +844,79 @@ def format_sector_etf_output(etf_data, name, symbol):
 
 # ==================== ECONOMIC CYCLE HELPER FUNCTIONS ====================
 
+# Keep-alive session shared by all ECOS requests; at most
+# ECOS_MAX_CONNECTIONS requests are in flight at once (others wait for a
+# free connection), however many tools fetch ECOS series concurrently
+ECOS_MAX_CONNECTIONS = 4
+_ECOS_SESSION = requests.Session()
+_ECOS_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=ECOS_MAX_CONNECTIONS,
+    pool_block=True
+))
+
+# Throttle for all ECOS requests (replaces fixed sleeps between calls);
+# stricter than the default HTTP_HOST_RATE_LIMIT_PER_SECOND to respect the quota
+ECOS_RATE_LIMIT_PER_SECOND = 2
+_ECOS_RATE_LIMITER = TokenBucket(rate=ECOS_RATE_LIMIT_PER_SECOND, per=1.0)
+
+
+_MONTH_ABBR = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+               'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+
+def _format_ecos_month(time_str):
+    """Formats an ECOS monthly TIME ('YYYYMM') as 'Mon YYYY' (e.g. 'Nov 2025')."""
+    return f"{_MONTH_ABBR[int(time_str[4:6]) - 1]} {time_str[:4]}"
+
+
+def _format_ecos_day(time_str):
+    """Formats an ECOS daily TIME ('YYYYMMDD') as 'YYYY-MM-DD'."""
+    return f"{time_str[:4]}-{time_str[4:6]}-{time_str[6:8]}"
+
+
+# ECOS TIME display formatter by cycle (daily is the fallback)
+_ECOS_TIME_FORMATTERS = {
+    'Q': str,
+    'M': _format_ecos_month,
+    'A': str,
+    'D': _format_ecos_day,
+}
+
+
+def _ecos_search(url):
+    """
+    Fetches and decodes one ECOS StatisticSearch response.
+
+    The GET goes through the shared ECOS session, throttled by the ECOS token
+    bucket, and the raw body is decoded with json_loads (orjson if installed)
+    without building an intermediate str.
+
+    Args:
+        url (str): StatisticSearch API URL
+
+    Returns:
+        dict: The 'StatisticSearch' object (with 'row' and 'list_total_count'),
+              or None if ECOS returned no rows (e.g. an INFO/ERROR RESULT)
+
+    Raises:
+        requests.RequestException: On HTTP errors (callers return None)
+    """
+    _ECOS_RATE_LIMITER.acquire()
+    response = _ECOS_SESSION.get(url, timeout=HTTP_TIMEOUT)
+    response.raise_for_status()
+
+    search = json_loads(response.content).get('StatisticSearch')
+    if not search or 'row' not in search:
+        return None
+    return search
+
+
+@ttl_cache(
+    "ecos",
+    ttl=lambda stat_code, item_code, cycle, name: _ecos_cache_ttl(cycle),
+    key_func=lambda stat_code, item_code, cycle, name: f"{stat_code}/{cycle}/{item_code}"
+)
 def fetch_ecos_data(stat_code, item_code, cycle, name):
     """
     Fetch Korean Bank (ECOS) economic indicator.
@@ -451,16 +959,11 @@ def fetch_ecos_data(stat_code, item_code, cycle, name):
         # ECOS API endpoint
         url = f"https://ecos.bok.or.kr/api/StatisticSearch/{api_key}/json/kr/1/100/{stat_code}/{cycle}/{start_str}/{end_str}/{item_code}"
 
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-
-        data = response.json()
-
-        # Parse response
-        if 'StatisticSearch' not in data or 'row' not in data['StatisticSearch']:
+        search = _ecos_search(url)
+        if search is None:
             return None
 
-        rows = data['StatisticSearch']['row']
+        rows = search['row']
 
         if len(rows) < 2:
             return None
@@ -476,11 +979,11 @@ def fetch_ecos_data(stat_code, item_code, cycle, name):
         if cycle == 'Q':
             date_display = date_str  # Already in YYYYQ# format
         elif cycle == 'M':
-            date_display = datetime.strptime(date_str, '%Y%m').strftime('%b %Y')
+            date_display = _format_ecos_month(date_str)
         elif cycle == 'A' or cycle == 'Y':  # Annual/Yearly
             date_display = date_str
         else:
-            date_display = datetime.strptime(date_str, '%Y%m%d').strftime('%Y-%m-%d')
+            date_display = _format_ecos_day(date_str)
 
         return {
             'value': latest,
@@ -493,6 +996,13 @@ def fetch_ecos_data(stat_code, item_code, cycle, name):
         return None
 
 
+@ttl_cache(
+    "ecos_aggregated",
+    ttl=lambda stat_code, item_code_base, item_codes, cycle, name: _ecos_cache_ttl(cycle),
+    key_func=lambda stat_code, item_code_base, item_codes, cycle, name: (
+        f"{stat_code}/{cycle}/{item_code_base}/{'+'.join(item_codes)}"
+    )
+)
 def fetch_ecos_data_aggregated(stat_code, item_code_base, item_codes, cycle, name):
     """
     Fetch and aggregate multiple ECOS item codes (e.g., Corporate Debt categories).
@@ -503,7 +1013,7 @@ def fetch_ecos_data_aggregated(stat_code, item_code_base, item_codes, cycle, nam
     Args:
         stat_code (str): ECOS statistic code (e.g., '131Y017')
         item_code_base (str): Base item code (e.g., 'BDDF1') for ITEM_CODE1
-        item_codes (list): List of sub-item codes (e.g., ['A', 'B']) for ITEM_CODE2
+        item_codes (tuple): Sub-item codes (e.g., ('A', 'B')) for ITEM_CODE2
         cycle (str): Data cycle ('D', 'M', 'Q', 'Y')
         name (str): Display name for error messages
 
@@ -536,36 +1046,32 @@ def fetch_ecos_data_aggregated(stat_code, item_code_base, item_codes, cycle, nam
             start_str = start_date.strftime('%Y%m%d')
             end_str = end_date.strftime('%Y%m%d')
 
-        # Fetch data for each item code and aggregate
-        aggregated_latest = 0.0
-        aggregated_previous = 0.0
+        # (previous, latest) per sub-item, summed column-wise after the loop
+        last_two = np.empty((len(item_codes), 2), dtype=np.float64)
         latest_date = None
 
-        for item_code in item_codes:
+        for i, item_code in enumerate(item_codes):
             # Two-level item code structure: base item code + sub-item code
             url = f"https://ecos.bok.or.kr/api/StatisticSearch/{api_key}/json/kr/1/100/{stat_code}/{cycle}/{start_str}/{end_str}/{item_code_base}/{item_code}"
 
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            # Parse response
-            if 'StatisticSearch' not in data or 'row' not in data['StatisticSearch']:
+            search = _ecos_search(url)
+            if search is None:
                 return None  # Fail if any category is missing
 
-            rows = data['StatisticSearch']['row']
+            rows = search['row']
 
             if len(rows) < 2:
                 return None  # Need at least 2 data points
 
-            # Aggregate values
-            aggregated_latest += float(rows[-1]['DATA_VALUE'])
-            aggregated_previous += float(rows[-2]['DATA_VALUE'])
+            last_two[i] = (float(rows[-2]['DATA_VALUE']), float(rows[-1]['DATA_VALUE']))
 
             # Use date from first successful fetch
             if latest_date is None:
                 latest_date = rows[-1]['TIME']
 
+        # Aggregate values
+        aggregated_previous, aggregated_latest = last_two.sum(axis=0).tolist()
+
         # Calculate change percentage
         change_pct = ((aggregated_latest - aggregated_previous) / aggregated_previous) * 100 if aggregated_previous != 0 else 0.0
 
@@ -573,11 +1079,11 @@ def fetch_ecos_data_aggregated(stat_code, item_code_base, item_codes, cycle, nam
         if cycle == 'Q':
             date_display = latest_date
         elif cycle == 'M':
-            date_display = datetime.strptime(latest_date, '%Y%m').strftime('%b %Y')
+            date_display = _format_ecos_month(latest_date)
         elif cycle == 'Y':
             date_display = latest_date
         else:
-            date_display = datetime.strptime(latest_date, '%Y%m%d').strftime('%Y-%m-%d')
+            date_display = _format_ecos_day(latest_date)
 
         return {
             'value': aggregated_latest,
@@ -590,6 +1096,103 @@ def fetch_ecos_data_aggregated(stat_code, item_code_base, item_codes, cycle, nam
         return None
 
 
+def _ecos_timeseries_period(cycle):
+    """
+    Returns the ECOS (start, end) TIME strings for a time series lookback.
+
+    Args:
+        cycle (str): Data cycle ('D', 'M', 'Q', 'A')
+
+    Returns:
+        tuple: (start_str, end_str), e.g. ('202311', '202511') for 'M'
+    """
+    # Calculate date range (optimized by cycle frequency)
+    date_ranges = {'D': 180, 'M': 730, 'Q': 730, 'A': 3650}  # Updated A to 10 years
+    lookback_days = date_ranges.get(cycle, 730)
+
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=lookback_days)
+
+    # Format dates based on cycle
+    if cycle == 'Q':
+        return start_date.strftime('%Y') + 'Q1', end_date.strftime('%Y') + 'Q4'
+    elif cycle == 'M':
+        return start_date.strftime('%Y%m'), end_date.strftime('%Y%m')
+    elif cycle == 'A':
+        return start_date.strftime('%Y'), end_date.strftime('%Y')
+    else:  # Daily
+        return start_date.strftime('%Y%m%d'), end_date.strftime('%Y%m%d')
+
+
+def _ecos_timeseries_from_rows(rows, cycle, data_points=None):
+    """
+    Builds the time series summary returned by fetch_ecos_data_timeseries.
+
+    Args:
+        rows (list): ECOS StatisticSearch rows of one item, oldest first
+        cycle (str): Data cycle ('D', 'M', 'Q', 'A')
+        data_points (int, optional): Number of data points to keep
+                                     Defaults: 24 (M/Q), 10 (A)
+
+    Returns:
+        dict: See fetch_ecos_data_timeseries, or None if fewer than 2 rows
+    """
+    # Default data points based on cycle
+    if data_points is None:
+        data_points = 10 if cycle == 'A' else 24
+
+    if len(rows) < 2:
+        return None
+
+    # Slice to get last N points (or all if fewer)
+    if len(rows) > data_points:
+        rows = rows[-data_points:]
+
+    # Extract time series (single contiguous float64 buffer)
+    values = np.fromiter(
+        (float(row['DATA_VALUE']) for row in rows),
+        dtype=np.float64,
+        count=len(rows)
+    )
+
+    # Format dates (formatter picked once per series, not per row;
+    # Q and A periods are already display-ready, e.g. '2025Q3', '2024')
+    format_time = _ECOS_TIME_FORMATTERS.get(cycle, _format_ecos_day)
+    dates = [format_time(row['TIME']) for row in rows]
+
+    # Calculate statistics
+    latest = float(values[-1])
+    prev = float(values[-2]) if values.shape[0] >= 2 else latest
+    change_pct = ((latest - prev) / prev) * 100 if prev != 0 else 0.0
+
+    # Trend analysis (compare latest to average with 2% threshold)
+    avg = float(values.mean())
+    if latest > avg * 1.02:
+        trend = 'rising'
+    elif latest < avg * 0.98:
+        trend = 'falling'
+    else:
+        trend = 'stable'
+
+    return {
+        'values': values.tolist(),
+        'dates': dates,
+        'latest': latest,
+        'trend': trend,
+        'change_pct': change_pct,
+        'min': float(values.min()),
+        'max': float(values.max()),
+        'avg': avg
+    }
+
+
+@ttl_cache(
+    "ecos_timeseries",
+    ttl=lambda stat_code, item_code, cycle, name, data_points=None: _ecos_cache_ttl(cycle),
+    key_func=lambda stat_code, item_code, cycle, name, data_points=None: (
+        f"{stat_code}/{cycle}/{item_code}/{data_points}"
+    )
+)
 def fetch_ecos_data_timeseries(stat_code, item_code, cycle, name, data_points=None):
     """
     Fetch ECOS time series data with configurable point count.
@@ -619,92 +1222,110 @@ def fetch_ecos_data_timeseries(stat_code, item_code, cycle, name, data_points=No
         if not api_key:
             return None
 
-        # Default data points based on cycle
-        if data_points is None:
-            data_points = 10 if cycle == 'A' else 24
+        start_str, end_str = _ecos_timeseries_period(cycle)
 
-        # Calculate date range (optimized by cycle frequency)
-        date_ranges = {'D': 180, 'M': 730, 'Q': 730, 'A': 3650}  # Updated A to 10 years
-        lookback_days = date_ranges.get(cycle, 730)
+        # ECOS API endpoint (fetch up to 100 records)
+        url = f"https://ecos.bok.or.kr/api/StatisticSearch/{api_key}/json/kr/1/100/{stat_code}/{cycle}/{start_str}/{end_str}/{item_code}"
 
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=lookback_days)
+        search = _ecos_search(url)
+        if search is None:
+            return None
 
-        # Format dates based on cycle
-        if cycle == 'Q':
-            start_str = start_date.strftime('%Y') + 'Q1'
-            end_str = end_date.strftime('%Y') + 'Q4'
-        elif cycle == 'M':
-            start_str = start_date.strftime('%Y%m')
-            end_str = end_date.strftime('%Y%m')
-        elif cycle == 'A':
-            start_str = start_date.strftime('%Y')
-            end_str = end_date.strftime('%Y')
-        else:  # Daily
-            start_str = start_date.strftime('%Y%m%d')
-            end_str = end_date.strftime('%Y%m%d')
+        return _ecos_timeseries_from_rows(search['row'], cycle, data_points)
 
-        # ECOS API endpoint (fetch up to 100 records)
-        url = f"https://ecos.bok.or.kr/api/StatisticSearch/{api_key}/json/kr/1/100/{stat_code}/{cycle}/{start_str}/{end_str}/{item_code}"
+    except Exception:
+        return None
 
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
 
-        data = response.json()
+# Row window for batched ECOS requests (one statistic, several item codes)
+ECOS_BATCH_MAX_ROWS = 10000
+
+
+@functools.lru_cache(maxsize=None)
+def _ecos_item_layout(item_codes):
+    """
+    Splits item codes into their levels and finds the levels all items share.
+
+    Cached per item-code tuple (config item codes are tuples, so hashable).
+
+    Args:
+        item_codes (tuple): Item codes, e.g. ('I61BC/I28A', 'I61BC/I28B')
+
+    Returns:
+        tuple: ({item_code: levels}, shared item path),
+               e.g. ({'I61BC/I28A': ('I61BC', 'I28A'), ...}, '/I61BC')
+    """
+    levels_by_code = {code: tuple(code.split('/')) for code in item_codes}
+    shared_levels = os.path.commonprefix(list(levels_by_code.values()))
+    return levels_by_code, ''.join(f"/{level}" for level in shared_levels)
+
+
+@ttl_cache(
+    "ecos_timeseries_batch",
+    ttl=lambda stat_code, item_codes, cycle, data_points=None: _ecos_cache_ttl(cycle),
+    key_func=lambda stat_code, item_codes, cycle, data_points=None: (
+        f"{stat_code}/{cycle}/{'+'.join(item_codes)}/{data_points}"
+    )
+)
+def fetch_ecos_data_timeseries_batch(stat_code, item_codes, cycle, data_points=None):
+    """
+    Fetch ECOS time series for several item codes of one statistic in a single request.
+
+    The request is made for the item-code levels all items share (e.g.
+    'I61BC' for 'I61BC/I28A' and 'I61BC/I28B'), and the returned rows are
+    split per item by their full ITEM_CODE1..4 path. Items with no shared
+    level are not batched (that would download the whole statistic), so
+    None is returned for them without a request.
+
+    Args:
+        stat_code (str): ECOS statistic code (e.g., '901Y027')
+        item_codes (tuple): Item codes within the statistic (e.g., ('AA', 'AM'))
+        cycle (str): Data cycle ('D', 'M', 'Q', 'A')
+        data_points (int, optional): Number of data points per item
 
-        # Parse response
-        if 'StatisticSearch' not in data or 'row' not in data['StatisticSearch']:
+    Returns:
+        dict: {item_code: {...} or None} (same structure as
+              fetch_ecos_data_timeseries), or None if the items share no
+              item-code level, or the batch request failed, was truncated,
+              or returned no usable series
+    """
+    try:
+        api_key = os.getenv('ECOS_API_KEY')
+        if not api_key:
             return None
 
-        rows = data['StatisticSearch']['row']
+        levels_by_code, item_path = _ecos_item_layout(tuple(item_codes))
+        if not item_path:
+            return None
 
-        if len(rows) < 2:
+        start_str, end_str = _ecos_timeseries_period(cycle)
+
+        url = f"https://ecos.bok.or.kr/api/StatisticSearch/{api_key}/json/kr/1/{ECOS_BATCH_MAX_ROWS}/{stat_code}/{cycle}/{start_str}/{end_str}{item_path}"
+
+        search = _ecos_search(url)
+        if search is None:
             return None
 
-        # Slice to get last N points (or all if fewer)
-        if len(rows) > data_points:
-            rows = rows[-data_points:]
+        rows = search['row']
 
-        # Extract time series
-        values = [float(row['DATA_VALUE']) for row in rows]
+        # A truncated window would silently drop the latest rows of some items
+        if int(search.get('list_total_count', len(rows))) > len(rows):
+            return None
 
-        # Format dates
-        dates = []
+        # Split rows per item in one pass, keyed by the row's full item path
+        # (so sub-series under an item's code are not merged into it)
+        rows_by_levels = {levels: [] for levels in levels_by_code.values()}
         for row in rows:
-            date_str = row['TIME']
-            if cycle == 'Q':
-                dates.append(date_str)  # Already in YYYYQ# format
-            elif cycle == 'M':
-                dates.append(datetime.strptime(date_str, '%Y%m').strftime('%b %Y'))
-            elif cycle == 'A':
-                dates.append(date_str)
-            else:  # Daily
-                dates.append(datetime.strptime(date_str, '%Y%m%d').strftime('%Y-%m-%d'))
-
-        # Calculate statistics
-        latest = values[-1]
-        prev = values[-2] if len(values) >= 2 else latest
-        change_pct = ((latest - prev) / prev) * 100 if prev != 0 else 0.0
-
-        # Trend analysis (compare latest to average with 2% threshold)
-        avg = sum(values) / len(values)
-        if latest > avg * 1.02:
-            trend = 'rising'
-        elif latest < avg * 0.98:
-            trend = 'falling'
-        else:
-            trend = 'stable'
-
-        return {
-            'values': values,
-            'dates': dates,
-            'latest': latest,
-            'trend': trend,
-            'change_pct': change_pct,
-            'min': min(values),
-            'max': max(values),
-            'avg': avg
+            key = tuple(filter(None, (row.get(f'ITEM_CODE{i}') for i in range(1, 5))))
+            item_rows = rows_by_levels.get(key)
+            if item_rows is not None:
+                item_rows.append(row)
+
+        results = {
+            code: _ecos_timeseries_from_rows(rows_by_levels[levels], cycle, data_points)
+            for code, levels in levels_by_code.items()
         }
+        return results if any(results.values()) else None
 
     except Exception:
         return None
@@ -716,9 +1337,9 @@ def fetch_ecos_data_multi_item(stat_code, item_codes_config, cycle, name, data_p
 
     Args:
         stat_code (str): ECOS statistic code
-        item_codes_config (list): List of dicts with 'code' and 'name'
-                                  e.g., [{'code': 'AA/99988', 'name': '전산업'},
-                                         {'code': 'AM/99988', 'name': '제조업'}]
+        item_codes_config (tuple): Dicts with 'code' and 'name'
+                                  e.g., ({'code': 'AA/99988', 'name': '전산업'},
+                                         {'code': 'AM/99988', 'name': '제조업'})
         cycle (str): Data cycle ('D', 'M', 'Q', 'A')
         name (str): Base display name
         data_points (int, optional): Number of data points to return
@@ -734,26 +1355,36 @@ def fetch_ecos_data_multi_item(stat_code, item_codes_config, cycle, name, data_p
         results = {}
         failed_items = []
 
-        for item_config in item_codes_config:
-            item_code = item_config['code']
-            item_name = f"{name} - {item_config['name']}"
-
-            # Fetch data for this item code
-            item_data = fetch_ecos_data_timeseries(
-                stat_code,
-                item_code,
-                cycle,
-                item_name,
-                data_points
-            )
-
-            if item_data:
-                results[item_name] = item_data
-            else:
-                failed_items.append(item_name)
+        # One request for all item codes of the statistic, if they share an
+        # item-code level; otherwise every item is fetched on its own below
+        item_codes = tuple(item_config['code'] for item_config in item_codes_config)
+        batch = {}
+        if _ecos_item_layout(item_codes)[1]:
+            batch = fetch_ecos_data_timeseries_batch(stat_code, item_codes, cycle, data_points) or {}
 
-            # Rate limiting between item codes
-            time.sleep(0.2)
+        def fetch_item(item_config):
+            item_name = f"{name} - {item_config['name']}"
+            item_data = batch.get(item_config['code'])
+            if item_data is None:
+                # Not in the batch response: fall back to a single-item request
+                item_data = fetch_ecos_data_timeseries(
+                    stat_code,
+                    item_config['code'],
+                    cycle,
+                    item_name,
+                    data_points
+                )
+            return item_name, item_data
+
+        # Fetch fallback item codes concurrently; the request rate is bounded
+        # by the ECOS token bucket, and repeat series are served from the TTL cache
+        max_workers = max(1, min(ECOS_MAX_CONCURRENT_REQUESTS, len(item_codes_config)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for item_name, item_data in executor.map(fetch_item, item_codes_config):
+                if item_data:
+                    results[item_name] = item_data
+                else:
+                    failed_items.append(item_name)
 
         # Return partial results if at least 50% succeeded
         if len(results) >= len(item_codes_config) // 2:
@@ -765,93 +1396,109 @@ def fetch_ecos_data_multi_item(stat_code, item_codes_config, cycle, name, data_p
         return None
 
 
-def format_ecos_value(value, indicator_name):
-    """
-    Format ECOS value based on indicator type.
+def _format_ecos_gdp(value):
+    # ECOS 902Y016 returns GDP in million dollars
+    if value > 100000:  # Likely in million dollars (e.g., 1,844,800.9)
+        return f"${value:,.1f}M"  # e.g., $1,844,800.9M
+    else:  # Likely in trillions of KRW
+        return f"{value:,.1f}trillion KRW"
 
-    Args:
-        value (float): Numeric value
-        indicator_name (str): Indicator name
 
-    Returns:
-        str: Formatted value string
-    """
+@functools.lru_cache(maxsize=None)
+def _ecos_formatter(indicator_name):
+    """Resolves (once per indicator name) the formatter used by format_ecos_value."""
+    lower_name = indicator_name.lower()
+
     # GDP values
-    if 'GDP' in indicator_name or 'gdp' in indicator_name.lower():
-        # ECOS 902Y016 returns GDP in million dollars
-        if value > 100000:  # Likely in million dollars (e.g., 1,844,800.9)
-            return f"${value:,.1f}M"  # e.g., $1,844,800.9M
-        else:  # Likely in trillions of KRW
-            return f"{value:,.1f}trillion KRW"
+    if 'GDP' in indicator_name or 'gdp' in lower_name:
+        return _format_ecos_gdp
     # Price indexes (CPI/PPI)
     elif 'CPI' in indicator_name or 'PPI' in indicator_name or '물가' in indicator_name:
-        return f"{value:.2f}"
+        return "{:.2f}".format
     # Sentiment/confidence indexes (0-200 scale)
     elif '심리' in indicator_name or 'BSI' in indicator_name or 'CSI' in indicator_name or '경기실사' in indicator_name:
-        return f"{value:.1f}"
+        return "{:.1f}".format
     # Unemployment
     elif '실업' in indicator_name:
         if '실업률' in indicator_name:
-            return f"{value:.1f}%"
+            return "{:.1f}%".format
         else:  # 실업자 count (in thousands)
-            return f"{value:,.0f}thousand"
+            return "{:,.0f}thousand".format
     # Debt values in trillions of KRW
-    elif '부채' in indicator_name or 'debt' in indicator_name.lower():
-        return f"{value:,.1f}trillion KRW"
+    elif '부채' in indicator_name or 'debt' in lower_name:
+        return "{:,.1f}trillion KRW".format
     # Money supply in trillions of KRW
-    elif '통화량' in indicator_name or 'money supply' in indicator_name.lower():
-        return f"{value:,.1f}trillion KRW"
+    elif '통화량' in indicator_name or 'money supply' in lower_name:
+        return "{:,.1f}trillion KRW".format
     # Interest rates as percentages
-    elif '금리' in indicator_name or 'rate' in indicator_name.lower():
-        return f"{value:.2f}%"
+    elif '금리' in indicator_name or 'rate' in lower_name:
+        return "{:.2f}%".format
     else:
-        return f"{value:,.2f}"
+        return "{:,.2f}".format
+
+
+def format_ecos_value(value, indicator_name):
+    """
+    Format ECOS value based on indicator type.
+
+    The keyword lookup is cached per indicator name (_ecos_formatter).
+
+    Args:
+        value (float): Numeric value
+        indicator_name (str): Indicator name
 
+    Returns:
+        str: Formatted value string
+    """
+    return _ecos_formatter(indicator_name)(value)
 
-def format_timeseries_output(data, indicator_name):
+
+def format_timeseries_output(data, indicator_name, fmt=None):
     """
     Format time series data for economic cycle dashboard.
 
     Args:
         data (dict): Time series data from fetch_ecos_data_timeseries
         indicator_name (str): Display name
+        fmt (str, optional): Value format spec (e.g. '{:.2f}%'); defaults
+                             to the format picked from the indicator name
 
     Returns:
         str: Formatted multi-line output (4 lines per indicator)
     """
-    # Format values based on indicator type
-    latest_str = format_ecos_value(data['latest'], indicator_name)
-    min_str = format_ecos_value(data['min'], indicator_name)
-    max_str = format_ecos_value(data['max'], indicator_name)
-    avg_str = format_ecos_value(data['avg'], indicator_name)
-
-    # Build output
-    output = f"- {indicator_name}:\n"
-    output += f"  Latest: {latest_str} ({data['dates'][-1]}) | "
-    output += f"Trend: {data['trend']} | Δ: {data['change_pct']:+.2f}%\n"
-    output += f"  Range: {min_str} - {max_str} | Avg: {avg_str}\n"
+    # Format values based on indicator type (formatter resolved once)
+    format_value = fmt.format if fmt else _ecos_formatter(indicator_name)
 
     # Time series data (compact format)
     # Show every 3rd point for monthly (24 -> 8 points), all for annual
-    if len(data['values']) > 12:
-        step = 3
-        display_values = [format_ecos_value(data['values'][i], indicator_name)
-                         for i in range(0, len(data['values']), step)]
-        display_dates = [data['dates'][i] for i in range(0, len(data['dates']), step)]
-    else:
-        display_values = [format_ecos_value(v, indicator_name) for v in data['values']]
-        display_dates = data['dates']
-
-    output += f"  Series: {', '.join(display_values)}\n"
-    output += f"  Dates:  {', '.join(display_dates)}\n"
-
-    return output
-
-
+    step = 3 if len(data['values']) > 12 else 1
+    display_values = map(format_value, data['values'][::step])
+    display_dates = data['dates'][::step]
+
+    return "".join([
+        f"- {indicator_name}:\n",
+        f"  Latest: {format_value(data['latest'])} ({data['dates'][-1]}) | ",
+        f"Trend: {data['trend']} | Δ: {data['change_pct']:+.2f}%\n",
+        f"  Range: {format_value(data['min'])} - {format_value(data['max'])} | Avg: {format_value(data['avg'])}\n",
+        f"  Series: {', '.join(display_values)}\n",
+        f"  Dates:  {', '.join(display_dates)}\n",
+    ])
+
+
+@ttl_cache(
+    "yf_commodity_ratio",
+    ttl=MARKET_DATA_CACHE_TTL,
+    key_func=lambda numerator_symbol, denominator_symbol, ratio_name: (
+        f"{numerator_symbol}/{denominator_symbol}:{datetime.now():%Y-%m-%d}"
+    )
+)
 def fetch_commodity_ratio(numerator_symbol, denominator_symbol, ratio_name):
     """
     Fetch commodity ratio (e.g., Copper/Gold) from yfinance.
 
+    Cached per symbol pair and calendar day, so a ratio from the previous
+    session is never served after the date rolls over.
+
     Args:
         numerator_symbol (str): Numerator commodity symbol (e.g., 'HG=F')
         denominator_symbol (str): Denominator commodity symbol (e.g., 'GC=F')
@@ -892,20 +1539,17 @@ def fetch_commodity_ratio(numerator_symbol, denominator_symbol, ratio_name):
             print(f"[Error] {ratio_name}: Insufficient data for denominator '{denominator_symbol}' - only {len(den_hist)} data point(s), need at least 2")
             return None
 
-        # Calculate ratios
-        latest_num = float(num_hist['Close'].iloc[-1])
-        latest_den = float(den_hist['Close'].iloc[-1])
-
-        prev_num = float(num_hist['Close'].iloc[-2])
-        prev_den = float(den_hist['Close'].iloc[-2])
+        # Last two closes as arrays: [previous, latest]
+        num_last2 = num_hist['Close'].to_numpy()[-2:]
+        den_last2 = den_hist['Close'].to_numpy()[-2:]
 
         # Check for zero denominator
-        if latest_den == 0 or prev_den == 0:
+        if not den_last2.all():
             print(f"[Error] {ratio_name}: Division by zero - denominator '{denominator_symbol}' has zero value")
             return None
 
-        latest_ratio = latest_num / latest_den
-        prev_ratio = prev_num / prev_den
+        # Calculate both ratios in one vectorized division
+        prev_ratio, latest_ratio = (num_last2 / den_last2).tolist()
 
         change_pct = ((latest_ratio - prev_ratio) / prev_ratio) * 100
 
@@ -922,16 +1566,18 @@ def fetch_commodity_ratio(numerator_symbol, denominator_symbol, ratio_name):
         return None
 
 
+@ttl_cache("fear_greed", ttl=FEAR_GREED_CACHE_TTL)
 def fetch_fear_greed_index():
     """
-    Fetch CNN Fear & Greed Index.
+    Fetch CNN Fear & Greed Index (cached on disk; force_refresh=True bypasses).
 
     Returns:
         dict: {value, description, last_update} or None if failed
     """
-    try:
-        import fear_and_greed
+    if fear_and_greed is None:
+        return None
 
+    try:
         fgi = fear_and_greed.get()
 
         return {
@@ -944,201 +1590,276 @@ def fetch_fear_greed_index():
         return None
 
 
-def async_scrape_shiller_pe():
-    """
-    Scrape Shiller PE from multpl.com using AsyncChromiumLoader logic.
-    Refactored to robustly parse value by decomposing other tags first.
+# First number (with thousands separators) in the multpl.com value text
+_MULTPL_VALUE_RE = re.compile(r'[\d,]+\.?\d*')
+
+
+def _parse_multpl_current(html_content):
     """
-    try:
-        url = "https://www.multpl.com/shiller-pe"
+    Parses the headline value block (div#current) of a multpl.com page.
 
-        # Run async loader
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        html_content = loop.run_until_complete(
-            async_load_with_retry(url, ['.advertisement', '.sidebar'])
-        )
-        loop.close()
+    The block holds a title (<b>), the value, a change span and a timestamp;
+    everything except the value is extracted/removed first so the remaining
+    text is the number alone. Uses selectolax when installed, BeautifulSoup
+    otherwise.
 
-        if not html_content:
+    Args:
+        html_content (str): Page HTML
+
+    Returns:
+        dict: {value, change, date} or None if the block/value is missing
+    """
+    if _FastHTMLParser is not None:
+        current_div = _FastHTMLParser(html_content).css_first('div#current')
+        if current_div is None:
             return None
 
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # 1. Extract date and remove tag
+        date_elem = current_div.css_first('div#timestamp')
+        date = date_elem.text(strip=True) if date_elem else datetime.now().strftime('%Y-%m-%d')
+        if date_elem:
+            date_elem.decompose()
+
+        # 2. Extract change and remove tag
+        change_elem = current_div.css_first('span.change, span.pos, span.neg')
+        change = change_elem.text(strip=True) if change_elem else "N/A"
+        if change_elem:
+            change_elem.decompose()
+
+        # 3. Remove title tag (<b>) to prevent number interference
+        title_elem = current_div.css_first('b')
+        if title_elem:
+            title_elem.decompose()
+
+        value_text = current_div.text(strip=True)
+    else:
+        soup = BeautifulSoup(html_content, 'lxml')
         current_div = soup.find('div', id='current')
-
         if not current_div:
             return None
 
-        # --- Parsing logic (same as S&P 500 PE) ---
-
         # 1. Extract date and remove tag
         date_elem = current_div.find('div', id='timestamp')
         date = date_elem.get_text(strip=True) if date_elem else datetime.now().strftime('%Y-%m-%d')
         if date_elem:
-            date_elem.decompose()
+            date_elem.decompose()  # Remove from HTML tree to prevent interference
 
-        # 2. Extract change, remove line breaks, remove tag
+        # 2. Extract change and remove tag (class change, pos, or neg)
         change_elem = current_div.find('span', class_=['change', 'pos', 'neg'])
+        change = change_elem.get_text(strip=True) if change_elem else "N/A"
         if change_elem:
-            # Replace line breaks (\n) with spaces to make it a single line
-            change = change_elem.get_text(strip=True).replace('\n', ' ')
             change_elem.decompose()
-        else:
-            change = "N/A"
 
         # 3. Remove title tag (<b>) to prevent number interference
         title_elem = current_div.find('b')
         if title_elem:
             title_elem.decompose()
 
-        # 4. Extract value (parse from remaining text)
         value_text = current_div.get_text(strip=True)
-        value_match = re.search(r'[\d,]+\.?\d*', value_text)
-        
-        if not value_match:
-            return None
 
-        value = float(value_match.group().replace(',', ''))
+    # 4. Extract value (remaining text is pure value only)
+    value_match = _MULTPL_VALUE_RE.search(value_text)
+    if not value_match:
+        return None
 
-        return {
-            'value': value,
-            'change': change,
-            'date': date
-        }
+    return {
+        'value': float(value_match.group().replace(',', '')),
+        'change': change,
+        'date': date
+    }
 
-    except Exception as e:
-        print(f"Error in async_scrape_shiller_pe: {e}")
+
+MULTPL_SHILLER_PE_URL = "https://www.multpl.com/shiller-pe"
+MULTPL_SP500_PE_URL = "https://www.multpl.com/s-p-500-pe-ratio"
+
+
+def parse_shiller_html(html_content):
+    """Parses Shiller PE from a multpl.com page (see _parse_multpl_current)."""
+    result = _parse_multpl_current(html_content)
+    if result:
+        # Replace line breaks (\n) with spaces to make it a single line
+        result['change'] = result['change'].replace('\n', ' ')
+    return result
+
+
+def parse_spx_html(html_content):
+    """Parses S&P 500 PE-Ratio from a multpl.com page (see _parse_multpl_current)."""
+    return _parse_multpl_current(html_content)
+
+
+MULTPL_SELECTORS_TO_REMOVE = ['.advertisement', '.sidebar']
+
+
+async def _async_scrape_multpl(url, parse):
+    """
+    Loads a multpl.com page in the shared browser and parses its current value.
+
+    Parsing runs on a worker thread so other scrapes on the loop (e.g. the
+    other pages in scrape_valuation_indicators) are not blocked by it.
+
+    Args:
+        url (str): multpl.com page URL
+        parse (callable): HTML parser (parse_shiller_html or parse_spx_html)
+
+    Returns:
+        dict: {value, change, date} or None if the page failed to load
+    """
+    html_content = await async_load_with_retry(url, MULTPL_SELECTORS_TO_REMOVE)
+
+    if not html_content:
         return None
-    
 
-def async_scrape_sp500_pe():
+    return await asyncio.to_thread(parse, html_content)
+
+
+def _scrape_multpl(url, parse):
     """
-    Scrape S&P 500 PE-Ratio from multpl.com using AsyncChromiumLoader.
+    Scrapes one multpl.com page (synchronous wrapper around _async_scrape_multpl).
 
     Returns:
         dict: {value, change, date} or None if failed
     """
     try:
-        url = "https://www.multpl.com/s-p-500-pe-ratio"
+        return _run_async(_async_scrape_multpl(url, parse))
 
-        # 1. Run async loader (in synchronous environment)
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        html_content = loop.run_until_complete(
-            async_load_with_retry(url, ['.advertisement', '.sidebar'])
-        )
-        loop.close()
+    except Exception as e:
+        print(f"Scraping {url} failed: {e}")
+        return None
 
-        if not html_content:
-            return None
 
-        soup = BeautifulSoup(html_content, 'html.parser')
+@ttl_cache("multpl_shiller_pe", ttl=MULTPL_CACHE_TTL)
+def async_scrape_shiller_pe():
+    """Scrape Shiller PE from multpl.com (see _scrape_multpl; cached on disk)."""
+    return _scrape_multpl(MULTPL_SHILLER_PE_URL, parse_shiller_html)
 
-        # 2. Find main container
-        current_div = soup.find('div', id='current')
-        if not current_div:
-            return None
 
-        # --- [Core fix] Change parsing order and remove noise tags ---
+@ttl_cache("multpl_sp500_pe", ttl=MULTPL_CACHE_TTL)
+def async_scrape_sp500_pe():
+    """Scrape S&P 500 PE-Ratio from multpl.com (see _scrape_multpl; cached on disk)."""
+    return _scrape_multpl(MULTPL_SP500_PE_URL, parse_spx_html)
 
-        # 3. Extract date and remove tag
-        date_elem = current_div.find('div', id='timestamp')
-        date = date_elem.get_text(strip=True) if date_elem else datetime.now().strftime('%Y-%m-%d')
-        if date_elem:
-            date_elem.decompose()  # Remove from HTML tree to prevent interference
 
-        # 4. Extract price change and remove tags
-        # Find elements with class change, pos, or neg
-        change_elem = current_div.find('span', class_=['change', 'pos', 'neg'])
-        change = change_elem.get_text(strip=True) if change_elem else "N/A"
-        if change_elem:
-            change_elem.decompose() # Remove from HTML tree
+def scrape_valuation_indicators(force_refresh=False):
+    """
+    Scrape ISM PMI, Shiller PE and S&P 500 PE-Ratio concurrently.
 
-        # 5. Remove title (S&P 500 text) tags
-        # The <b> tag contains "S&P 500" numbers, so it must be removed first
-        title_elem = current_div.find('b')
-        if title_elem:
-            title_elem.decompose()
+    All three share the scrape loop and its single Chromium instance (each
+    page gets its own browser context), so the group takes about as long
+    as the slowest scrape; cached results are served without loading.
 
-        # 6. Extract value (remaining text is pure value only)
-        value_text = current_div.get_text(strip=True)
-        
-        # Extract float using regex
-        value_match = re.search(r'[\d,]+\.?\d*', value_text)
-        
-        if not value_match:
-            return None
+    Returns:
+        tuple: (ism_data, shiller_data, sp500_pe_data), each dict or None
+    """
+    ism_data, shiller_data, sp500_pe_data = fetch_all([
+        (functools.partial(scraper, force_refresh=force_refresh), ())
+        for scraper in (scrape_ism_pmi, async_scrape_shiller_pe, async_scrape_sp500_pe)
+    ])
+    return ism_data, shiller_data, sp500_pe_data
 
-        value = float(value_match.group().replace(',', ''))
 
-        return {
-            'value': value,
-            'change': change,
-            'date': date
-        }
+# ==================== FOMC DOCUMENT SCRAPING ====================
 
-    except Exception as e:
-        print(f"Scraping failed: {e}")
-        return None
+# FOMC document links on the calendar page (group 1: YYYYMMDD meeting date)
+# Minutes (fomcminutesYYYYMMDD.htm) or Statement (monetaryYYYYMMDD[a].htm) links;
+# group 1 is the Minutes date, group 2 the Statement date
+_FOMC_DOC_PATTERN = r'fomcminutes(\d{8})\.htm|monetary(\d{8})[a-z]?\.htm'
+_FOMC_DOC_RE = re.compile(_FOMC_DOC_PATTERN)
 
+# XPath selecting the hrefs of <a> tags that match the pattern above
+_EXSLT_NAMESPACES = {'re': 'http://exslt.org/regular-expressions'}
+_FOMC_LINK_XPATH = f"//a/@href[re:test(., '{_FOMC_DOC_PATTERN}')]"
 
-# ==================== FOMC DOCUMENT SCRAPING ====================
 
-def fetch_page(url):
-    """Helper function to fetch URL content"""
+def _fetch_page_text(url):
+    """Fetches a page as UTF-8 text via the pooled session, or None on failure."""
     headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+        "User-Agent": DEFAULT_USER_AGENT
     }
     try:
-        response = requests.get(url, headers=headers)
+        response = _HTTP_SESSION.get(url, headers=headers, timeout=HTTP_TIMEOUT)
         response.raise_for_status()
         # [Important] Force UTF-8 to prevent special character corruption
         response.encoding = 'utf-8'
-        return BeautifulSoup(response.text, 'html.parser')
+        return response.text
+    except Exception as e:
+        print(f"[Error] {url} connection failed: {e}")
+        return None
+
+
+_FOMC_PAGE_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+
+
+def fetch_page(url):
+    """
+    Helper function to fetch URL content.
+
+    The body is streamed straight into lxml as raw bytes (gzip decoded on
+    the fly), so no decoded copy of long pages such as the Minutes is kept.
+
+    Returns:
+        lxml.html.HtmlElement: Root element of the page, or None on failure
+    """
+    headers = {
+        "User-Agent": DEFAULT_USER_AGENT
+    }
+    try:
+        with _HTTP_SESSION.get(url, headers=headers, timeout=HTTP_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            # [Important] Force UTF-8 to prevent special character corruption
+            return lxml_html.parse(response.raw, parser=_FOMC_PAGE_PARSER).getroot()
     except Exception as e:
         print(f"[Error] {url} connection failed: {e}")
         return None
 
+
+def _element_text(element, separator):
+    """
+    Joins the stripped, non-empty text nodes under `element` with `separator`
+    (same result as BeautifulSoup's get_text(separator=..., strip=True)).
+    """
+    return separator.join(filter(None, map(str.strip, element.itertext())))
+
+
 def extract_content(url):
     """Function to extract title and body from URL"""
-    soup = fetch_page(url)
-    if not soup:
+    root = fetch_page(url)
+    if root is None:
         return None
 
     # 1. Extract title
-    title = soup.find('title').get_text(strip=True)
-    article_section = soup.find('div', id='article')
+    title = (root.findtext('.//title') or '').strip()
+    article_section = root.find('.//div[@id="article"]')
 
-    if article_section:
-        header = article_section.find(['h2', 'h3', 'h1'])
-        if header:
+    if article_section is not None:
+        header = next(article_section.iter('h2', 'h3', 'h1'), None)
+        if header is not None:
             # Use separator as title may have line breaks
-            title = header.get_text(separator=' ', strip=True)
+            title = _element_text(header, ' ')
 
     # 2. Extract body
     content_text = ""
-    if article_section:
-        paragraphs = article_section.find_all('p')
-        # [Modified] Add separator='\n' to insert line break when <br> or tag ends
-        text_list = []
-        for p in paragraphs:
-            # Insert line break between tags when extracting text
-            text = p.get_text(separator='\n', strip=True)
-            if text:
-                text_list.append(text)
-
-        # Add two line breaks (\n\n) between paragraphs (p)
-        content_text = "\n\n".join(text_list)
+    if article_section is not None:
+        # Line break between text nodes (e.g. around <br>), two between paragraphs (p)
+        text_list = [_element_text(p, '\n') for p in article_section.iter('p')]
+        content_text = "\n\n".join(filter(None, text_list))
     else:
         # Edge case where id='article' doesn't exist
-        content_text = soup.body.get_text(separator='\n', strip=True)
+        body = root.find('body')
+        if body is None:
+            body = root
+        lxml_etree.strip_elements(body, 'script', 'style', with_tail=False)
+        content_text = _element_text(body, '\n')
 
     return title, content_text
 
+@ttl_cache("fomc_documents", ttl=FOMC_CACHE_TTL)
 def get_latest_fomc_documents():
     """
     Fetch latest FOMC Minutes and Statement from Federal Reserve website.
 
+    Cached on disk; pass force_refresh=True to bypass the cache.
+
     Returns:
         dict: {
             'statement': {'date', 'title', 'url', 'content'},
@@ -1149,52 +1870,54 @@ def get_latest_fomc_documents():
     calendar_url = "https://www.federalreserve.gov/monetarypolicy/fomccalendars.htm"
 
     print("Fetching Calendar Page...")
-    soup_cal = fetch_page(calendar_url)
-    if not soup_cal:
+    calendar_html = _fetch_page_text(calendar_url)
+    if not calendar_html:
+        return None
+
+    # Let lxml (C) pick out only the Minutes/Statement links instead of
+    # walking every <a> tag in Python
+    try:
+        doc_hrefs = lxml_html.fromstring(calendar_html).xpath(
+            _FOMC_LINK_XPATH, namespaces=_EXSLT_NAMESPACES
+        )
+    except Exception as e:
+        print(f"[Error] {calendar_url} parsing failed: {e}")
         return None
 
+    # {doc_type: {date: doc}}; the first link seen for a date wins
     docs_found = {
-        'minutes': [],
-        'statement': []
+        'minutes': {},
+        'statement': {}
     }
 
-    # Regular expression
-    pattern_minutes = re.compile(r'fomcminutes(\d{8})\.htm')
-    pattern_statement = re.compile(r'monetary(\d{8})[a-z]?\.htm')
-
-    for link in soup_cal.find_all('a', href=True):
-        href = link['href']
-        full_url = urljoin(base_url, href)
-
-        # 1. Minutes
-        match_min = pattern_minutes.search(href)
-        if match_min:
-            docs_found['minutes'].append({
-                'date': match_min.group(1),
-                'url': full_url,
-                'type': 'Minutes'
-            })
+    for href in doc_hrefs:
+        match = _FOMC_DOC_RE.search(href)
+        if not match:
             continue
 
-        # 2. Statement
-        match_stmt = pattern_statement.search(href)
-        if match_stmt and 'htm' in href:
-            docs_found['statement'].append({
-                'date': match_stmt.group(1),
-                'url': full_url,
-                'type': 'Statement'
-            })
+        minutes_date, statement_date = match.groups()
+        if minutes_date:
+            doc_type, date, label = 'minutes', minutes_date, 'Minutes'
+        else:
+            doc_type, date, label = 'statement', statement_date, 'Statement'
+
+        if date not in docs_found[doc_type]:
+            docs_found[doc_type][date] = {
+                'date': date,
+                'url': urljoin(base_url, str(href)),
+                'type': label
+            }
 
     results = {}
 
     for doc_type in ['statement', 'minutes']:
-        doc_list = docs_found[doc_type]
-        if not doc_list:
+        docs_by_date = docs_found[doc_type]
+        if not docs_by_date:
             print(f"[{doc_type}] link not found.")
             continue
 
-        # Sort by date descending
-        latest_doc = sorted(doc_list, key=lambda x: x['date'], reverse=True)[0]
+        # Dates are zero-padded YYYYMMDD strings, so the max key is the latest
+        latest_doc = docs_by_date[max(docs_by_date)]
 
         print(f"\n>> latest {latest_doc['type']} extracting... (date: {latest_doc['date']})")
 
@@ -1207,7 +1930,197 @@ def get_latest_fomc_documents():
             "content": content
         }
 
-    return results
+    return results if results else None
+
+
+# ==================== CONCURRENT FETCHING ====================
+
+# Shared pool for running the blocking fetch_* helpers concurrently
+FETCH_POOL_WORKERS = 16
+_FETCH_POOL = ThreadPoolExecutor(max_workers=FETCH_POOL_WORKERS, thread_name_prefix="macro-fetch")
+
+
+async def fetch_all_async(jobs):
+    """
+    Runs blocking fetchers concurrently on the shared fetch pool.
+
+    Args:
+        jobs (list): (fetch_function, args_tuple) pairs,
+                     e.g. [(fetch_fred_data, ('DGS10', '10Y Treasury')), ...]
+
+    Returns:
+        list: Results in job order; a fetcher that raised yields None
+    """
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(
+        *(loop.run_in_executor(_FETCH_POOL, fn, *args) for fn, args in jobs),
+        return_exceptions=True
+    )
+    return [None if isinstance(result, Exception) else result for result in results]
+
+
+def fetch_all(jobs):
+    """Synchronous entry point for fetch_all_async() (runs on the shared loop)."""
+    if not jobs:
+        return []
+    return _run_async(fetch_all_async(jobs))
+
+
+def fetch_fred_data_batch(series):
+    """
+    Fetches several FRED series at once (one concurrent request per unique series).
+
+    Args:
+        series (list): (series_id, series_name) pairs; duplicates are fetched once
+
+    Returns:
+        dict: {series_id: fetch_fred_data() result or None}
+    """
+    unique_series = dict(series)
+    results = fetch_all([
+        (fetch_fred_data, (series_id, series_name))
+        for series_id, series_name in unique_series.items()
+    ])
+    return dict(zip(unique_series, results))
+
+
+def _indicator_job(ind):
+    """Returns the (fetch_function, args) job for a config indicator based on its source."""
+    source = ind.get('source', 'FRED')
+    if source == 'ECOS':
+        return fetch_ecos_data, (ind['stat_code'], ind['item_code'], ind['cycle'], ind['name'])
+    if source == 'WorldBank':
+        return fetch_world_bank_data, (ind['symbol'], ind['name'], ind['countries'])
+    if ind.get('type') == 'composite_ratio':
+        return fetch_commodity_ratio, (ind['numerator'], ind['denominator'], ind['name'])
+    if source == 'yfinance':
+        return fetch_market_index, (ind.get('symbol', ind.get('series_id')), ind['name'])
+    return fetch_fred_data, (ind['series_id'], ind['name'])
+
+
+def _fetch_policy_section(section):
+    """
+    Fetches every indicator of a POLICY_ENVIRONMENT_CONFIG section concurrently.
+
+    Each indicator is zipped with its own result (strict, so a job/indicator
+    count mismatch raises instead of shifting results).
+
+    Returns:
+        list: (subsection_data, [(indicator, data), ...]) per subsection, in config order
+    """
+    subsections = tuple(section['subsections'].values())
+    indicators = [ind for subsection_data in subsections for ind in subsection_data['indicators']]
+    pairs = list(zip(indicators, fetch_all([_indicator_job(ind) for ind in indicators]), strict=True))
+
+    grouped = []
+    start = 0
+    for subsection_data in subsections:
+        end = start + len(subsection_data['indicators'])
+        grouped.append((subsection_data, pairs[start:end]))
+        start = end
+    return grouped
+
+
+def _indicator_row_job(row):
+    """Returns the (fetch_function, args) job for a typed FRED_INDICATORS row."""
+    if isinstance(row, EcosIndicator):
+        return fetch_ecos_data, (row.stat_code, row.item_code, row.cycle, row.name)
+    return fetch_fred_data, (row.series_id, row.name)
+
+
+# Economic cycle plan kind -> (fetch_function, args) builder
+_PLAN_JOBS = {
+    'fred': lambda c: (fetch_fred_data, (c['series_id'], c['name'])),
+    'yfinance': lambda c: (fetch_market_index, (c.get('symbol', c.get('series_id')), c['name'])),
+    'ratio': lambda c: (fetch_commodity_ratio, (c['numerator'], c['denominator'], c['name'])),
+    'ecos': lambda c: (fetch_ecos_data, (c['stat_code'], c['item_code'], c['cycle'], c['name'])),
+    'ecos_aggregated': lambda c: (
+        fetch_ecos_data_aggregated, (c['stat_code'], c['item_code'], c['item_codes'], c['cycle'], c['name'])
+    ),
+    'ecos_timeseries': lambda c: (
+        fetch_ecos_data_timeseries, (c['stat_code'], c['item_code'], c['cycle'], c['name'], c['data_points'])
+    ),
+    'ecos_multi': lambda c: (
+        fetch_ecos_data_multi_item, (c['stat_code'], c['item_codes'], c['cycle'], c['name'], c.get('data_points'))
+    ),
+}
+
+
+def _format_plan_fred(plan, data):
+    format_value = plan.fmt.format if plan.fmt else _fred_formatter(plan.name)
+    val_str = format_value(data['value'])
+    prev_str = format_value(data['prev_value'])
+    return [
+        f"- {plan.name} ({plan.symbol}): ",
+        f"{val_str} ({data['date']}) | ",
+        f"Prev: {prev_str} | Δ: {data['change_pct']:+.2f}%\n"
+    ], 1
+
+
+def _format_plan_ecos(plan, data):
+    format_value = plan.fmt.format if plan.fmt else _ecos_formatter(plan.name)
+    val_str = format_value(data['value'])
+    prev_str = format_value(data['prev_value'])
+    return [
+        f"- {plan.name}: ",
+        f"{val_str} ({data['date']}) | ",
+        f"Prev: {prev_str} | Δ: {data['change_pct']:+.2f}%\n"
+    ], 1
+
+
+def _format_plan_market(plan, data):
+    return [
+        f"- {plan.name} ({plan.symbol}): ",
+        f"{data['close']:,.2f} ",
+        f"({data['change_pct']:+.2f}%) ",
+        f"[{data['date']}]\n"
+    ], 1
+
+
+def _format_plan_ratio(plan, data):
+    return [
+        f"- {plan.name}: {data['ratio']:.4f} ",
+        f"({data['date']}) | Δ: {data['change_pct']:+.2f}%\n"
+    ], 1
+
+
+def _format_plan_timeseries(plan, data):
+    return [format_timeseries_output(data, plan.name, plan.fmt)], 1
+
+
+def _format_plan_multi_item(plan, data):
+    # One time series (and one success) per item, e.g. BSI by industry;
+    # item names match the keys built by fetch_ecos_data_multi_item
+    item_fmts = {
+        f"{plan.name} - {item_config['name']}": item_config.get('fmt')
+        for item_config in plan.config['item_codes']
+    }
+    return [
+        format_timeseries_output(item_data, item_name, item_fmts.get(item_name))
+        for item_name, item_data in data.items()
+    ], len(data)
+
+
+# Economic cycle plan kind -> formatter returning (report parts, successful indicator count)
+_PLAN_FORMATTERS = {
+    'fred': _format_plan_fred,
+    'yfinance': _format_plan_market,
+    'ratio': _format_plan_ratio,
+    'ecos': _format_plan_ecos,
+    'ecos_aggregated': _format_plan_ecos,
+    'ecos_timeseries': _format_plan_timeseries,
+    'ecos_multi': _format_plan_multi_item,
+}
+
+# (substring of a failure label, data source type) for the economic cycle
+# summary, e.g. "Korea CPI (ECOS)" -> ECOS
+_CYCLE_FAILURE_SOURCE_TYPES = (
+    ('ECOS', 'ECOS'),
+    ('ISM', 'ISM PMI'),
+    ('Shiller', 'Shiller PE'),
+    ('PE-Ratio', 'PE-Ratio'),
+    ('Fear', 'Fear & Greed'),
+)
 
 
 # ==================== MAIN TOOLS ====================
@@ -1232,159 +2145,142 @@ def get_global_environment(ticker: str) -> str:
     # 1. Initialize
     is_korean_stock = ticker.isdigit()
 
-    summary = f"--- GLOBAL ECONOMIC ENVIRONMENT ({ticker}) ---\n"
-    summary += f"Stock Type: {'Korean (KS)' if is_korean_stock else 'US'}\n"
-    summary += f"Data Collection Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    parts = [f"--- GLOBAL ECONOMIC ENVIRONMENT ({ticker}) ---\n"]
+    parts.append(f"Stock Type: {'Korean (KS)' if is_korean_stock else 'US'}\n")
+    parts.append(f"Data Collection Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
 
     failed_sources = []
     total_indicators = 0
     successful_indicators = 0
 
     # 2. SOURCE 1: ISM Manufacturing PMI
-    summary += "=== 1. ISM MANUFACTURING PMI ===\n"
+    parts.append("=== 1. ISM MANUFACTURING PMI ===\n")
 
     try:
         ism_data = scrape_ism_pmi()
 
         if ism_data:
-            summary += f"Latest: {ism_data.get('date', 'N/A')}\n"
-            summary += f"Actual: {ism_data.get('actual', 'N/A')} | "
-            summary += f"Forecast: {ism_data.get('forecast', 'N/A')} | "
-            summary += f"Previous: {ism_data.get('previous', 'N/A')}\n"
-            summary += "(Note: <50 = contraction)\n\n"
+            parts.append(f"Latest: {ism_data.get('date', 'N/A')}\n")
+            parts.append(f"Actual: {ism_data.get('actual', 'N/A')} | ")
+            parts.append(f"Forecast: {ism_data.get('forecast', 'N/A')} | ")
+            parts.append(f"Previous: {ism_data.get('previous', 'N/A')}\n")
+            parts.append("(Note: <50 = contraction)\n\n")
         else:
-            summary += "[!] ISM PMI data collection failed\n\n"
+            parts.append("[!] ISM PMI data collection failed\n\n")
             failed_sources.append("ISM PMI")
     except Exception as e:
-        summary += f"[!] ISM PMI failed: {str(e)[:100]}\n\n"
+        parts.append(f"[!] ISM PMI failed: {str(e)[:100]}\n\n")
         failed_sources.append("ISM PMI")
 
-    time.sleep(0.5)
-
     # 3. SOURCE 2: World Bank Data
-    summary += "=== 2. WORLD BANK INDICATORS (5 Countries) ===\n\n"
+    parts.append("=== 2. WORLD BANK INDICATORS (5 Countries) ===\n\n")
 
     try:
-        from .macro_config import (
-            WORLD_BANK_INDICATORS,
-            COUNTRY_CODES,
-            KOREA_PRIORITY_COUNTRIES,
-            US_PRIORITY_COUNTRIES
-        )
+        if is_korean_stock:
+            priority_countries, country_pairs = KOREA_PRIORITY_COUNTRIES, KOREA_COUNTRY_PAIRS
+        else:
+            priority_countries, country_pairs = US_PRIORITY_COUNTRIES, US_COUNTRY_PAIRS
 
-        priority_countries = KOREA_PRIORITY_COUNTRIES if is_korean_stock else US_PRIORITY_COUNTRIES
+        # Fetch all indicators concurrently, then format in config order
+        wb_results = fetch_all([
+            (fetch_world_bank_data, (indicator['symbol'], indicator['name'], priority_countries))
+            for indicator in WORLD_BANK_INDICATORS
+        ])
 
-        for indicator in WORLD_BANK_INDICATORS:
+        for indicator, wb_data in zip(WORLD_BANK_INDICATORS, wb_results):
             total_indicators += 5  # 5 countries per indicator
 
-            wb_data = fetch_world_bank_data(
-                indicator['symbol'],
-                indicator['name'],
-                priority_countries
-            )
-
             if wb_data:
-                summary += f"[{indicator['name']}]\n"
+                parts.append(f"[{indicator['name']}]\n")
 
-                for country_code in priority_countries:
+                for country_code, country_name in country_pairs:
                     if country_code in wb_data:
-                        country_name = COUNTRY_CODES.get(country_code, country_code)
                         val_str = format_wb_value(wb_data[country_code]['value'], indicator['name'])
                         year = wb_data[country_code]['year']
 
-                        summary += f"- {country_name}: {val_str} ({year})\n"
+                        parts.append(f"- {country_name}: {val_str} ({year})\n")
                         successful_indicators += 1
 
-                summary += "\n"
+                parts.append("\n")
 
     except Exception as e:
-        summary += f"[!] World Bank data collection failed: {str(e)[:150]}\n\n"
+        parts.append(f"[!] World Bank data collection failed: {str(e)[:150]}\n\n")
         failed_sources.append("World Bank")
 
-    time.sleep(0.5)
-
     # 4. SOURCE 3: FRED Major Indicators
-    summary += "=== 3. FRED MAJOR INDICATORS ===\n\n"
+    parts.append("=== 3. FRED MAJOR INDICATORS ===\n\n")
 
     try:
-        from .macro_config import GLOBAL_FRED_INDICATORS
-
-        # Group by category
-        by_category = {}
-        for ind in GLOBAL_FRED_INDICATORS:
-            cat = ind['category']
-            if cat not in by_category:
-                by_category[cat] = []
-            by_category[cat].append(ind)
+        # Fetch all series concurrently, then format by category
+        fred_by_series = fetch_fred_data_batch(
+            (ind['series_id'], ind['name']) for ind in GLOBAL_FRED_INDICATORS
+        )
 
-        for category, indicators in by_category.items():
-            summary += f"[{category}]\n"
+        for category, indicators in GLOBAL_FRED_INDICATORS_BY_CATEGORY.items():
+            parts.append(f"[{category}]\n")
 
             for ind in indicators:
                 total_indicators += 1
-                fred_data = fetch_fred_data(ind['series_id'], ind['name'])
+                fred_data = fred_by_series[ind['series_id']]
 
                 if fred_data:
                     successful_indicators += 1
                     val_str = format_fred_value(fred_data['value'], ind['name'])
 
-                    summary += f"- {ind['name']} ({ind['series_id']}): "
-                    summary += f"{val_str} ({fred_data['date']}) | "
-                    summary += f"Δ: {fred_data['change_pct']:+.2f}%\n"
+                    parts.append(f"- {ind['name']} ({ind['series_id']}): ")
+                    parts.append(f"{val_str} ({fred_data['date']}) | ")
+                    parts.append(f"Δ: {fred_data['change_pct']:+.2f}%\n")
 
-            summary += "\n"
+            parts.append("\n")
 
     except Exception as e:
-        summary += f"[!] FRED data collection failed: {str(e)[:150]}\n\n"
+        parts.append(f"[!] FRED data collection failed: {str(e)[:150]}\n\n")
         failed_sources.append("FRED")
 
-    time.sleep(0.5)
-
     # 5. SOURCE 4: Market Indices
-    summary += "=== 4. GLOBAL MARKET INDICES ===\n"
+    parts.append("=== 4. GLOBAL MARKET INDICES ===\n")
 
     try:
-        from .macro_config import MARKET_INDICES
+        index_results = fetch_all([
+            (fetch_market_index, (index['symbol'], index['name']))
+            for index in MARKET_INDICES
+        ])
 
-        for index in MARKET_INDICES:
+        for index, index_data in zip(MARKET_INDICES, index_results):
             total_indicators += 1
 
-            index_data = fetch_market_index(index['symbol'], index['name'])
-
             if index_data:
                 successful_indicators += 1
-                summary += f"- {index['name']} ({index['symbol']}): "
-                summary += f"{index_data['close']:,.2f} "
-                summary += f"({index_data['change_pct']:+.2f}%) "
-                summary += f"[{index_data['date']}]\n"
+                parts.append(f"- {index['name']} ({index['symbol']}): ")
+                parts.append(f"{index_data['close']:,.2f} ")
+                parts.append(f"({index_data['change_pct']:+.2f}%) ")
+                parts.append(f"[{index_data['date']}]\n")
 
-        summary += "\n"
+        parts.append("\n")
 
     except Exception as e:
-        summary += f"[!] Market Indices collection failed: {str(e)[:100]}\n\n"
+        parts.append(f"[!] Market Indices collection failed: {str(e)[:100]}\n\n")
         failed_sources.append("Market Indices")
 
-    time.sleep(0.5)
-
     # 6. SUMMARY
-    summary += "=== SUMMARY ===\n"
+    parts.append("=== SUMMARY ===\n")
 
     sources_collected = 6 - len(failed_sources)
-    summary += f"Data Sources Collected: {sources_collected}/6"
+    parts.append(f"Data Sources Collected: {sources_collected}/6")
     if sources_collected == 6:
-        summary += " ✓"
-    summary += "\n"
+        parts.append(" ✓")
+    parts.append("\n")
 
     if total_indicators > 0:
-        summary += f"Indicators Collected: {successful_indicators}/{total_indicators} "
-        summary += f"({(successful_indicators/total_indicators)*100:.1f}%)\n"
+        parts.append(f"Indicators Collected: {successful_indicators}/{total_indicators} ")
+        parts.append(f"({(successful_indicators/total_indicators)*100:.1f}%)\n")
 
     if failed_sources:
-        summary += f"Failed Sources: {', '.join(failed_sources)}\n"
+        parts.append(f"Failed Sources: {', '.join(failed_sources)}\n")
 
-    summary += "\nNote: Data is based on the latest publicly available values from each source.\n"
+    parts.append("\nNote: Data is based on the latest publicly available values from each source.\n")
 
-    return summary
+    return "".join(parts)
 
 
 @tool
@@ -1407,163 +2303,131 @@ def get_economic_indicator(ticker: str) -> str:
     # === 1. Initialize ===
     is_korean_stock = ticker.isdigit()
 
-    summary = f"--- MACROECONOMIC DATA ({ticker}) ---\n"
-    summary += f"Stock Type: {'Korean (KS)' if is_korean_stock else 'US'}\n"
-    summary += f"Data Collection Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    parts = [f"--- MACROECONOMIC DATA ({ticker}) ---\n"]
+    parts.append(f"Stock Type: {'Korean (KS)' if is_korean_stock else 'US'}\n")
+    parts.append(f"Data Collection Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
 
     failed_sources = []
     failed_indicators = []
     successful_indicators = 0
 
     # === 2. SOURCE 1: ISM Manufacturing PMI ===
-    summary += "=== 1. ISM MANUFACTURING PMI (investing.com) ===\n"
+    parts.append("=== 1. ISM MANUFACTURING PMI (investing.com) ===\n")
 
     try:
         ism_data = scrape_ism_pmi()
 
         if ism_data:
-            summary += f"Latest Release: {ism_data.get('date', 'N/A')}\n"
-            summary += f"Actual: {ism_data.get('actual', 'N/A')} | "
-            summary += f"Forecast: {ism_data.get('forecast', 'N/A')} | "
-            summary += f"Previous: {ism_data.get('previous', 'N/A')}\n"
-            summary += "(Note: <50 indicates contraction)\n\n"
+            parts.append(f"Latest Release: {ism_data.get('date', 'N/A')}\n")
+            parts.append(f"Actual: {ism_data.get('actual', 'N/A')} | ")
+            parts.append(f"Forecast: {ism_data.get('forecast', 'N/A')} | ")
+            parts.append(f"Previous: {ism_data.get('previous', 'N/A')}\n")
+            parts.append("(Note: <50 indicates contraction)\n\n")
         else:
-            summary += "[!] ISM PMI data collection failed (page parsing error or access restriction)\n\n"
+            parts.append("[!] ISM PMI data collection failed (page parsing error or access restriction)\n\n")
             failed_sources.append("ISM PMI")
 
     except Exception as e:
-        summary += f"[!] ISM PMI collection failed: {str(e)[:100]}\n\n"
+        parts.append(f"[!] ISM PMI collection failed: {str(e)[:100]}\n\n")
         failed_sources.append("ISM PMI")
 
-    time.sleep(0.5)  # Rate limiting
-
     # === 3. SOURCE 2: Fear & Greed Index ===
-    summary += "=== 2. FEAR & GREED INDEX (Market-Wide) ===\n"
-
-    try:
-        import fear_and_greed
-        fgi = fear_and_greed.get()
+    parts.append("=== 2. FEAR & GREED INDEX (Market-Wide) ===\n")
 
-        summary += f"Current Index: {fgi.value}/100 - {fgi.description}\n"
-        summary += f"Last Updated: {fgi.last_update}\n"
-        summary += "(Note: Market-wide index, independent of individual stocks)\n\n"
-
-    except Exception as e:
-        summary += f"[!] Fear & Greed Index collection failed: {str(e)[:100]}\n\n"
+    fgi = fetch_fear_greed_index()
+    if fgi:
+        parts.append(f"Current Index: {fgi['value']}/100 - {fgi['description']}\n")
+        parts.append(f"Last Updated: {fgi['last_update']}\n")
+        parts.append("(Note: Market-wide index, independent of individual stocks)\n\n")
+    else:
+        parts.append("[!] Fear & Greed Index collection failed\n\n")
         failed_sources.append("Fear & Greed")
 
-    time.sleep(0.5)  # Rate limiting
-
     # === 4. SOURCE 3: Economic Data (27 Indicators from FRED + ECOS) ===
-    summary += "=== 3. ECONOMIC DATA (27 Indicators) ===\n\n"
+    parts.append("=== 3. ECONOMIC DATA (27 Indicators) ===\n\n")
 
     try:
-        from .macro_config import FRED_INDICATORS, KOREA_PRIORITY_CATEGORIES, US_PRIORITY_CATEGORIES
-
-        # Determine category priority based on stock type
-        if is_korean_stock:
-            priority_categories = KOREA_PRIORITY_CATEGORIES
-        else:
-            priority_categories = US_PRIORITY_CATEGORIES
-
-        # Group indicators by category
-        by_category = {}
-        for indicator in FRED_INDICATORS:
-            cat = indicator['category']
-            if cat not in by_category:
-                by_category[cat] = []
-            by_category[cat].append(indicator)
+        # Indicator rows in the stock type's category priority order (precomputed)
+        ordered_indicators = get_ordered('KR' if is_korean_stock else 'US')
 
-        # Fetch and format data by category
-        for category in priority_categories:
-            if category not in by_category:
-                continue
+        # Fetch every indicator concurrently; each row is paired with its own
+        # result, and the same rows drive the formatting below
+        results = fetch_all([_indicator_row_job(indicator) for indicator in ordered_indicators])
 
+        # Format data by category (rows of a category are contiguous)
+        for category, category_results in groupby(
+            zip(ordered_indicators, results), key=lambda pair: pair[0].category
+        ):
             # Category header
-            category_indicators = by_category[category]
-            summary += f"[Category: {category}]\n"
-
-            # Fetch each indicator in this category
-            for indicator in category_indicators:
-                # Check source type (default to FRED for backward compatibility)
-                source = indicator.get('source', 'FRED')
-
-                if source == 'ECOS':
-                    # Fetch from ECOS API
-                    ecos_data = fetch_ecos_data(
-                        indicator['stat_code'],
-                        indicator['item_code'],
-                        indicator['cycle'],
-                        indicator['name']
-                    )
-
-                    if ecos_data:
+            parts.append(f"[Category: {category}]\n")
+
+            # Format each indicator in this category (typed rows: ECOS vs FRED)
+            for indicator, data in category_results:
+                if isinstance(indicator, EcosIndicator):
+                    if data:
                         successful_indicators += 1
 
                         # Format values
-                        val_str = format_ecos_value(ecos_data['value'], indicator['name'])
-                        prev_str = format_ecos_value(ecos_data['prev_value'], indicator['name'])
+                        val_str = format_ecos_value(data['value'], indicator.name)
+                        prev_str = format_ecos_value(data['prev_value'], indicator.name)
 
                         # Build output line
-                        summary += f"- {indicator['name']}: "
-                        summary += f"{val_str} ({ecos_data['date']}) | "
-                        summary += f"Prev: {prev_str} | "
-                        summary += f"Δ: {ecos_data['change_pct']:+.2f}%\n"
+                        parts.append(f"- {indicator.name}: ")
+                        parts.append(f"{val_str} ({data['date']}) | ")
+                        parts.append(f"Prev: {prev_str} | ")
+                        parts.append(f"Δ: {data['change_pct']:+.2f}%\n")
                     else:
-                        failed_indicators.append(f"{indicator['name']} (ECOS)")
-
-                else:  # FRED (default)
-                    fred_data = fetch_fred_data(indicator['series_id'], indicator['name'])
+                        failed_indicators.append(f"{indicator.name} (ECOS)")
 
-                    if fred_data:
+                else:  # FredIndicator
+                    if data:
                         successful_indicators += 1
 
                         # Format values
-                        val_str = format_fred_value(fred_data['value'], indicator['name'])
-                        prev_str = format_fred_value(fred_data['prev_value'], indicator['name'])
+                        val_str = format_fred_value(data['value'], indicator.name)
+                        prev_str = format_fred_value(data['prev_value'], indicator.name)
 
                         # Build output line
-                        summary += f"- {indicator['name']} ({indicator['series_id']}): "
-                        summary += f"{val_str} ({fred_data['date']}) | "
-                        summary += f"Prev: {prev_str} | "
-                        summary += f"Δ: {fred_data['change_pct']:+.2f}%\n"
+                        parts.append(f"- {indicator.name} ({indicator.series_id}): ")
+                        parts.append(f"{val_str} ({data['date']}) | ")
+                        parts.append(f"Prev: {prev_str} | ")
+                        parts.append(f"Δ: {data['change_pct']:+.2f}%\n")
                     else:
                         # Failed to fetch this indicator
-                        failed_indicators.append(f"{indicator['name']} ({indicator['series_id']})")
-
-            summary += "\n"
+                        failed_indicators.append(f"{indicator.name} ({indicator.series_id})")
+            parts.append("\n")
 
     except Exception as e:
-        summary += f"[!] FRED data collection error: {str(e)[:150]}\n\n"
+        parts.append(f"[!] FRED data collection error: {str(e)[:150]}\n\n")
         failed_sources.append("FRED")
 
     # === 4. Summary ===
-    summary += "=== SUMMARY ===\n"
+    parts.append("=== SUMMARY ===\n")
 
     # Count total sources (3 sources: ISM, F&G, FRED)
     unique_failed = list(set(failed_sources))  # Deduplicate
     sources_collected = 3 - len(unique_failed)
-    summary += f"Data Sources Collected: {sources_collected}/3"
+    parts.append(f"Data Sources Collected: {sources_collected}/3")
     if sources_collected == 3:
-        summary += " ✓"
-    summary += "\n"
+        parts.append(" ✓")
+    parts.append("\n")
 
-    summary += f"Economic Indicators Collected: {successful_indicators}/27\n"
+    parts.append(f"Economic Indicators Collected: {successful_indicators}/27\n")
 
     if unique_failed:
-        summary += f"Failed Sources: {', '.join(unique_failed)}\n"
+        parts.append(f"Failed Sources: {', '.join(unique_failed)}\n")
 
     if failed_indicators:
-        summary += f"Failed FRED Series ({len(failed_indicators)}):\n"
+        parts.append(f"Failed FRED Series ({len(failed_indicators)}):\n")
         # Show first 10 failures
         for failure in failed_indicators[:10]:
-            summary += f"  - {failure}\n"
+            parts.append(f"  - {failure}\n")
         if len(failed_indicators) > 10:
-            summary += f"  ... and {len(failed_indicators) - 10} more\n"
+            parts.append(f"  ... and {len(failed_indicators) - 10} more\n")
 
-    summary += "\nNote: Based on the latest publicly available values at the time of data collection.\n"
+    parts.append("\nNote: Based on the latest publicly available values at the time of data collection.\n")
 
-    return summary
+    return "".join(parts)
 
 
 @tool
@@ -1584,141 +2448,133 @@ def get_policy_environment(ticker: str) -> str:
     """
     # 1. Initialize
     is_korean_stock = ticker.isdigit()
-    summary = f"--- POLICY & SECTOR ENVIRONMENT ({ticker}) ---\n"
-    summary += f"Collection Time: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n"
+    parts = [f"--- POLICY & SECTOR ENVIRONMENT ({ticker}) ---\n"]
+    parts.append(f"Collection Time: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n")
 
     failed_indicators = []
     total_indicators = 0
     successful_indicators = 0
 
-    # 2. Load config
-    from .macro_config import POLICY_ENVIRONMENT_CONFIG
-
     # 3. SECTION 1: Policy Info & Impact Analysis
-    summary += "=== 1. POLICY INFO & IMPACT ANALYSIS ===\n\n"
+    parts.append("=== 1. POLICY INFO & IMPACT ANALYSIS ===\n\n")
 
     try:
         section1 = POLICY_ENVIRONMENT_CONFIG['section_1_policy_info']
 
-        for subsection_key, subsection_data in section1['subsections'].items():
+        # Fetch the whole section concurrently, then format per subsection
+        for subsection_data, indicator_results in _fetch_policy_section(section1):
             subsection_name = subsection_data['display_name']
-            indicators = subsection_data['indicators']
+            parts.append(f"[{subsection_name} - {len(indicator_results)} indicators]\n")
 
-            summary += f"[{subsection_name} - {len(indicators)} indicators]\n"
+            # A formatting error only loses this subsection
+            try:
+                for ind, fred_data in indicator_results:
+                    total_indicators += 1
 
-            for ind in indicators:
-                total_indicators += 1
-                fred_data = fetch_fred_data(ind['series_id'], ind['name'])
+                    if fred_data:
+                        successful_indicators += 1
+                        val_str = format_fred_value(fred_data['value'], ind['name'])
+                        prev_str = format_fred_value(fred_data['prev_value'], ind['name'])
 
-                if fred_data:
-                    successful_indicators += 1
-                    val_str = format_fred_value(fred_data['value'], ind['name'])
-                    prev_str = format_fred_value(fred_data['prev_value'], ind['name'])
+                        parts.append(f"- {ind['name']} ({ind['series_id']}): ")
+                        parts.append(f"{val_str} ({fred_data['date']}) | ")
+                        parts.append(f"Prev: {prev_str} | Δ: {fred_data['change_pct']:+.2f}%\n")
+                    else:
+                        failed_indicators.append(f"{ind['name']} ({ind['series_id']})")
 
-                    summary += f"- {ind['name']} ({ind['series_id']}): "
-                    summary += f"{val_str} ({fred_data['date']}) | "
-                    summary += f"Prev: {prev_str} | Δ: {fred_data['change_pct']:+.2f}%\n"
-                else:
-                    failed_indicators.append(f"{ind['name']} ({ind['series_id']})")
+                parts.append("\n")
 
-            summary += "\n"
-            time.sleep(0.5)
+            except Exception as e:
+                parts.append(f"[!] {subsection_name} failed: {str(e)[:100]}\n\n")
 
     except Exception as e:
-        summary += f"[!] Section 1 failed: {str(e)[:100]}\n\n"
+        parts.append(f"[!] Section 1 failed: {str(e)[:100]}\n\n")
 
     # 4. SECTION 2: Social & Demographic Trends
-    summary += "=== 2. SOCIAL & DEMOGRAPHIC TRENDS ===\n\n"
+    parts.append("=== 2. SOCIAL & DEMOGRAPHIC TRENDS ===\n\n")
 
     try:
         section2 = POLICY_ENVIRONMENT_CONFIG['section_2_social_demographic']
 
-        for subsection_key, subsection_data in section2['subsections'].items():
+        # Fetch the whole section (World Bank + FRED) concurrently
+        for subsection_data, indicator_results in _fetch_policy_section(section2):
             subsection_name = subsection_data['display_name']
-            indicators = subsection_data['indicators']
-
-            summary += f"[{subsection_name}]\n"
-
-            for ind in indicators:
-                total_indicators += 1
+            parts.append(f"[{subsection_name}]\n")
 
-                # Handle mixed sources
-                if ind.get('source') == 'WorldBank':
-                    wb_data = fetch_world_bank_data(
-                        ind['symbol'],
-                        ind['name'],
-                        ind['countries']
-                    )
-
-                    if wb_data:
-                        for country_code, data in wb_data.items():
+            # A formatting error only loses this subsection
+            try:
+                for ind, ind_data in indicator_results:
+                    total_indicators += 1
+
+                    # Handle mixed sources
+                    if ind.get('source') == 'WorldBank':
+                        if ind_data:
+                            for country_code, data in ind_data.items():
+                                successful_indicators += 1
+                                val_str = format_wb_value(data['value'], ind['name'])
+                                parts.append(f"- {ind['name']}: {val_str} ({data['year']})\n")
+                        else:
+                            failed_indicators.append(f"{ind['name']} ({ind['symbol']})")
+
+                    else:  # FRED
+                        if ind_data:
                             successful_indicators += 1
-                            val_str = format_wb_value(data['value'], ind['name'])
-                            summary += f"- {ind['name']}: {val_str} ({data['year']})\n"
-                    else:
-                        failed_indicators.append(f"{ind['name']} ({ind['symbol']})")
-
-                else:  # FRED
-                    fred_data = fetch_fred_data(ind['series_id'], ind['name'])
+                            val_str = format_fred_value(ind_data['value'], ind['name'])
+                            prev_str = format_fred_value(ind_data['prev_value'], ind['name'])
 
-                    if fred_data:
-                        successful_indicators += 1
-                        val_str = format_fred_value(fred_data['value'], ind['name'])
-                        prev_str = format_fred_value(fred_data['prev_value'], ind['name'])
+                            parts.append(f"- {ind['name']} ({ind['series_id']}): ")
+                            parts.append(f"{val_str} ({ind_data['date']}) | ")
+                            parts.append(f"Prev: {prev_str} | Δ: {ind_data['change_pct']:+.2f}%\n")
+                        else:
+                            failed_indicators.append(f"{ind['name']} ({ind['series_id']})")
 
-                        summary += f"- {ind['name']} ({ind['series_id']}): "
-                        summary += f"{val_str} ({fred_data['date']}) | "
-                        summary += f"Prev: {prev_str} | Δ: {fred_data['change_pct']:+.2f}%\n"
-                    else:
-                        failed_indicators.append(f"{ind['name']} ({ind['series_id']})")
+                parts.append("\n")
 
-            summary += "\n"
-            time.sleep(0.5)
+            except Exception as e:
+                parts.append(f"[!] {subsection_name} failed: {str(e)[:100]}\n\n")
 
     except Exception as e:
-        summary += f"[!] Section 2 failed: {str(e)[:100]}\n\n"
+        parts.append(f"[!] Section 2 failed: {str(e)[:100]}\n\n")
 
     # 5. SECTION 3: Sector Impact Analysis
-    summary += "=== 3. SECTOR IMPACT ANALYSIS ===\n\n"
+    parts.append("=== 3. SECTOR IMPACT ANALYSIS ===\n\n")
 
     try:
-        section3 = POLICY_ENVIRONMENT_CONFIG['section_3_sector_impact']
-        etfs = section3['etfs']
+        parts.append(f"[{len(SECTOR_ETF_BY_SYMBOL)} Sector ETFs]\n")
 
-        summary += f"[{len(etfs)} Sector ETFs]\n"
+        # One batched download for all sector ETFs
+        etf_batch = fetch_sector_etfs_batch(tuple(SECTOR_ETF_BY_SYMBOL)) or {}
 
-        for etf in etfs:
+        for symbol, name in SECTOR_ETF_BY_SYMBOL.items():
             total_indicators += 1
 
-            etf_data = fetch_sector_etf_data(etf['symbol'], etf['name'])
+            etf_data = etf_batch.get(symbol)
 
             if etf_data:
                 successful_indicators += 1
-                summary += format_sector_etf_output(etf_data, etf['name'], etf['symbol'])
+                parts.append(format_sector_etf_output(etf_data, name, symbol))
             else:
-                failed_indicators.append(f"{etf['name']} ({etf['symbol']})")
-                summary += f"- {etf['name']} ({etf['symbol']}): [Data unavailable]\n"
+                failed_indicators.append(f"{name} ({symbol})")
+                parts.append(f"- {name} ({symbol}): [Data unavailable]\n")
 
-            time.sleep(0.3)
-
-        summary += "\n"
+        parts.append("\n")
 
     except Exception as e:
-        summary += f"[!] Section 3 failed: {str(e)[:100]}\n\n"
+        parts.append(f"[!] Section 3 failed: {str(e)[:100]}\n\n")
 
     # 6. Summary
-    summary += "=== SUMMARY ===\n"
+    parts.append("=== SUMMARY ===\n")
 
     if total_indicators > 0:
         success_rate = (successful_indicators / total_indicators) * 100
-        summary += f"Indicators: {successful_indicators}/{total_indicators} ({success_rate:.1f}%)\n"
+        parts.append(f"Indicators: {successful_indicators}/{total_indicators} ({success_rate:.1f}%)\n")
 
     if failed_indicators and len(failed_indicators) <= 10:
-        summary += f"Failed: {', '.join(failed_indicators)}\n"
+        parts.append(f"Failed: {', '.join(failed_indicators)}\n")
     elif failed_indicators:
-        summary += f"Failed: {len(failed_indicators)} indicators\n"
+        parts.append(f"Failed: {len(failed_indicators)} indicators\n")
 
-    return summary
+    return "".join(parts)
 
 
 @tool
@@ -1742,340 +2598,129 @@ def get_economic_cycle(ticker: str) -> str:
     """
     # 1. Initialize
     is_korean_stock = ticker.isdigit()
-    summary = f"--- ECONOMIC CYCLE DASHBOARD ({ticker}) ---\n"
-    summary += f"Collection Time: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n"
+    parts = [f"--- ECONOMIC CYCLE DASHBOARD ({ticker}) ---\n"]
+    parts.append(f"Collection Time: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n")
 
-    failed_sources = []
+    failed_sources = {}  # Failure labels in first-seen order (dict as ordered set)
     total_indicators = 0
     successful_indicators = 0
 
-    # 2. Load config
-    from .macro_config import ECONOMIC_CYCLE_CONFIG
-
-    # 3. GROUP A: Liquidity & Rates (FRED)
-    summary += "=== A. Money Supply, Interest Rates & Liquidity ===\n"
-    try:
-        group_a = ECONOMIC_CYCLE_CONFIG['group_a_liquidity_rates']
-        for ind in group_a['indicators']:
-            total_indicators += 1
-            fred_data = fetch_fred_data(ind['series_id'], ind['name'])
-
-            if fred_data:
-                successful_indicators += 1
-                val_str = format_fred_value(fred_data['value'], ind['name'])
-                prev_str = format_fred_value(fred_data['prev_value'], ind['name'])
-
-                summary += f"- {ind['name']} ({ind['series_id']}): "
-                summary += f"{val_str} ({fred_data['date']}) | "
-                summary += f"Prev: {prev_str} | Δ: {fred_data['change_pct']:+.2f}%\n"
-            else:
-                failed_sources.append(f"{ind['name']}")
-
-        # ECOS indicators for Group A (Korean liquidity/rates)
-        if 'ecos_indicators' in group_a:
-            for indicator_key, config in group_a['ecos_indicators'].items():
-                total_indicators += 1
-                ecos_data = fetch_ecos_data(
-                    config['stat_code'],
-                    config['item_code'],
-                    config['cycle'],
-                    config['name']
-                )
-
-                if ecos_data:
-                    successful_indicators += 1
-                    val_str = format_ecos_value(ecos_data['value'], config['name'])
-                    prev_str = format_ecos_value(ecos_data['prev_value'], config['name'])
-
-                    summary += f"- {config['name']}: "
-                    summary += f"{val_str} ({ecos_data['date']}) | "
-                    summary += f"Prev: {prev_str} | Δ: {ecos_data['change_pct']:+.2f}%\n"
-                else:
-                    failed_sources.append(f"{config['name']} (ECOS)")
-
-        summary += "\n"
-        time.sleep(0.5)
-
-    except Exception as e:
-        summary += f"[!] Group A failed: {str(e)[:100]}\n\n"
-
-    # 4. GROUP B: Real Economy (FRED)
-    summary += "=== B. Real Economy & Inflation ===\n"
-    try:
-        group_b = ECONOMIC_CYCLE_CONFIG['group_b_real_economy']
-        for ind in group_b['indicators']:
-            total_indicators += 1
-            fred_data = fetch_fred_data(ind['series_id'], ind['name'])
-
-            if fred_data:
-                successful_indicators += 1
-                val_str = format_fred_value(fred_data['value'], ind['name'])
-                prev_str = format_fred_value(fred_data['prev_value'], ind['name'])
-
-                summary += f"- {ind['name']} ({ind['series_id']}): "
-                summary += f"{val_str} ({fred_data['date']}) | "
-                summary += f"Prev: {prev_str} | Δ: {fred_data['change_pct']:+.2f}%\n"
-            else:
-                failed_sources.append(f"{ind['name']}")
-
-        # NEW: ECOS indicators for Group B (Korean economic indicators)
-        if 'ecos_indicators' in group_b:
-            for indicator_key, config in group_b['ecos_indicators'].items():
-                total_indicators += 1
-
-                # Multi-item indicator (BSI, Unemployment)
-                if config.get('multi_item', False):
-                    ecos_data = fetch_ecos_data_multi_item(
-                        config['stat_code'],
-                        config['item_codes'],
-                        config['cycle'],
-                        config['name'],
-                        config.get('data_points')
-                    )
-
-                    if ecos_data:
-                        for item_name, item_data in ecos_data.items():
-                            successful_indicators += 1
-                            summary += format_timeseries_output(item_data, item_name)
-                    else:
-                        failed_sources.append(f"{config['name']} (ECOS)")
-
-                    time.sleep(0.2)  # Rate limiting for multi-item
-
-                # Single-item indicator (GDP, CPI, PPI, CSI)
-                else:
-                    ecos_data = fetch_ecos_data_timeseries(
-                        config['stat_code'],
-                        config['item_code'],
-                        config['cycle'],
-                        config['name'],
-                        config.get('data_points')
-                    )
-
-                    if ecos_data:
-                        successful_indicators += 1
-                        summary += format_timeseries_output(ecos_data, config['name'])
-                    else:
-                        failed_sources.append(f"{config['name']} (ECOS)")
-
-        summary += "\n"
-        time.sleep(0.5)
-
-    except Exception as e:
-        summary += f"[!] Group B failed: {str(e)[:100]}\n\n"
-
-    # 5. GROUP C: Risk & Credit (FRED + yfinance + ECOS)
-    summary += "=== C. Risk, Credit & Debt ===\n"
-    try:
-        group_c = ECONOMIC_CYCLE_CONFIG['group_c_risk_credit']
-
-        # FRED and yfinance indicators
-        for ind in group_c['indicators']:
-            total_indicators += 1
-
-            if ind['source'] == 'FRED':
-                fred_data = fetch_fred_data(ind['series_id'], ind['name'])
-                if fred_data:
-                    successful_indicators += 1
-                    val_str = format_fred_value(fred_data['value'], ind['name'])
-                    prev_str = format_fred_value(fred_data['prev_value'], ind['name'])
-
-                    summary += f"- {ind['name']} ({ind['series_id']}): "
-                    summary += f"{val_str} ({fred_data['date']}) | "
-                    summary += f"Prev: {prev_str} | Δ: {fred_data['change_pct']:+.2f}%\n"
-                else:
-                    failed_sources.append(f"{ind['name']}")
-
-            elif ind['source'] == 'yfinance':
-                market_data = fetch_market_index(ind['series_id'], ind['name'])
-                if market_data:
-                    successful_indicators += 1
-                    summary += f"- {ind['name']} ({ind['series_id']}): "
-                    summary += f"{market_data['close']:,.2f} "
-                    summary += f"({market_data['change_pct']:+.2f}%) "
-                    summary += f"[{market_data['date']}]\n"
-                else:
-                    failed_sources.append(f"{ind['name']}")
+    # 2. GROUPS A-D: fetch every planned indicator concurrently up front,
+    # then format each group in plan order
+    plan_results = iter(fetch_all([
+        _PLAN_JOBS[plan.kind](plan.config)
+        for group in ECONOMIC_CYCLE_PLAN
+        for plan in group.indicators
+    ]))
 
-        # ECOS indicators (Korean debt data)
-        if 'ecos_indicators' in group_c:
-            ecos_config = group_c['ecos_indicators']
+    for group in ECONOMIC_CYCLE_PLAN:
+        # Results are taken for the whole group before formatting, so a
+        # failure inside one group can't shift the next group's results
+        group_results = [next(plan_results) for _ in group.indicators]
 
-            for debt_type, config in ecos_config.items():
+        parts.append(f"=== {group.display_name} ===\n")
+        try:
+            for plan, data in zip(group.indicators, group_results):
                 total_indicators += 1
 
-                # Check if aggregation is required (e.g., Corporate Debt)
-                if config.get('aggregation_required', False):
-                    ecos_data = fetch_ecos_data_aggregated(
-                        config['stat_code'],
-                        config['item_code'],      # Base item code (e.g., 'BDDF1')
-                        config['item_codes'],     # Sub-item codes (e.g., ['A', 'B'])
-                        config['cycle'],
-                        config['name']
-                    )
-                else:
-                    ecos_data = fetch_ecos_data(
-                        config['stat_code'],
-                        config['item_code'],
-                        config['cycle'],
-                        config['name']
-                    )
-
-                if ecos_data:
-                    successful_indicators += 1
-                    val_str = format_ecos_value(ecos_data['value'], config['name'])
-                    prev_str = format_ecos_value(ecos_data['prev_value'], config['name'])
-
-                    summary += f"- {config['name']}: "
-                    summary += f"{val_str} ({ecos_data['date']}) | "
-                    summary += f"Prev: {prev_str} | Δ: {ecos_data['change_pct']:+.2f}%\n"
+                if data:
+                    plan_parts, successes = _PLAN_FORMATTERS[plan.kind](plan, data)
+                    successful_indicators += successes
+                    parts.extend(plan_parts)
                 else:
-                    failed_sources.append(f"{config['name']} (ECOS)")
+                    failed_sources[plan.failure_label] = None
 
-        summary += "\n"
-        time.sleep(0.5)
+            parts.append("\n")
 
-    except Exception as e:
-        summary += f"[!] Group C failed: {str(e)[:100]}\n\n"
+        except Exception as e:
+            parts.append(f"[!] Group {group.letter} failed: {str(e)[:100]}\n\n")
 
-    # 6. GROUP D: Market Assets (yfinance)
-    summary += "=== D. Market Indices & Asset Prices ===\n"
+    # 3. GROUP E: Valuation Metrics (AsyncChromiumLoader)
+    parts.append("=== E. Valuation Indicators ===\n")
     try:
-        group_d = ECONOMIC_CYCLE_CONFIG['group_d_market_assets']
-
-        for ind in group_d['indicators']:
-            total_indicators += 1
-
-            if ind.get('type') == 'composite_ratio':
-                # Commodity ratio (Copper/Gold)
-                ratio_data = fetch_commodity_ratio(
-                    ind['numerator'],
-                    ind['denominator'],
-                    ind['name']
-                )
+        # ISM PMI, Shiller PE and S&P 500 PE scraped concurrently
+        ism_data, shiller_data, sp500_pe_data = scrape_valuation_indicators()
 
-                if ratio_data:
-                    successful_indicators += 1
-                    summary += f"- {ind['name']}: {ratio_data['ratio']:.4f} "
-                    summary += f"({ratio_data['date']}) | Δ: {ratio_data['change_pct']:+.2f}%\n"
-                else:
-                    failed_sources.append(f"{ind['name']}")
-
-            else:
-                # Regular market index
-                market_data = fetch_market_index(ind['symbol'], ind['name'])
-
-                if market_data:
-                    successful_indicators += 1
-                    summary += f"- {ind['name']} ({ind['symbol']}): "
-                    summary += f"{market_data['close']:,.2f} "
-                    summary += f"({market_data['change_pct']:+.2f}%) "
-                    summary += f"[{market_data['date']}]\n"
-                else:
-                    failed_sources.append(f"{ind['name']}")
-
-        summary += "\n"
-        time.sleep(0.5)
-
-    except Exception as e:
-        summary += f"[!] Group D failed: {str(e)[:100]}\n\n"
-
-    # 7. GROUP E: Valuation Metrics (AsyncChromiumLoader)
-    summary += "=== E. Valuation Indicators ===\n"
-    try:
         # ISM PMI
         total_indicators += 1
-        ism_data = scrape_ism_pmi()
         if ism_data:
             successful_indicators += 1
-            summary += f"- ISM Manufacturing PMI: {ism_data['actual']} "
-            summary += f"| Forecast: {ism_data['forecast']} "
-            summary += f"| Previous: {ism_data['previous']} [{ism_data['date']}]\n"
+            parts.append(f"- ISM Manufacturing PMI: {ism_data['actual']} ")
+            parts.append(f"| Forecast: {ism_data['forecast']} ")
+            parts.append(f"| Previous: {ism_data['previous']} [{ism_data['date']}]\n")
         else:
-            failed_sources.append("ISM PMI")
-
-        time.sleep(0.5)
+            failed_sources["ISM PMI"] = None
 
         # Shiller PE
         total_indicators += 1
-        shiller_data = async_scrape_shiller_pe()
         if shiller_data:
             successful_indicators += 1
-            summary += f"- Shiller PE: {shiller_data['value']:.2f} "
-            summary += f"| Change: {shiller_data['change']} [{shiller_data['date']}]\n"
+            parts.append(f"- Shiller PE: {shiller_data['value']:.2f} ")
+            parts.append(f"| Change: {shiller_data['change']} [{shiller_data['date']}]\n")
         else:
-            failed_sources.append("Shiller PE")
-
-        time.sleep(0.5)
+            failed_sources["Shiller PE"] = None
 
         # S&P 500 PE
         total_indicators += 1
-        sp500_pe_data = async_scrape_sp500_pe()
         if sp500_pe_data:
             successful_indicators += 1
-            summary += f"- S&P 500 PE-Ratio: {sp500_pe_data['value']:.2f} "
-            summary += f"| Change: {sp500_pe_data['change'].replace('\n', ' ')} [{sp500_pe_data['date']}]\n"
+            parts.append(f"- S&P 500 PE-Ratio: {sp500_pe_data['value']:.2f} ")
+            parts.append(f"| Change: {sp500_pe_data['change'].replace('\n', ' ')} [{sp500_pe_data['date']}]\n")
         else:
-            failed_sources.append("S&P 500 PE-Ratio")
+            failed_sources["S&P 500 PE-Ratio"] = None
 
-        summary += "\n"
+        parts.append("\n")
 
     except Exception as e:
-        summary += f"[!] Group E failed: {str(e)[:100]}\n\n"
+        parts.append(f"[!] Group E failed: {str(e)[:100]}\n\n")
 
-    # 8. Fear & Greed Index
-    summary += "=== F. Market Sentiment ===\n"
+    # 4. Fear & Greed Index
+    parts.append("=== F. Market Sentiment ===\n")
     try:
         total_indicators += 1
         fgi_data = fetch_fear_greed_index()
 
         if fgi_data:
             successful_indicators += 1
-            summary += f"- Fear & Greed Index: {fgi_data['value']}/100 - {fgi_data['description']}\n"
-            summary += f"  Last Updated: {fgi_data['last_update']}\n"
+            parts.append(f"- Fear & Greed Index: {fgi_data['value']}/100 - {fgi_data['description']}\n")
+            parts.append(f"  Last Updated: {fgi_data['last_update']}\n")
         else:
-            failed_sources.append("Fear & Greed Index")
+            failed_sources["Fear & Greed Index"] = None
 
-        summary += "\n"
+        parts.append("\n")
 
     except Exception as e:
-        summary += f"[!] Fear & Greed failed: {str(e)[:100]}\n\n"
+        parts.append(f"[!] Fear & Greed failed: {str(e)[:100]}\n\n")
 
-    # 9. Summary
-    summary += "=== SUMMARY ===\n"
+    # 5. Summary
+    parts.append("=== SUMMARY ===\n")
 
     # Count unique data sources
     sources_count = 7
     failed_source_types = set()
-    if any('ECOS' in f for f in failed_sources):
-        failed_source_types.add('ECOS')
-    if any('ISM' in f for f in failed_sources):
-        failed_source_types.add('ISM PMI')
-    if any('Shiller' in f for f in failed_sources):
-        failed_source_types.add('Shiller PE')
-    if any('PE-Ratio' in f for f in failed_sources):
-        failed_source_types.add('PE-Ratio')
-    if any('Fear' in f for f in failed_sources):
-        failed_source_types.add('Fear & Greed')
+    for failure in failed_sources:
+        for marker, source_type in _CYCLE_FAILURE_SOURCE_TYPES:
+            if marker in failure:
+                failed_source_types.add(source_type)
 
     successful_sources = sources_count - len(failed_source_types)
-    summary += f"Data Sources: {successful_sources}/{sources_count}"
+    parts.append(f"Data Sources: {successful_sources}/{sources_count}")
     if successful_sources == sources_count:
-        summary += " ✓"
-    summary += "\n"
+        parts.append(" ✓")
+    parts.append("\n")
 
     if total_indicators > 0:
         success_rate = (successful_indicators / total_indicators) * 100
-        summary += f"Indicators: {successful_indicators}/{total_indicators} ({success_rate:.1f}%)\n"
+        parts.append(f"Indicators: {successful_indicators}/{total_indicators} ({success_rate:.1f}%)\n")
 
     if failed_sources:
-        unique_failures = list(set(failed_sources))[:10]  # Show max 10
-        summary += f"Failed: {', '.join(unique_failures)}"
+        unique_failures = list(failed_sources)[:10]  # Show max 10
+        parts.append(f"Failed: {', '.join(unique_failures)}")
         if len(failed_sources) > 10:
-            summary += f" +{len(failed_sources) - 10} more"
-        summary += "\n"
+            parts.append(f" +{len(failed_sources) - 10} more")
+        parts.append("\n")
 
-    return summary
+    return "".join(parts)
 
 
 @tool
@@ -2092,8 +2737,8 @@ def get_fomc(ticker: str) -> str:
         str: Full text of FOMC Minutes and Statement (including title, date, content)
     """
     # Initialize
-    summary = f"--- FOMC DOCUMENTS ({ticker}) ---\n"
-    summary += f"Data Collection Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    parts = [f"--- FOMC DOCUMENTS ({ticker}) ---\n"]
+    parts.append(f"Data Collection Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
 
     docs_collected = 0
 
@@ -2102,53 +2747,53 @@ def get_fomc(ticker: str) -> str:
         data = get_latest_fomc_documents()
 
         if not data:
-            summary += "[!] Failed to fetch FOMC documents from Federal Reserve website.\n"
-            summary += "Please check network connection or try again later.\n"
-            return summary
+            parts.append("[!] Failed to fetch FOMC documents from Federal Reserve website.\n")
+            parts.append("Please check network connection or try again later.\n")
+            return "".join(parts)
 
         # Section 1: FOMC Statement
         if 'statement' in data and data['statement']:
             stmt = data['statement']
-            summary += "=== 1. FOMC STATEMENT ===\n"
-            summary += f"Date: {stmt['date']}\n"
-            summary += f"Title: {stmt['title']}\n"
-            summary += f"URL: {stmt['url']}\n\n"
+            parts.append("=== 1. FOMC STATEMENT ===\n")
+            parts.append(f"Date: {stmt['date']}\n")
+            parts.append(f"Title: {stmt['title']}\n")
+            parts.append(f"URL: {stmt['url']}\n\n")
 
             if stmt['content']:
-                summary += f"{stmt['content']}\n\n"
+                parts.append(f"{stmt['content']}\n\n")
                 docs_collected += 1
             else:
-                summary += "[!] Content unavailable\n\n"
+                parts.append("[!] Content unavailable\n\n")
         else:
-            summary += "=== 1. FOMC STATEMENT ===\n"
-            summary += "[!] Statement not found\n\n"
+            parts.append("=== 1. FOMC STATEMENT ===\n")
+            parts.append("[!] Statement not found\n\n")
 
         # Section 2: FOMC Minutes
         if 'minutes' in data and data['minutes']:
             mins = data['minutes']
-            summary += "=== 2. FOMC MINUTES ===\n"
-            summary += f"Date: {mins['date']}\n"
-            summary += f"Title: {mins['title']}\n"
-            summary += f"URL: {mins['url']}\n\n"
+            parts.append("=== 2. FOMC MINUTES ===\n")
+            parts.append(f"Date: {mins['date']}\n")
+            parts.append(f"Title: {mins['title']}\n")
+            parts.append(f"URL: {mins['url']}\n\n")
 
             if mins['content']:
-                summary += f"{mins['content']}\n\n"
+                parts.append(f"{mins['content']}\n\n")
                 docs_collected += 1
             else:
-                summary += "[!] Content unavailable\n\n"
+                parts.append("[!] Content unavailable\n\n")
         else:
-            summary += "=== 2. FOMC MINUTES ===\n"
-            summary += "[!] Minutes not found\n\n"
+            parts.append("=== 2. FOMC MINUTES ===\n")
+            parts.append("[!] Minutes not found\n\n")
 
     except Exception as e:
-        summary += f"[!] Error during FOMC document collection: {str(e)[:150]}\n\n"
+        parts.append(f"[!] Error during FOMC document collection: {str(e)[:150]}\n\n")
 
     # Summary
-    summary += "=== SUMMARY ===\n"
-    summary += f"Documents Collected: {docs_collected}/2"
+    parts.append("=== SUMMARY ===\n")
+    parts.append(f"Documents Collected: {docs_collected}/2")
     if docs_collected == 2:
-        summary += " ✓"
-    summary += "\n"
-    summary += "Note: Full text of FOMC documents for comprehensive monetary policy analysis.\n"
+        parts.append(" ✓")
+    parts.append("\n")
+    parts.append("Note: Full text of FOMC documents for comprehensive monetary policy analysis.\n")
 
-    return summary
+    return "".join(parts)
@@ -3,9 +3,22 @@
 
 """
 Configuration file for FRED (Federal Reserve Economic Data) indicators.
-Contains 28 economic indicators across multiple categories for comprehensive macro analysis.
+Contains 27 economic indicators across multiple categories for comprehensive macro analysis.
+
+The tables are plain Python literals on purpose: they are compiled into the
+module's .pyc, so a cold import unmarshals them without any parsing (about
+2 ms for the whole module, including freezing and the derived lookups),
+which a TOML/CSV data file plus parser could not beat. They are frozen once
+at import and the derived lookups below are built from the frozen tables.
 """
 
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
+
 FRED_INDICATORS = [
     # ========== GDP Growth ==========
     {
@@ -425,37 +438,41 @@ POLICY_ENVIRONMENT_CONFIG = {
 }
 
 # ========== ECONOMIC CYCLE DASHBOARD CONFIGURATION ==========
+# "fmt": optional str.format spec for an indicator's values (e.g. "{:.2f}%");
+# without one, macro.py picks a format from keywords in the indicator name
 
 ECONOMIC_CYCLE_CONFIG = {
     "group_a_liquidity_rates": {
         "display_name": "A. Money Supply, Interest Rates & Liquidity",
         "indicators": [
-            {"series_id": "M2SL", "name": "M2 Money Supply (US)", "source": "FRED"},
-            {"series_id": "FEDFUNDS", "name": "US Federal Funds Rate", "source": "FRED"},
-            {"series_id": "T10Y2Y", "name": "Yield Spread (10Y-2Y)", "source": "FRED"}
+            {"series_id": "M2SL", "name": "M2 Money Supply (US)", "source": "FRED", "fmt": "{:,.1f}B"},
+            {"series_id": "FEDFUNDS", "name": "US Federal Funds Rate", "source": "FRED", "fmt": "{:.2f}%"},
+            {"series_id": "T10Y2Y", "name": "Yield Spread (10Y-2Y)", "source": "FRED", "fmt": "{:.2f}%"}
         ],
         "ecos_indicators": {
             "money_supply": {
                 "stat_code": "101Y009",
                 "item_code": "BBAALA",
                 "cycle": "M",
-                "name": "Korea Money Supply (M2)"
+                "name": "Korea Money Supply (M2)",
+                "fmt": "{:,.1f}trillion KRW"
             },
             "base_rate": {
                 "stat_code": "722Y001",
                 "item_code": "0101000",
                 "cycle": "D",
-                "name": "Korea Base Rate"
+                "name": "Korea Base Rate",
+                "fmt": "{:.2f}%"
             }
         }
     },
     "group_b_real_economy": {
         "display_name": "B. Real Economy & Inflation",
         "indicators": [
-            {"series_id": "GDP", "name": "GDP (US)", "source": "FRED"},
-            {"series_id": "INDPRO", "name": "Industrial Production Index (US)", "source": "FRED"},
-            {"series_id": "CPIAUCSL", "name": "Consumer Price Index (US)", "source": "FRED"},
-            {"series_id": "UNRATE", "name": "Unemployment Rate (US)", "source": "FRED"}
+            {"series_id": "GDP", "name": "GDP (US)", "source": "FRED", "fmt": "{:,.1f}B"},
+            {"series_id": "INDPRO", "name": "Industrial Production Index (US)", "source": "FRED", "fmt": "{:.2f}"},
+            {"series_id": "CPIAUCSL", "name": "Consumer Price Index (US)", "source": "FRED", "fmt": "{:.2f}"},
+            {"series_id": "UNRATE", "name": "Unemployment Rate (US)", "source": "FRED", "fmt": "{:.2f}%"}
         ],
         "ecos_indicators": {
             "gdp": {
@@ -470,6 +487,7 @@ ECONOMIC_CYCLE_CONFIG = {
                 "item_code": "0",
                 "cycle": "M",
                 "name": "Korea Consumer Price Index",
+                "fmt": "{:,.2f}",
                 "data_points": 24
             },
             "ppi": {
@@ -477,14 +495,15 @@ ECONOMIC_CYCLE_CONFIG = {
                 "item_code": "*AA",
                 "cycle": "M",
                 "name": "Korea Producer Price Index",
+                "fmt": "{:,.2f}",
                 "data_points": 24
             },
             "unemployment": {
                 "stat_code": "901Y027",
-                "item_codes": [
-                    {"code": "I61BC/I28A", "name": "Unemployed"},
-                    {"code": "I61BC/I28B", "name": "Unemployment Rate"}
-                ],
+                "item_codes": (
+                    {"code": "I61BC/I28A", "name": "Unemployed", "fmt": "{:,.0f}thousand"},
+                    {"code": "I61BC/I28B", "name": "Unemployment Rate", "fmt": "{:.2f}%"}
+                ),
                 "cycle": "M",
                 "name": "Korea Employment",
                 "data_points": 24,
@@ -495,16 +514,17 @@ ECONOMIC_CYCLE_CONFIG = {
                 "item_code": "FME/99988",
                 "cycle": "M",
                 "name": "Consumer Sentiment Index",
+                "fmt": "{:,.2f}",
                 "data_points": 24
             },
             "business_sentiment": {
                 "stat_code": "512Y007",
-                "item_codes": [
-                    {"code": "AA", "name": "All Industries"},      # Try without /99988 suffix
-                    {"code": "AM", "name": "Manufacturing"},
-                    {"code": "AG", "name": "Non-Manufacturing"},
-                    {"code": "AD", "name": "Construction"}
-                ],
+                "item_codes": (
+                    {"code": "AA", "name": "All Industries", "fmt": "{:,.2f}"},      # Try without /99988 suffix
+                    {"code": "AM", "name": "Manufacturing", "fmt": "{:,.2f}"},
+                    {"code": "AG", "name": "Non-Manufacturing", "fmt": "{:,.2f}"},
+                    {"code": "AD", "name": "Construction", "fmt": "{:,.2f}"}
+                ),
                 "cycle": "M",
                 "name": "Business Survey Index",
                 "data_points": 24,
@@ -516,23 +536,25 @@ ECONOMIC_CYCLE_CONFIG = {
         "display_name": "C. Risk, Credit & Debt",
         "indicators": [
             {"series_id": "^VIX", "name": "VIX Index (Fear Index)", "source": "yfinance"},
-            {"series_id": "BAMLH0A0HYM2", "name": "High Yield Spread (Corporate Credit)", "source": "FRED"},
-            {"series_id": "TDSP", "name": "Household Debt Service Ratio", "source": "FRED"},
-            {"series_id": "DRBLACBS", "name": "Commercial Bank Loan Delinquency Rate", "source": "FRED"}
+            {"series_id": "BAMLH0A0HYM2", "name": "High Yield Spread (Corporate Credit)", "source": "FRED", "fmt": "{:.2f}%"},
+            {"series_id": "TDSP", "name": "Household Debt Service Ratio", "source": "FRED", "fmt": "{:.2f}%"},
+            {"series_id": "DRBLACBS", "name": "Commercial Bank Loan Delinquency Rate", "source": "FRED", "fmt": "{:.2f}%"}
         ],
         "ecos_indicators": {
             "household_debt": {
                 "stat_code": "151Y004",
                 "item_code": "1000000",
                 "cycle": "Q",
-                "name": "Korea Household Debt"
+                "name": "Korea Household Debt",
+                "fmt": "{:,.1f}trillion KRW"
             },
             "corporate_debt": {
                 "stat_code": "131Y017",
                 "item_code": "BDDF1",
-                "item_codes": ["A", "B"],  # A=facility funds, B=operating funds
+                "item_codes": ("A", "B"),  # A=facility funds, B=operating funds
                 "cycle": "Q",
                 "name": "Korea Corporate Debt",
+                "fmt": "{:,.1f}trillion KRW",
                 "aggregation_required": True
             }
         }
@@ -553,3 +575,297 @@ ECONOMIC_CYCLE_CONFIG = {
         ]
     }
 }
+
+# ========== FRED SERIES RELEASE FREQUENCY ==========
+# 'D'aily, 'W'eekly, 'M'onthly or 'Q'uarterly, for every FRED series used above;
+# drives how long fetched observations are cached (unlisted: treated as daily)
+
+FRED_SERIES_CYCLES = {
+    **dict.fromkeys([
+        "DGS10", "DGS2", "T10Y2Y", "VIXCLS", "T10YIE", "T5YIE", "BAMLH0A0HYM2",
+        "DTWEXBGS", "DEXKOUS", "DEXJPUS", "DCOILWTICO"
+    ], "D"),
+    **dict.fromkeys(["WALCL", "MORTGAGE30US"], "W"),
+    **dict.fromkeys([
+        "CPIAUCSL", "CPILFESL", "PPIACO", "PCEPI", "PCEPILFE", "MICH", "UNRATE",
+        "PAYEMS", "CIVPART", "LFWA64TTUSM647S", "INDPRO", "TCU", "RSAFS", "RSXFS",
+        "DGORDER", "FEDFUNDS", "M2SL", "HOUST", "CSUSHPISA", "PSAVERT", "UMCSENT",
+        "CP0000EZ19M086NEST", "IRSTCI01EZM156N", "IRSTCI01JPM156N"
+    ], "M"),
+    **dict.fromkeys(["GDPC1", "GDP", "CP", "TDSP", "DRBLACBS"], "Q"),
+}
+
+# ========== FREEZE CONFIGURATION (once at import) ==========
+# Dicts become read-only MappingProxyType views and lists become tuples, so the
+# tables can be shared across threads and handed to callers without defensive
+# copies (a caller mutating an entry would otherwise change every later report)
+
+def _freeze(value):
+    """
+    Recursively converts dicts to MappingProxyType and lists to tuples, and
+    interns strings (keys and values) so category names, series IDs and
+    sources are single shared objects that compare by identity first.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({_freeze(key): _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+FRED_INDICATORS = _freeze(FRED_INDICATORS)
+KOREA_PRIORITY_CATEGORIES = _freeze(KOREA_PRIORITY_CATEGORIES)
+US_PRIORITY_CATEGORIES = _freeze(US_PRIORITY_CATEGORIES)
+WORLD_BANK_INDICATORS = _freeze(WORLD_BANK_INDICATORS)
+GLOBAL_FRED_INDICATORS = _freeze(GLOBAL_FRED_INDICATORS)
+MARKET_INDICES = _freeze(MARKET_INDICES)
+COUNTRY_CODES = _freeze(COUNTRY_CODES)
+KOREA_PRIORITY_COUNTRIES = _freeze(KOREA_PRIORITY_COUNTRIES)
+US_PRIORITY_COUNTRIES = _freeze(US_PRIORITY_COUNTRIES)
+POLICY_ENVIRONMENT_CONFIG = _freeze(POLICY_ENVIRONMENT_CONFIG)
+ECONOMIC_CYCLE_CONFIG = _freeze(ECONOMIC_CYCLE_CONFIG)
+FRED_SERIES_CYCLES = _freeze(FRED_SERIES_CYCLES)
+
+
+# ========== DERIVED LOOKUPS (computed once at import) ==========
+
+def _group_by_category(indicators):
+    """Groups indicator dicts by their 'category' key into tuples, preserving order."""
+    by_category = {}
+    for indicator in indicators:
+        by_category.setdefault(indicator['category'], []).append(indicator)
+    return MappingProxyType({category: tuple(group) for category, group in by_category.items()})
+
+
+def iter_priority(priority_categories, by_category=None):
+    """
+    Yields indicators category by category in priority order.
+
+    Categories missing from `by_category` are skipped; categories not listed
+    in `priority_categories` are left out.
+
+    Args:
+        priority_categories (tuple): Category names, highest priority first
+                                     (e.g., KOREA_PRIORITY_CATEGORIES)
+        by_category (Mapping, optional): Category -> indicators buckets
+                                         (default: FRED_INDICATORS_BY_CATEGORY)
+
+    Yields:
+        Mapping: Indicator entries
+    """
+    if by_category is None:
+        by_category = FRED_INDICATORS_BY_CATEGORY
+    for category in priority_categories:
+        yield from by_category.get(category, ())
+
+
+def _order_by_priority(by_category, priority_categories):
+    """Flattens grouped indicators in category priority order."""
+    return tuple(iter_priority(priority_categories, by_category))
+
+
+FRED_INDICATORS_BY_CATEGORY = _group_by_category(FRED_INDICATORS)
+GLOBAL_FRED_INDICATORS_BY_CATEGORY = _group_by_category(GLOBAL_FRED_INDICATORS)
+
+# (country code, display name) pairs in each priority order
+KOREA_COUNTRY_PAIRS = tuple((code, COUNTRY_CODES.get(code, code)) for code in KOREA_PRIORITY_COUNTRIES)
+US_COUNTRY_PAIRS = tuple((code, COUNTRY_CODES.get(code, code)) for code in US_PRIORITY_COUNTRIES)
+
+
+# Sector ETFs tracked by the policy tool: symbol -> sector name
+SECTOR_ETFS = POLICY_ENVIRONMENT_CONFIG['section_3_sector_impact']['etfs']
+SECTOR_ETF_BY_SYMBOL = MappingProxyType({etf['symbol']: etf['name'] for etf in SECTOR_ETFS})
+
+
+# ========== TYPED INDICATOR ROWS ==========
+
+@dataclass(frozen=True, slots=True)
+class FredIndicator:
+    """One FRED-sourced FRED_INDICATORS entry as a fixed-field row."""
+    category: str
+    name: str
+    series_id: str
+    description: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class EcosIndicator:
+    """One ECOS-sourced FRED_INDICATORS entry (Bank of Korea statistic) as a fixed-field row."""
+    category: str
+    name: str
+    source: str
+    stat_code: str
+    item_code: str
+    cycle: str
+    description: str = ""
+
+
+def _indicator_row(entry):
+    """
+    Converts a FRED_INDICATORS entry to its typed row (the 'source' key picks
+    the variant). Raises TypeError on missing or unexpected keys, so a
+    malformed entry fails at import instead of at fetch time.
+    """
+    if entry.get('source', 'FRED') == 'ECOS':
+        return EcosIndicator(**entry)
+    return FredIndicator(**entry)
+
+
+# FRED_INDICATORS as typed rows, in config order; consumers dispatch on
+# isinstance(row, EcosIndicator) instead of probing dict keys
+FRED_INDICATOR_ROWS = tuple(_indicator_row(indicator) for indicator in FRED_INDICATORS)
+FRED_INDICATOR_ROWS_BY_CATEGORY = MappingProxyType({
+    category: tuple(row for row in FRED_INDICATOR_ROWS if row.category == category)
+    for category in FRED_INDICATORS_BY_CATEGORY
+})
+
+
+# FRED_INDICATORS rows flattened in each priority order (Korean vs US stocks)
+KOREA_ORDERED_FRED_INDICATORS = _order_by_priority(FRED_INDICATOR_ROWS_BY_CATEGORY, KOREA_PRIORITY_CATEGORIES)
+US_ORDERED_FRED_INDICATORS = _order_by_priority(FRED_INDICATOR_ROWS_BY_CATEGORY, US_PRIORITY_CATEGORIES)
+_ORDERED_FRED_INDICATORS_BY_REGION = MappingProxyType({
+    'KR': KOREA_ORDERED_FRED_INDICATORS,
+    'US': US_ORDERED_FRED_INDICATORS,
+})
+
+
+def get_ordered(region):
+    """
+    Returns FRED_INDICATORS in a market's category priority order (precomputed).
+
+    Args:
+        region (str): 'KR' (Korean stocks) or 'US' (region codes as in MARKET_INDICES)
+
+    Returns:
+        tuple: FredIndicator / EcosIndicator rows, highest-priority category first
+
+    Raises:
+        KeyError: If region is not 'KR' or 'US'
+    """
+    return _ORDERED_FRED_INDICATORS_BY_REGION[region]
+
+
+# ========== ECONOMIC CYCLE EXECUTION PLAN ==========
+
+@dataclass(frozen=True)
+class IndicatorPlan:
+    """
+    One economic-cycle indicator with its fetch/format kind resolved up front.
+
+    kind is one of: 'fred', 'yfinance', 'ratio', 'ecos', 'ecos_aggregated',
+    'ecos_timeseries', 'ecos_multi'.
+    """
+    kind: str
+    name: str
+    symbol: Optional[str]        # Series ID / ticker shown in the report, if any
+    failure_label: str           # Entry added to failed_sources on failure
+    fmt: Optional[str]           # Value format spec from the config, if any
+    config: Mapping[str, Any]    # Original config entry (fetch arguments)
+
+
+@dataclass(frozen=True)
+class GroupPlan:
+    """An ECONOMIC_CYCLE_CONFIG group: letter ('A'...), header and indicators in report order."""
+    letter: str
+    display_name: str
+    indicators: Tuple[IndicatorPlan, ...]
+
+
+def _indicator_kind(ind):
+    if ind.get('type') == 'composite_ratio':
+        return 'ratio'
+    if ind.get('source') == 'yfinance':
+        return 'yfinance'
+    return 'fred'
+
+
+def _ecos_kind(config):
+    if config.get('multi_item', False):
+        return 'ecos_multi'
+    if config.get('aggregation_required', False):
+        return 'ecos_aggregated'
+    if 'data_points' in config:
+        return 'ecos_timeseries'
+    return 'ecos'
+
+
+def build_execution_plan(config=ECONOMIC_CYCLE_CONFIG):
+    """
+    Flattens the economic cycle config into group plans (market/FRED indicators
+    first, then ECOS indicators, as in the report).
+
+    Returns:
+        tuple: GroupPlan per group, in config order
+    """
+    groups = []
+    for group in config.values():
+        indicators = [
+            IndicatorPlan(
+                kind=_indicator_kind(ind),
+                name=ind['name'],
+                symbol=ind.get('series_id', ind.get('symbol')),
+                failure_label=ind['name'],
+                fmt=ind.get('fmt'),
+                config=ind
+            )
+            for ind in group['indicators']
+        ]
+        indicators.extend(
+            IndicatorPlan(
+                kind=_ecos_kind(ecos_config),
+                name=ecos_config['name'],
+                symbol=None,
+                failure_label=f"{ecos_config['name']} (ECOS)",
+                fmt=ecos_config.get('fmt'),
+                config=ecos_config
+            )
+            for ecos_config in group.get('ecos_indicators', {}).values()
+        )
+        groups.append(GroupPlan(
+            letter=group['display_name'].split('.', 1)[0],
+            display_name=group['display_name'],
+            indicators=tuple(indicators)
+        ))
+    return tuple(groups)
+
+
+ECONOMIC_CYCLE_PLAN = build_execution_plan()
+
+
+__all__ = [
+    # Configuration tables
+    'FRED_INDICATORS',
+    'KOREA_PRIORITY_CATEGORIES',
+    'US_PRIORITY_CATEGORIES',
+    'WORLD_BANK_INDICATORS',
+    'GLOBAL_FRED_INDICATORS',
+    'MARKET_INDICES',
+    'COUNTRY_CODES',
+    'KOREA_PRIORITY_COUNTRIES',
+    'US_PRIORITY_COUNTRIES',
+    'POLICY_ENVIRONMENT_CONFIG',
+    'ECONOMIC_CYCLE_CONFIG',
+    'FRED_SERIES_CYCLES',
+    # Derived lookups
+    'FRED_INDICATORS_BY_CATEGORY',
+    'GLOBAL_FRED_INDICATORS_BY_CATEGORY',
+    'KOREA_ORDERED_FRED_INDICATORS',
+    'US_ORDERED_FRED_INDICATORS',
+    'KOREA_COUNTRY_PAIRS',
+    'US_COUNTRY_PAIRS',
+    'SECTOR_ETFS',
+    'SECTOR_ETF_BY_SYMBOL',
+    'FRED_INDICATOR_ROWS',
+    'FRED_INDICATOR_ROWS_BY_CATEGORY',
+    'ECONOMIC_CYCLE_PLAN',
+    # Accessors and types
+    'iter_priority',
+    'get_ordered',
+    'FredIndicator',
+    'EcosIndicator',
+    'IndicatorPlan',
+    'GroupPlan',
+    'build_execution_plan',
+]
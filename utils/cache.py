@@ -0,0 +1,248 @@
+"""
+TTL response cache for external data fetchers.
+
+Caches return values in memory and (optionally) on disk so repeated tool calls
+for the same inputs within the TTL skip the network entirely. Entries persist
+across processes under JOOKKOOMI_CACHE_DIR (default: ~/.jookkoomi_cache).
+
+Fetchers in this project return None on failure, so:
+- None results are never cached
+- If a fetch returns None and an expired entry exists, the stale value is
+  served instead (stale-on-error fallback)
+
+Also provides single_flight() to coalesce concurrent identical calls.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+CACHE_DIR = Path(os.getenv("JOOKKOOMI_CACHE_DIR", "~/.jookkoomi_cache")).expanduser()
+
+_MISSING = object()
+
+# Hit/miss counters per namespace, e.g. {"fmp_analyst_estimates": {"hit": 3, ...}}
+_stats: Dict[str, Dict[str, int]] = {}
+_stats_lock = threading.Lock()
+
+
+def _record(namespace: str, event: str):
+    with _stats_lock:
+        counters = _stats.setdefault(namespace, {"hit": 0, "miss": 0, "stale": 0})
+        counters[event] += 1
+
+
+def cache_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Returns a snapshot of cache hit/miss/stale counters per namespace.
+
+    Returns:
+        dict: {namespace: {"hit": int, "miss": int, "stale": int}}
+    """
+    with _stats_lock:
+        return {namespace: dict(counters) for namespace, counters in _stats.items()}
+
+
+class TTLCache:
+    """
+    Thread-safe key/value cache with per-entry timestamps.
+
+    Entries are kept in memory and, if persist=True, pickled to
+    CACHE_DIR/<namespace>/<sha1(key)>.pkl so other processes can reuse them.
+    """
+
+    def __init__(self, namespace: str, ttl: Optional[float], persist: bool = True):
+        """
+        Args:
+            namespace: Cache name (also the on-disk subdirectory)
+            ttl: Default time-to-live in seconds (None: must be passed to get())
+            persist: Whether to store entries on disk as well as in memory
+        """
+        self.namespace = namespace
+        self.ttl = ttl
+        self.persist = persist
+        self._memory: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return CACHE_DIR / self.namespace / f"{digest}.pkl"
+
+    def _load(self, key: str) -> Optional[Tuple[float, Any]]:
+        """Returns (stored_at, value) from memory or disk, regardless of age."""
+        with self._lock:
+            entry = self._memory.get(key)
+        if entry is not None or not self.persist:
+            return entry
+
+        try:
+            with open(self._path(key), "rb") as f:
+                entry = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+        with self._lock:
+            self._memory[key] = entry
+        return entry
+
+    def get(self, key: str, allow_stale: bool = False, ttl: Optional[float] = None) -> Any:
+        """
+        Returns the cached value, or _MISSING if absent (or expired, unless
+        allow_stale is True). `ttl` overrides the cache's default TTL.
+        """
+        entry = self._load(key)
+        if entry is None:
+            return _MISSING
+        stored_at, value = entry
+        max_age = self.ttl if ttl is None else ttl
+        if not allow_stale and time.time() - stored_at > max_age:
+            return _MISSING
+        return value
+
+    def set(self, key: str, value: Any):
+        """Stores value under key (memory + disk). Disk errors are non-fatal."""
+        entry = (time.time(), value)
+        with self._lock:
+            self._memory[key] = entry
+        if not self.persist:
+            return
+
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(temp_path, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            temp_path.replace(path)
+        except (OSError, pickle.PicklingError) as e:
+            print(f"[Cache] Failed to persist {self.namespace} entry: {e}")
+
+    def clear(self):
+        """Drops all in-memory entries (on-disk entries are left to expire)."""
+        with self._lock:
+            self._memory.clear()
+
+
+def ttl_cache(
+    namespace: str,
+    ttl: Union[float, Callable[..., float]],
+    persist: bool = True,
+    key_func: Optional[Callable[..., str]] = None
+) -> Callable:
+    """
+    Decorator that caches a fetcher's non-None results for `ttl` seconds.
+
+    Args:
+        namespace: Cache name used for stats and the on-disk subdirectory
+        ttl: Time-to-live in seconds, or a function of the call arguments
+            returning one (e.g. a TTL that depends on data frequency)
+        persist: Whether to also cache on disk (shared across processes)
+        key_func: Optional function building the cache key from the call
+            arguments (default: repr of args and kwargs)
+
+    Returns:
+        Decorator; the wrapped function exposes the cache as `.cache` and
+        accepts an extra `force_refresh=True` keyword argument that skips the
+        cache lookup (the fresh result still replaces the cached entry).
+
+    Example:
+        >>> @ttl_cache("fmp_analyst_estimates", ttl=24 * 3600)
+        ... def fetch_estimates(ticker: str) -> dict | None:
+        ...     ...
+        >>> fetch_estimates("AAPL", force_refresh=True)  # Bypass the cache
+    """
+    def decorator(func: Callable) -> Callable:
+        cache = TTLCache(namespace, None if callable(ttl) else ttl, persist=persist)
+
+        @functools.wraps(func)
+        def wrapper(*args, force_refresh=False, **kwargs):
+            if key_func is not None:
+                key = key_func(*args, **kwargs)
+            else:
+                key = repr((args, sorted(kwargs.items())))
+
+            if not force_refresh:
+                entry_ttl = ttl(*args, **kwargs) if callable(ttl) else None
+                value = cache.get(key, ttl=entry_ttl)
+                if value is not _MISSING:
+                    _record(namespace, "hit")
+                    return value
+
+            _record(namespace, "miss")
+            value = func(*args, **kwargs)
+            if value is not None:
+                cache.set(key, value)
+                return value
+
+            # Fetch failed: fall back to the last known value if we have one
+            stale = cache.get(key, allow_stale=True)
+            if stale is not _MISSING:
+                _record(namespace, "stale")
+                print(f"[Cache] {namespace}: fetch failed, serving stale value")
+                return stale
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+def single_flight(key_func: Optional[Callable[..., Any]] = None) -> Callable:
+    """
+    Decorator that coalesces concurrent calls with the same key.
+
+    The first caller runs the function; callers arriving while it is still
+    running wait for and share its result (or exception) instead of
+    repeating the work. Nothing is cached once the call completes.
+
+    Args:
+        key_func: Optional function building the dedup key from the call
+            arguments (default: repr of args and kwargs)
+
+    Example:
+        >>> @single_flight(key_func=lambda ticker: ticker.upper())
+        ... def build_report(ticker: str) -> str:
+        ...     ...
+    """
+    def decorator(func: Callable) -> Callable:
+        inflight: Dict[Any, Future] = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if key_func is not None:
+                key = key_func(*args, **kwargs)
+            else:
+                key = repr((args, sorted(kwargs.items())))
+
+            with lock:
+                future = inflight.get(key)
+                is_leader = future is None
+                if is_leader:
+                    future = Future()
+                    inflight[key] = future
+
+            if not is_leader:
+                return future.result()
+
+            try:
+                result = func(*args, **kwargs)
+                future.set_result(result)
+                return result
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            finally:
+                with lock:
+                    inflight.pop(key, None)
+
+        return wrapper
+
+    return decorator
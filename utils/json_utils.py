@@ -0,0 +1,33 @@
+"""
+Fast JSON decoding for API responses.
+
+Uses orjson when installed (noticeably faster on float-heavy payloads such as
+FMP/FRED/ECOS responses) and falls back to the standard library otherwise.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """
+    Decodes a JSON document (e.g. `response.content`).
+
+    Args:
+        data: Raw JSON bytes or text
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        ValueError: If the payload is not valid JSON (both orjson and json
+            decode errors are ValueError subclasses)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)